@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import array
 import atexit
 import functools
+import itertools
+import multiprocessing
 import os
 import time
 import subprocess
 import threading
 import types
 import glob
+import io
 import shlex
 import socket
+import struct
 import uuid
 from urllib.parse import urlparse
 from pathlib import Path
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.schedulers.base import (
     SchedulerAlreadyRunningError,
@@ -20,16 +26,22 @@ from apscheduler.schedulers.base import (
 )
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 import sqlite3
 import tempfile
 import calendar
 import fnmatch
 import math
 import logging
+import logging.handlers
+import queue
 import shutil
 from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, asdict, is_dataclass
 from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from flask import (
     Flask,
     render_template,
@@ -40,6 +52,9 @@ from flask import (
     has_request_context,
     g,
     current_app,
+    send_file,
+    make_response,
+    session,
 )
 from flask_login import (
     LoginManager,
@@ -50,10 +65,16 @@ from flask_login import (
     current_user,
 )
 from flask_wtf import CSRFProtect
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 
+try:  # pragma: no cover - nur unter Unix verfügbar
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +87,40 @@ except ImportError:  # pragma: no cover - Verhalten wird in Tests geprüft
 else:
     GPIO_AVAILABLE = True
 
+try:  # pragma: no cover - optionale Abhängigkeit
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # pragma: no cover - Fallback auf Werkzeug-Hashes
+    PasswordHasher = None  # type: ignore[assignment]
+    ARGON2_AVAILABLE = False
+else:
+    ARGON2_AVAILABLE = True
+
+try:  # pragma: no cover - optionale Abhängigkeit (python3-dbus)
+    import dbus
+except ImportError:  # pragma: no cover - Fallback auf bluetoothctl
+    dbus = None  # type: ignore[assignment]
+    DBUS_AVAILABLE = False
+else:
+    DBUS_AVAILABLE = True
+
+try:  # pragma: no cover - optionale Abhängigkeit (libpulse-Bindings)
+    import pulsectl
+except (ImportError, OSError):  # pragma: no cover - Fallback auf pactl (auch ohne libpulse)
+    pulsectl = None  # type: ignore[assignment]
+    PULSECTL_AVAILABLE = False
+else:
+    PULSECTL_AVAILABLE = True
+
+try:  # pragma: no cover - optionale Abhängigkeit
+    import pygit2
+except ImportError:  # pragma: no cover - Fallback auf git-CLI
+    pygit2 = None  # type: ignore[assignment]
+    PYGIT2_AVAILABLE = False
+else:
+    PYGIT2_AVAILABLE = True
+
+
 class _PygameUnavailableError(Exception):
     """Platzhalter, wenn pygame nicht verfügbar ist."""
 
@@ -417,6 +472,19 @@ def is_sudo_disabled() -> bool:
     return _SUDO_DISABLED
 
 
+# ``-n``: niemals nach einem Passwort fragen. Ohne NOPASSWD-Regel schlägt
+# der Aufruf sofort fehl, statt an der PAM-Abfrage zu hängen.
+_SUDO_PREFIX: Tuple[str, ...] = ("sudo", "-n")
+
+
+def _sudo_prefix_length(command: Sequence[str]) -> int:
+    if not command or command[0] != "sudo":
+        return 0
+    if len(command) > 1 and command[1] == "-n":
+        return 2
+    return 1
+
+
 def _strip_sudo_from_command(command):
     if command is None:
         return command
@@ -424,15 +492,15 @@ def _strip_sudo_from_command(command):
     if isinstance(command, (list, tuple)):
         if not command:
             return []
-        if command[0] == "sudo":
-            return list(command[1:])
-        return list(command)
+        return list(command[_sudo_prefix_length(command):])
 
     if isinstance(command, str):
         stripped = command.lstrip()
+        if stripped.startswith("sudo -n "):
+            return stripped[8:]
         if stripped.startswith("sudo "):
             return stripped[5:]
-        if stripped == "sudo":
+        if stripped in {"sudo", "sudo -n"}:
             return ""
         return command
 
@@ -445,7 +513,7 @@ def _build_privileged_command(parts: Iterable[str]) -> List[str]:
         return command
     if _SUDO_DISABLED:
         return command
-    return ["sudo", *command]
+    return [*_SUDO_PREFIX, *command]
 
 
 def privileged_command(*parts: str) -> List[str]:
@@ -560,6 +628,7 @@ refresh_subprocess_wrapper_state()
 
 from pydub import AudioSegment
 from pydub.exceptions import CouldntDecodeError
+from audio_decode import normalize_to_wav
 try:  # pragma: no cover - Import wird separat getestet
     import smbus
 except ImportError:  # pragma: no cover - Verhalten wird in Tests geprüft
@@ -599,6 +668,8 @@ except ImportError:  # pragma: no cover - Verhalten wird in Tests geprüft
 else:
     SMBUS_AVAILABLE = True
 import sys
+import hashlib
+import hmac
 import secrets
 import re
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Literal, Set
@@ -666,9 +737,44 @@ def enforce_initial_password_change():
 
     return redirect(url_for("change_password"))
 
+
+# Templates ändern sich nur mit einem Update (danach wird der Dienst neu
+# gestartet): keine mtime-Prüfung pro Render, kompilierte Templates werden
+# zwischen Neustarts per Bytecode-Cache wiederverwendet.
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+app.jinja_env.auto_reload = False
+JINJA_BYTECODE_CACHE_DIR = os.environ.get(
+    "AUDIO_PI_JINJA_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jinja_cache"),
+).strip()
+
+
+def _configure_template_cache() -> None:
+    if not JINJA_BYTECODE_CACHE_DIR:
+        return
+    try:
+        os.makedirs(JINJA_BYTECODE_CACHE_DIR, exist_ok=True)
+    except OSError as exc:
+        _logger.warning(
+            "Jinja-Bytecode-Cache %s nicht nutzbar: %s", JINJA_BYTECODE_CACHE_DIR, exc
+        )
+        return
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_BYTECODE_CACHE_DIR)
+    for template_name in app.jinja_env.list_templates(extensions=["html"]):
+        try:
+            app.jinja_env.get_template(template_name)
+        except Exception:
+            _logger.warning(
+                "Template %s konnte nicht vorab geladen werden", template_name, exc_info=True
+            )
+
+
+_configure_template_cache()
+
 # Konfiguration
 UPLOAD_FOLDER = "uploads"
 ALLOWED_EXTENSIONS = {"wav", "mp3"}
+_ALLOWED_SUFFIXES = tuple(f".{extension}" for extension in sorted(ALLOWED_EXTENSIONS))
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
@@ -939,11 +1045,36 @@ def build_index_url(**kwargs):
     return url_for("index", **params)
 
 # Logging
-logging.basicConfig(
-    filename="app.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+def _configure_logging() -> Optional[logging.handlers.QueueListener]:
+    """Richtet das Datei-Logging über eine Queue ein.
+
+    Request-Threads reihen Einträge nur ein; geschrieben wird im Thread des
+    ``QueueListener``, damit langsame SD-Karten keine Antwort verzögern. Wie
+    ``logging.basicConfig`` bleibt ein bereits konfigurierter Root-Logger
+    unverändert. Die Rotation übernimmt weiterhin logrotate (copytruncate).
+    """
+
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return None
+    file_handler = logging.FileHandler("app.log")
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+    listener.start()
+    # Beim Prozessende ausstehende Einträge noch in die Datei schreiben.
+    atexit.register(listener.stop)
+    return listener
+
+
+_log_queue_listener = _configure_logging()
 gpio_handle: Optional[int] = None
 gpio_chip_id: Optional[int] = None
 
@@ -1002,10 +1133,17 @@ else:
         )
     gpio_handle = None
     gpio_chip_id = None
+# Logischer Zustand der Endstufe (an/aus)
 amplifier_claimed = False
+# Pin der Endstufen-Leitung, die dauerhaft per gpio_claim_output belegt ist
+amplifier_line_pin: Optional[int] = None
 
-# Track pause status manually since pygame lacks a get_paused() helper
-is_paused = False
+# Track pause status manually since pygame lacks a get_paused() helper.
+# Ein Event statt eines bool-Globals, damit parallele Requests und der
+# Wiedergabe-Thread den Zustand konsistent lesen und setzen.
+_playback_paused = threading.Event()
+# Serialisiert Prüfen und Umschalten in toggle_pause.
+_pause_toggle_lock = threading.Lock()
 
 
 # Globale Statusinformationen für Audiofunktionen
@@ -1013,10 +1151,34 @@ audio_status = {"dac_sink_detected": None}
 
 pygame_available = TESTING and pygame_imported
 
+# Vorkompilierte Muster/Formate für häufig aufgerufene Parser
+_VOL_RE = re.compile(r"(\d+)%")
+_TIME_FORMAT = "%H:%M:%S"
+# Entspricht datetime.strptime(value, _TIME_FORMAT): ein- oder zweistellige
+# Felder, Stunden 0-23, Minuten und Sekunden 0-59.
+_TIME_PATTERN = re.compile(r"(?:2[0-3]|[0-1]\d|\d):(?:[0-5]\d|\d):(?:[0-5]\d|\d)")
+_DATE_FORMAT = "%Y-%m-%d"
+_ONCE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M")
+_AUTO_REBOOT_TIME_FORMATS = ("%H:%M", "%H:%M:%S")
+
+# Eigenes SDL-Ereignis für das Ende eines Musikstücks; None, solange die
+# Ereignis-Queue nicht initialisiert werden konnte (Fallback auf Polling).
+MUSIC_END_EVENT: Optional[int] = None
+
 
 def load_initial_volume():
-    output = subprocess.getoutput("pactl get-sink-volume @DEFAULT_SINK@")
-    match = re.search(r"(\d+)%", output)
+    # Direkter Aufruf ohne /bin/sh; _run_pactl_command ist hier noch nicht definiert.
+    try:
+        result = subprocess.run(
+            ["pactl", "get-sink-volume", "@DEFAULT_SINK@"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError as exc:
+        logging.warning("Initiale Lautstärke konnte nicht gelesen werden: %s", exc)
+        return
+    match = _VOL_RE.search(result.stdout or "")
     if match:
         initial_vol = int(match.group(1))
         pygame.mixer.music.set_volume(initial_vol / 100.0)
@@ -1029,23 +1191,64 @@ AUDIO_UNAVAILABLE_MESSAGE = (
 )
 
 
-def _notify_audio_unavailable(action: str) -> None:
-    message = f"{action}: {AUDIO_UNAVAILABLE_MESSAGE}" if action else AUDIO_UNAVAILABLE_MESSAGE
-    logging.warning(message)
+# Meldungen aus Threads ohne Request-Kontext (Wiedergabe über play_now,
+# Scheduler) zeigt der nächste Request eines angemeldeten Nutzers an.
+_PENDING_USER_MESSAGES_LIMIT = 20
+_pending_user_messages: "deque[str]" = deque(maxlen=_PENDING_USER_MESSAGES_LIMIT)
+_pending_user_messages_lock = threading.Lock()
+
+
+def _notify_user(message: str) -> None:
+    """Zeigt ``message`` per flash an oder merkt sie für den nächsten Request vor."""
+
     if has_request_context():
         try:
             flash(message)
         except Exception:
-            logging.debug(
-                "Konnte Flash-Nachricht für nicht verfügbare Audio-Funktion nicht senden.",
-                exc_info=True,
-            )
+            logging.debug("Konnte Flash-Nachricht nicht senden.", exc_info=True)
+        return
+    with _pending_user_messages_lock:
+        if message not in _pending_user_messages:
+            _pending_user_messages.append(message)
+
+
+@app.before_request
+def deliver_pending_user_messages():
+    if not _pending_user_messages or not current_user.is_authenticated:
+        return None
+    endpoint = request.endpoint or ""
+    if endpoint.startswith("static"):
+        return None
+    with _pending_user_messages_lock:
+        messages = list(_pending_user_messages)
+        _pending_user_messages.clear()
+    for message in messages:
+        flash(message)
+    return None
+
+
+def _notify_audio_unavailable(action: str) -> None:
+    message = f"{action}: {AUDIO_UNAVAILABLE_MESSAGE}" if action else AUDIO_UNAVAILABLE_MESSAGE
+    logging.warning(message)
+    _notify_user(message)
 
 
+# Größerer SDL-Puffer (~93 ms bei 44,1 kHz) verhindert Aussetzer, wenn
+# Scheduler, Normalisierung und Bluetooth-Monitor die CPU auslasten.
+MIXER_FREQUENCY = 44100
+MIXER_SAMPLE_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER_SAMPLES = 4096
+
 # Pygame Audio und Lautstärke nur initialisieren, wenn nicht im Test
 if not TESTING and pygame_imported:
     try:
-        pygame.mixer.init()
+        pygame.mixer.init(
+            frequency=MIXER_FREQUENCY,
+            size=MIXER_SAMPLE_SIZE,
+            channels=MIXER_CHANNELS,
+            buffer=MIXER_BUFFER_SAMPLES,
+        )
     except pygame_error as exc:
         pygame_available = False
         logging.warning(
@@ -1056,6 +1259,33 @@ if not TESTING and pygame_imported:
         pygame_available = True
         load_initial_volume()
 
+
+def _enable_music_end_event() -> bool:
+    """Aktiviert das pygame-Endereignis, damit Wiedergabe-Waits blockieren statt zu pollen."""
+
+    global MUSIC_END_EVENT
+    if not pygame_available:
+        return False
+    try:
+        # Die SDL-Ereignis-Queue benötigt ein Video-Subsystem; headless genügt der Dummy-Treiber.
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        if not pygame.display.get_init():
+            pygame.display.init()
+        end_event = pygame.USEREVENT + 1
+        pygame.mixer.music.set_endevent(end_event)
+    except Exception as exc:
+        logging.info(
+            "pygame-Endereignis nicht verfügbar, Wiedergabeende wird gepollt: %s", exc
+        )
+        MUSIC_END_EVENT = None
+        return False
+    MUSIC_END_EVENT = end_event
+    return True
+
+
+_enable_music_end_event()
+
+
 # RTC (Echtzeituhr) Setup
 class RTCUnavailableError(Exception):
     """RTC I²C-Bus konnte nicht initialisiert werden."""
@@ -1326,11 +1556,21 @@ else:
 refresh_rtc_detection()
 
 
+# Vorberechnete Tabellen für die BCD-Konvertierung der RTC-Register: ein
+# Indexzugriff pro Byte statt Schiebe-/Divisionsarithmetik in Python.
+_BCD_TO_DEC = bytes(((i >> 4) * 10 + (i & 0x0F)) & 0xFF for i in range(256))
+_DEC_TO_BCD = bytes((((i // 10) << 4) | (i % 10)) & 0xFF for i in range(100))
+
+
 def bcd_to_dec(val):
+    if 0 <= val < 256:
+        return _BCD_TO_DEC[val]
     return ((val >> 4) * 10) + (val & 0x0F)
 
 
 def dec_to_bcd(val):
+    if 0 <= val < 100:
+        return _DEC_TO_BCD[val]
     return ((val // 10) << 4) | (val % 10)
 
 
@@ -1497,35 +1737,35 @@ def read_rtc():
     rtc_type = _determine_rtc_type(address)
     if rtc_type == "pcf8563":
         data = bus.read_i2c_block_data(address, 0x02, 7)
-        second = bcd_to_dec(data[0] & 0x7F)
-        minute = bcd_to_dec(data[1] & 0x7F)
-        hour = bcd_to_dec(data[2] & 0x3F)
-        day = bcd_to_dec(data[3] & 0x3F)
+        second = _BCD_TO_DEC[data[0] & 0x7F]
+        minute = _BCD_TO_DEC[data[1] & 0x7F]
+        hour = _BCD_TO_DEC[data[2] & 0x3F]
+        day = _BCD_TO_DEC[data[3] & 0x3F]
         weekday_raw = data[4] & 0x07
-        month = bcd_to_dec(data[5] & 0x1F)
-        year_offset = bcd_to_dec(data[6])
+        month = _BCD_TO_DEC[data[5] & 0x1F]
+        year_offset = _BCD_TO_DEC[data[6] & 0xFF]
         century_offset = 2000
     elif rtc_type == "pcf85063":
         data = bus.read_i2c_block_data(address, 0x04, 7)
-        second = bcd_to_dec(data[0] & 0x7F)
-        minute = bcd_to_dec(data[1] & 0x7F)
-        hour = bcd_to_dec(data[2] & 0x3F)
-        day = bcd_to_dec(data[3] & 0x3F)
+        second = _BCD_TO_DEC[data[0] & 0x7F]
+        minute = _BCD_TO_DEC[data[1] & 0x7F]
+        hour = _BCD_TO_DEC[data[2] & 0x3F]
+        day = _BCD_TO_DEC[data[3] & 0x3F]
         weekday_raw = data[4] & 0x07
-        month = bcd_to_dec(data[5] & 0x1F)
-        year_offset = bcd_to_dec(data[6])
+        month = _BCD_TO_DEC[data[5] & 0x1F]
+        year_offset = _BCD_TO_DEC[data[6] & 0xFF]
         century_offset = 2000
     elif rtc_type in {"ds1307", "ds3231"}:
         data = bus.read_i2c_block_data(address, 0x00, 7)
-        second = bcd_to_dec(data[0] & 0x7F)
-        minute = bcd_to_dec(data[1] & 0x7F)
-        hour = bcd_to_dec(data[2] & 0x3F)
+        second = _BCD_TO_DEC[data[0] & 0x7F]
+        minute = _BCD_TO_DEC[data[1] & 0x7F]
+        hour = _BCD_TO_DEC[data[2] & 0x3F]
         weekday_raw = data[3] & 0x07
-        day = bcd_to_dec(data[4] & 0x3F)
+        day = _BCD_TO_DEC[data[4] & 0x3F]
         month_raw = data[5]
-        month = bcd_to_dec(month_raw & 0x1F)
+        month = _BCD_TO_DEC[month_raw & 0x1F]
         century_offset = 2100 if rtc_type == "ds3231" and (month_raw & 0x80) else 2000
-        year_offset = bcd_to_dec(data[6])
+        year_offset = _BCD_TO_DEC[data[6] & 0xFF]
     else:  # pragma: no cover - abgesichert durch _determine_rtc_type
         raise UnsupportedRTCError(f"RTC-Typ '{rtc_type}' nicht unterstützt")
 
@@ -1602,24 +1842,24 @@ def set_rtc(dt):
 
     _persist_rtc_local_offset(local_dt.utcoffset())
 
-    second = dec_to_bcd(utc_dt.second)
-    minute = dec_to_bcd(utc_dt.minute)
-    hour = dec_to_bcd(utc_dt.hour)
-    date = dec_to_bcd(utc_dt.day)
+    second = _DEC_TO_BCD[utc_dt.second]
+    minute = _DEC_TO_BCD[utc_dt.minute]
+    hour = _DEC_TO_BCD[utc_dt.hour]
+    date = _DEC_TO_BCD[utc_dt.day]
     weekday_value = _python_weekday_to_rtc(utc_dt.weekday(), rtc_type)
     try:
         if rtc_type == "pcf8563":
-            month = dec_to_bcd(utc_dt.month)
+            month = _DEC_TO_BCD[utc_dt.month]
             year = dec_to_bcd(utc_dt.year - 2000)
             payload = [second, minute, hour, date, weekday_value, month, year]
             _write_rtc_block(0x02, payload)
         elif rtc_type == "pcf85063":
-            month = dec_to_bcd(utc_dt.month)
+            month = _DEC_TO_BCD[utc_dt.month]
             year = dec_to_bcd(utc_dt.year - 2000)
             payload = [second, minute, hour, date, weekday_value, month, year]
             _write_rtc_block(0x04, payload)
         elif rtc_type in {"ds1307", "ds3231"}:
-            month_value = dec_to_bcd(utc_dt.month)
+            month_value = _DEC_TO_BCD[utc_dt.month]
             year_value = utc_dt.year
             century_bit = 0
             if rtc_type == "ds3231" and year_value >= 2100:
@@ -1745,20 +1985,218 @@ def sync_rtc_to_system() -> bool:
     return True
 
 
+# Passwort-Hashing: Argon2id (argon2-cffi) mit Pi-tauglichen Parametern,
+# Werkzeug-Hashes bleiben lesbar und werden beim Login migriert.
+_ARGON2_HASH_PREFIX = "$argon2"
+_password_hasher = (
+    PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+    if ARGON2_AVAILABLE
+    else None
+)
+
+
+def hash_password(password: str) -> str:
+    if _password_hasher is not None:
+        return _password_hasher.hash(password)
+    return generate_password_hash(password)
+
+
+def verify_password(stored_hash: str, password: str) -> bool:
+    if stored_hash.startswith(_ARGON2_HASH_PREFIX):
+        if _password_hasher is None:
+            logging.error("Argon2-Passworthash gespeichert, aber argon2-cffi fehlt")
+            return False
+        try:
+            return _password_hasher.verify(stored_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(stored_hash, password)
+
+
+def password_needs_rehash(stored_hash: str) -> bool:
+    if _password_hasher is None:
+        return False
+    if not stored_hash.startswith(_ARGON2_HASH_PREFIX):
+        return True
+    return _password_hasher.check_needs_rehash(stored_hash)
+
+
+@functools.lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    return hash_password(secrets.token_urlsafe(16))
+
+
+def verify_password_or_dummy(stored_hash: Optional[str], password: str) -> bool:
+    """Prüft ``password``; fehlt der Hash, läuft die gleiche Prüfung gegen einen Dummy.
+
+    So kostet eine Anfrage für unbekannte Benutzer genauso viel Zeit wie
+    eine mit falschem Passwort und verrät nicht, ob der Benutzer existiert.
+    """
+
+    if not stored_hash:
+        verify_password(_dummy_password_hash(), password)
+        return False
+    return verify_password(stored_hash, password)
+
+
 # DB Setup
-from contextlib import contextmanager, nullcontext
+from contextlib import ExitStack, contextmanager, nullcontext
+
+
+SQLITE_BUSY_TIMEOUT_SECONDS = 5.0
+# Eine ruhende Verbindung je Gunicorn-Thread plus eine für Scheduler-Jobs,
+# damit auch unter Last keine Verbindungen geschlossen und neu geöffnet werden.
+SQLITE_POOL_SIZE = _resolve_positive_int_env("AUDIO_PI_GUNICORN_THREADS", 8) + 1
+_SQLITE_MAX_IN_PARAMETERS = 500
+SQLITE_CACHE_SIZE_KIB = 8000
+# Gepoolte Verbindungen leben lange; ihr Statement-Cache hält alle
+# wiederkehrenden Abfragen der Routen und Jobs kompiliert vor.
+SQLITE_CACHED_STATEMENTS = 256
+SQLITE_MMAP_SIZE_BYTES = 64 * 1024 * 1024
+# synchronous=NORMAL ist im WAL-Modus absturzsicher und spart das fsync pro
+# Commit. Der Seiten-Cache (negativer Wert = KiB) bleibt mit der gepoolten
+# Verbindung erhalten. journal_mode=WAL ist in der Datei gespeichert und wird
+# nur einmal in initialize_database() gesetzt.
+_SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KIB}",
+    "PRAGMA foreign_keys=ON",
+    f"PRAGMA mmap_size={SQLITE_MMAP_SIZE_BYTES}",
+)
+# Playlist-Einträge hängen per ON DELETE CASCADE an Datei und Playlist.
+# schedules verweist polymorph (item_type/item_id) und wird weiterhin
+# explizit bereinigt.
+_PLAYLIST_FILES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS playlist_files (
+        playlist_id INTEGER REFERENCES playlists(id) ON DELETE CASCADE,
+        file_id INTEGER REFERENCES audio_files(id) ON DELETE CASCADE,
+        position INTEGER DEFAULT 0
+    )
+"""
+
+
+class _SQLiteConnectionPool:
+    """Kleiner Pool wiederverwendbarer SQLite-Verbindungen.
+
+    ``acquire`` blockiert nie: ist der Pool leer, wird eine zusätzliche
+    Verbindung geöffnet, die ``release`` wieder schließt, wenn der Pool voll
+    ist. Ändert sich ``DB_FILE`` oder die Prozess-ID (Fork), wird der Bestand
+    verworfen.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._idle: List[sqlite3.Connection] = []
+        self._db_file: Optional[str] = None
+        self._pid = os.getpid()
+
+    def _connect(self, db_file: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            db_file,
+            check_same_thread=False,
+            timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+            cached_statements=SQLITE_CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in _SQLITE_CONNECTION_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.Error as exc:
+                logging.debug("SQLite-Pragma '%s' fehlgeschlagen: %s", pragma, exc)
+        return conn
+
+    def acquire(self) -> Tuple[sqlite3.Connection, str]:
+        db_file = DB_FILE
+        stale: List[sqlite3.Connection] = []
+        conn: Optional[sqlite3.Connection] = None
+        with self._lock:
+            if self._pid != os.getpid():
+                # Vom Elternprozess geerbte Handles nicht anfassen.
+                self._idle = []
+                self._pid = os.getpid()
+            if self._db_file != db_file:
+                stale, self._idle = self._idle, []
+                self._db_file = db_file
+            if self._idle:
+                conn = self._idle.pop()
+        for old_conn in stale:
+            old_conn.close()
+        if conn is None:
+            conn = self._connect(db_file)
+        return conn, db_file
+
+    def release(self, conn: sqlite3.Connection, db_file: str) -> None:
+        try:
+            if conn.in_transaction:
+                # Wie beim früheren close(): nicht committete Änderungen verwerfen.
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+        with self._lock:
+            if (
+                self._pid == os.getpid()
+                and self._db_file == db_file
+                and len(self._idle) < self._max_size
+            ):
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_db_pool = _SQLiteConnectionPool(SQLITE_POOL_SIZE)
+atexit.register(_db_pool.close_all)
 
 
 @contextmanager
 def get_db_connection():
-    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    conn, db_file = _db_pool.acquire()
     cursor = conn.cursor()
     try:
         yield conn, cursor
     finally:
         cursor.close()
-        conn.close()
+        _db_pool.release(conn, db_file)
+
+
+def _is_database_locked_error(exc: BaseException) -> bool:
+    return isinstance(exc, sqlite3.OperationalError) and (
+        "database is locked" in str(exc).lower()
+    )
+
+
+def run_write_transaction(callback: Callable[[Any, Any], Any]) -> Any:
+    """Führt ``callback(conn, cursor)`` in einer ``BEGIN IMMEDIATE``-Transaktion aus.
+
+    Die Schreibsperre wird direkt zu Beginn angefordert, sodass konkurrierende
+    Schreiber (Routen und Scheduler-Jobs) über das Busy-Timeout warten, statt
+    beim späteren Lock-Upgrade mit ``SQLITE_BUSY`` abzubrechen. Meldet SQLite
+    dennoch "database is locked", wird die Transaktion einmal wiederholt.
+    """
+
+    for attempt in range(2):
+        with get_db_connection() as (conn, cursor):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                result = callback(conn, cursor)
+                conn.commit()
+                return result
+            except Exception as exc:
+                conn.rollback()
+                if attempt == 0 and _is_database_locked_error(exc):
+                    logging.warning(
+                        "Datenbank gesperrt, Schreibtransaktion wird wiederholt"
+                    )
+                    continue
+                raise
 
 
 def _determine_initial_password_path() -> Path:
@@ -1816,8 +2254,119 @@ class HardwareButtonConfigEntry:
     enabled: bool
 
 
+SQLITE_AUTO_VACUUM_INCREMENTAL = 2
+SQLITE_INCREMENTAL_VACUUM_PAGES = 200
+
+
+def _enable_incremental_auto_vacuum(cursor) -> None:
+    """Aktiviert auto_vacuum=INCREMENTAL, damit gelöschte Seiten freigegeben werden.
+
+    Vor dem ersten CREATE TABLE genügt das Pragma; bestehende Datenbanken
+    werden einmalig per VACUUM umgestellt (außerhalb jeder Transaktion).
+    """
+
+    cursor.execute("PRAGMA auto_vacuum")
+    if cursor.fetchone()[0] == SQLITE_AUTO_VACUUM_INCREMENTAL:
+        return
+    cursor.execute(f"PRAGMA auto_vacuum={SQLITE_AUTO_VACUUM_INCREMENTAL}")
+    cursor.execute("PRAGMA auto_vacuum")
+    if cursor.fetchone()[0] == SQLITE_AUTO_VACUUM_INCREMENTAL:
+        return
+    logging.info("Stelle Datenbank einmalig auf inkrementelles auto_vacuum um")
+    cursor.execute("VACUUM")
+
+
+_DURATION_PROBE_TIMEOUT_SECONDS = 30
+_DURATION_PROBE_MAX_WORKERS = 4
+# Warnung von libavformat, wenn die Dauer nur aus der Bitrate hochgerechnet wird
+_FFPROBE_BITRATE_ESTIMATE_MARKER = "Estimating duration from bitrate"
+
+
+def _probe_audio_duration(file_path: str) -> Optional[float]:
+    """Ermittelt die Dauer in Sekunden, bevorzugt per ffprobe.
+
+    ffprobe liest nur die Container-Metadaten; erst wenn es fehlt, keine
+    Dauer liefert oder die Dauer nur aus der Bitrate schätzt (VBR-MP3 ohne
+    Xing-Header), wird die Datei wie bisher über pydub vollständig dekodiert.
+    """
+
+    ffprobe = _resolve_executable("ffprobe")
+    if ffprobe is not None:
+        try:
+            result = subprocess.run(
+                [
+                    ffprobe,
+                    "-v",
+                    "warning",
+                    "-show_entries",
+                    "format=duration",
+                    "-of",
+                    "csv=p=0",
+                    file_path,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=_DURATION_PROBE_TIMEOUT_SECONDS,
+            )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            logging.debug("ffprobe für %s fehlgeschlagen: %s", file_path, exc)
+        else:
+            if result.returncode == 0:
+                if _FFPROBE_BITRATE_ESTIMATE_MARKER in (result.stderr or ""):
+                    logging.debug(
+                        "ffprobe schätzt die Dauer von %s nur über die Bitrate; dekodiere vollständig",
+                        file_path,
+                    )
+                else:
+                    try:
+                        duration = float((result.stdout or "").strip())
+                    except ValueError:
+                        duration = None
+                    if duration is not None and math.isfinite(duration) and duration > 0:
+                        return duration
+    sound = AudioSegment.from_file(file_path)
+    return len(sound) / 1000.0
+
+
+def _probe_legacy_duration(row: Tuple[int, str]) -> Optional[Tuple[float, int]]:
+    file_id, filename = row
+    file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
+    if not os.path.exists(file_path):
+        return None
+    try:
+        duration = _probe_audio_duration(file_path)
+    except Exception as exc:
+        logging.warning(
+            "Konnte Dauer für bestehende Datei %s nicht bestimmen: %s",
+            filename,
+            exc,
+        )
+        return None
+    if duration is None:
+        return None
+    return duration, file_id
+
+
+def _enable_wal_journal(cursor) -> None:
+    """Schaltet die Datenbankdatei dauerhaft in den WAL-Modus.
+
+    Leser blockieren den Schreiber dann nicht mehr. Der Modus wird in der
+    Datei gespeichert, spätere Verbindungen übernehmen ihn ohne Pragma.
+    """
+
+    cursor.execute("PRAGMA journal_mode=WAL")
+    mode = cursor.fetchone()[0]
+    if str(mode).lower() != "wal":
+        logging.warning("SQLite-WAL-Modus nicht verfügbar, verwende Journal '%s'", mode)
+
+
 def initialize_database():
     with get_db_connection() as (conn, cursor):
+        _enable_incremental_auto_vacuum(cursor)
+        _enable_wal_journal(cursor)
+        # Schema und Migrationen in einer einzigen Transaktion: ein fsync statt
+        # einem pro DDL-Anweisung (synchronous setzt bereits der Pool).
+        cursor.execute("BEGIN")
         cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS users (
@@ -1850,30 +2399,30 @@ def initialize_database():
         audio_columns = {row[1] for row in cursor.fetchall()}
         if "duration_seconds" not in audio_columns:
             cursor.execute("ALTER TABLE audio_files ADD COLUMN duration_seconds REAL")
-            conn.commit()
         cursor.execute(
             "SELECT id, filename FROM audio_files WHERE duration_seconds IS NULL"
         )
-        rows_without_duration = cursor.fetchall()
-        for row in rows_without_duration:
-            file_id, filename = row[0], row[1]
-            file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-            duration = None
-            if os.path.exists(file_path):
-                try:
-                    sound = AudioSegment.from_file(file_path)
-                    duration = len(sound) / 1000.0
-                except Exception as exc:
-                    logging.warning(
-                        "Konnte Dauer für bestehende Datei %s nicht bestimmen: %s",
-                        filename,
-                        exc,
+        rows_without_duration = [(row[0], row[1]) for row in cursor.fetchall()]
+        duration_updates: List[Tuple[float, int]] = []
+        if rows_without_duration:
+            # Die Proben warten überwiegend auf ffprobe-Prozesse und laufen
+            # deshalb parallel.
+            with ThreadPoolExecutor(
+                max_workers=min(_DURATION_PROBE_MAX_WORKERS, len(rows_without_duration)),
+                thread_name_prefix="duration-probe",
+            ) as probe_pool:
+                duration_updates = [
+                    update
+                    for update in probe_pool.map(
+                        _probe_legacy_duration, rows_without_duration
                     )
-            if duration is not None:
-                cursor.execute(
-                    "UPDATE audio_files SET duration_seconds=? WHERE id=?",
-                    (duration, file_id),
-                )
+                    if update is not None
+                ]
+        if duration_updates:
+            cursor.executemany(
+                "UPDATE audio_files SET duration_seconds=? WHERE id=?",
+                duration_updates,
+            )
         cursor.execute(
             """CREATE TABLE IF NOT EXISTS schedules (
                 id INTEGER PRIMARY KEY,
@@ -1889,46 +2438,26 @@ def initialize_database():
                 volume_percent INTEGER DEFAULT 100
             )"""
         )
-        try:
-            cursor.execute("ALTER TABLE schedules ADD COLUMN executed INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass
         cursor.execute("PRAGMA table_info(schedules)")
         schedule_columns = {row[1] for row in cursor.fetchall()}
-        if "volume_percent" not in schedule_columns:
-            try:
-                cursor.execute(
-                    "ALTER TABLE schedules ADD COLUMN volume_percent INTEGER DEFAULT 100"
-                )
-            except sqlite3.OperationalError:
-                pass
-            else:
-                schedule_columns.add("volume_percent")
-        if "volume_percent" in schedule_columns:
-            cursor.execute(
-                "UPDATE schedules SET volume_percent = 100 WHERE volume_percent IS NULL"
-            )
         for column, column_type in (
+            ("executed", "INTEGER DEFAULT 0"),
+            ("volume_percent", "INTEGER DEFAULT 100"),
             ("start_date", "TEXT"),
             ("end_date", "TEXT"),
             ("day_of_month", "INTEGER"),
         ):
-            try:
-                cursor.execute(f"ALTER TABLE schedules ADD COLUMN {column} {column_type}")
-            except sqlite3.OperationalError:
-                pass
+            if column in schedule_columns:
+                continue
+            cursor.execute(f"ALTER TABLE schedules ADD COLUMN {column} {column_type}")
+            schedule_columns.add(column)
         cursor.execute(
-            """CREATE TABLE IF NOT EXISTS playlists (id INTEGER PRIMARY KEY, name TEXT)"""
+            "UPDATE schedules SET volume_percent = 100 WHERE volume_percent IS NULL"
         )
         cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS playlist_files (
-                playlist_id INTEGER,
-                file_id INTEGER,
-                position INTEGER DEFAULT 0
-            )
-            """
+            """CREATE TABLE IF NOT EXISTS playlists (id INTEGER PRIMARY KEY, name TEXT)"""
         )
+        cursor.execute(_PLAYLIST_FILES_TABLE_SQL)
         cursor.execute("PRAGMA table_info(playlist_files)")
         playlist_file_columns = {row[1] for row in cursor.fetchall()}
         if "position" not in playlist_file_columns:
@@ -1972,9 +2501,38 @@ def initialize_database():
             )
             """
         )
+        cursor.execute("PRAGMA foreign_key_list(playlist_files)")
+        if not cursor.fetchall():
+            # Ältere Datenbanken ohne Fremdschlüssel: Tabelle mit ON DELETE CASCADE
+            # neu anlegen; Zuordnungen zu gelöschten Dateien/Playlists entfallen.
+            cursor.execute("ALTER TABLE playlist_files RENAME TO playlist_files_legacy")
+            cursor.execute(_PLAYLIST_FILES_TABLE_SQL)
+            cursor.execute(
+                """
+                INSERT INTO playlist_files (playlist_id, file_id, position)
+                SELECT playlist_id, file_id, position
+                FROM playlist_files_legacy
+                WHERE playlist_id IN (SELECT id FROM playlists)
+                  AND file_id IN (SELECT id FROM audio_files)
+                ORDER BY rowid
+                """
+            )
+            cursor.execute("DROP TABLE playlist_files_legacy")
         cursor.execute(
             "CREATE UNIQUE INDEX IF NOT EXISTS idx_playlist_files_unique ON playlist_files (playlist_id, file_id)"
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_playlist_files_order ON playlist_files (playlist_id, position)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_playlist_files_file ON playlist_files (file_id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_schedules_executed_repeat ON schedules (executed, repeat)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_schedules_item ON schedules (item_id, item_type)"
+        )
         cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS hardware_buttons (
@@ -2034,7 +2592,7 @@ def initialize_database():
             if not initial_password:
                 initial_password = secrets.token_urlsafe(16)
                 generated_password = True
-            hashed_password = generate_password_hash(initial_password)
+            hashed_password = hash_password(initial_password)
             must_change_value = 1
             cursor.execute(
                 "INSERT INTO users (username, password, must_change_password) VALUES (?, ?, ?)",
@@ -2220,6 +2778,16 @@ load_hardware_button_config()
 
 if TESTING:
 
+    def _make_testing_delegate(resolver_name: str, method_name: str):
+        # Häufige Methoden direkt auf der Klasse definieren, damit nicht jeder
+        # Aufruf über __getattr__ aufgelöst werden muss.
+        def delegate(self, *args, **kwargs):
+            target = getattr(self, resolver_name)()
+            return getattr(target, method_name)(*args, **kwargs)
+
+        delegate.__name__ = method_name
+        return delegate
+
     class _TestingConnectionProxy:
         def __init__(self):
             self._storage = threading.local()
@@ -2270,6 +2838,20 @@ if TESTING:
                 self._storage.cursor = None
 
 
+    for _method_name in ("execute", "executemany", "commit", "rollback", "cursor"):
+        setattr(
+            _TestingConnectionProxy,
+            _method_name,
+            _make_testing_delegate("_get_connection", _method_name),
+        )
+    for _method_name in ("execute", "executemany", "fetchone", "fetchall", "fetchmany"):
+        setattr(
+            _TestingCursorProxy,
+            _method_name,
+            _make_testing_delegate("_get_cursor", _method_name),
+        )
+    del _method_name
+
     conn = _TestingConnectionProxy()
     cursor = _TestingCursorProxy(conn)
 else:
@@ -2277,15 +2859,56 @@ else:
     cursor = None
 
 # Scheduler
+_TIMEZONE_MONITOR_PATH = Path("/etc/localtime")
+_TIMEZONE_NAME_FILE = Path("/etc/timezone")
+
+
 def _current_local_time() -> datetime:
     return datetime.now().astimezone()
 
 
-LOCAL_TZ = _current_local_time().tzinfo
+def _system_zoneinfo() -> Optional[ZoneInfo]:
+    """Ermittelt die System-Zeitzone als benannte ``ZoneInfo``.
+
+    ``datetime.astimezone()`` liefert nur einen festen UTC-Offset, der nach
+    einem Sommer-/Winterzeitwechsel veraltet ist. Eine benannte Zone kennt die
+    Umstellungen selbst, sodass Scheduler und Umrechnungen korrekt bleiben.
+    """
+
+    name = os.environ.get("TZ", "").lstrip(":").strip()
+    if not name:
+        target = os.path.realpath(_TIMEZONE_MONITOR_PATH)
+        marker = "/zoneinfo/"
+        if marker in target:
+            name = target.split(marker, 1)[1]
+    if not name:
+        try:
+            name = _TIMEZONE_NAME_FILE.read_text(encoding="utf-8").strip()
+        except OSError:
+            name = ""
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        logging.debug("Zeitzone '%s' ist nicht in der tz-Datenbank vorhanden.", name)
+        return None
+
+
+def _detect_local_timezone():
+    """Liefert die lokale Zeitzone, bevorzugt als sommerzeitfähige ``ZoneInfo``."""
+
+    local_now = _current_local_time()
+    zone = _system_zoneinfo()
+    if zone is not None and datetime.now(zone).utcoffset() == local_now.utcoffset():
+        return zone
+    return local_now.tzinfo or timezone.utc
+
+
+LOCAL_TZ = _detect_local_timezone()
 scheduler = BackgroundScheduler(timezone=LOCAL_TZ)
 _BACKGROUND_SERVICES_LOCK = threading.RLock()
 _BACKGROUND_SERVICES_STARTED = False
-_TIMEZONE_MONITOR_PATH = Path("/etc/localtime")
 AUTO_REBOOT_JOB_ID = "auto_reboot_job"
 AUTO_REBOOT_MISFIRE_GRACE_SECONDS = 300
 AUTO_REBOOT_WEEKDAYS = [
@@ -2340,7 +2963,7 @@ def refresh_local_timezone(*, reconfigure_scheduler: bool = True):
             )
 
     previous_tz = LOCAL_TZ
-    new_tz = datetime.now().astimezone().tzinfo or timezone.utc
+    new_tz = _detect_local_timezone()
     timezone_changed = new_tz is not previous_tz and new_tz != previous_tz
     LOCAL_TZ = new_tz
 
@@ -2510,11 +3133,56 @@ def _format_schedule_time_for_display(time_str, repeat):
     return local_dt.strftime("%Y-%m-%d %H:%M:%S %Z")
 
 
+# Einstellungen werden oft gelesen und selten geschrieben. Der Cache gilt nur,
+# solange sich Datenbank- und WAL-Datei nicht verändert haben; so greifen
+# auch Änderungen anderer Verbindungen (z. B. install.sh per sqlite3).
+_SETTING_ABSENT = object()
+_settings_cache: Dict[str, Any] = {}
+_settings_cache_token: Optional[Tuple[Any, ...]] = None
+_settings_cache_lock = threading.RLock()
+
+
+def _settings_cache_token_for(db_file: str) -> Tuple[Any, ...]:
+    stats: List[Optional[Tuple[int, int, int]]] = []
+    for path in (db_file, f"{db_file}-wal"):
+        try:
+            st = os.stat(path)
+        except OSError:
+            stats.append(None)
+        else:
+            stats.append((st.st_ino, st.st_size, st.st_mtime_ns))
+    return (db_file, *stats)
+
+
+def _invalidate_settings_cache() -> None:
+    global _settings_cache_token
+    with _settings_cache_lock:
+        _settings_cache.clear()
+        _settings_cache_token = None
+
+
 def get_setting(key, default=None):
-    with get_db_connection() as (conn, cursor):
-        row = cursor.execute("SELECT value FROM settings WHERE key=?", (key,)).fetchone()
-    if row:
-        return row[0]
+    global _settings_cache_token
+    # Token vor der Abfrage bestimmen: ein paralleler Commit macht den
+    # gespeicherten Wert beim nächsten Zugriff ungültig, nie umgekehrt.
+    token = _settings_cache_token_for(DB_FILE)
+    with _settings_cache_lock:
+        if token != _settings_cache_token:
+            _settings_cache.clear()
+            _settings_cache_token = token
+        cached = _settings_cache.get(key, _SETTING_ABSENT)
+    if cached is _SETTING_ABSENT:
+        with get_db_connection() as (conn, cursor):
+            row = cursor.execute(
+                "SELECT value FROM settings WHERE key=?", (key,)
+            ).fetchone()
+        cached = (True, row[0]) if row else (False, None)
+        with _settings_cache_lock:
+            if _settings_cache_token == token:
+                _settings_cache[key] = cached
+    found, value = cached
+    if found:
+        return value
     if key in AUTO_REBOOT_DEFAULTS:
         default_value = AUTO_REBOOT_DEFAULTS[key]
         set_setting(key, default_value)
@@ -2529,6 +3197,7 @@ def set_setting(key, value):
             (key, "" if value is None else str(value)),
         )
         conn.commit()
+    _invalidate_settings_cache()
 
 
 def _parse_amplifier_gpio_pin(raw_value: Optional[str]) -> Optional[int]:
@@ -3011,10 +3680,72 @@ def update_amp_levels():
     AMP_OFF_LEVEL = 1 if RELAY_INVERT else 0
 
 
-def _set_amp_output(level, *, keep_claimed=None):
-    """Schreibt einen GPIO-Pegel und berücksichtigt den Claim-Zustand."""
+def _ensure_amp_line_claimed(level) -> bool:
+    """Belegt die Endstufen-Leitung einmalig und hält sie für die Laufzeit.
 
-    global amplifier_claimed
+    Nach einem Pin-Wechsel wird die alte Leitung freigegeben und die neue
+    belegt. Gibt ``False`` zurück, wenn die Leitung von anderer Seite belegt ist.
+    """
+
+    global amplifier_line_pin
+    if amplifier_line_pin == GPIO_PIN_ENDSTUFE:
+        return True
+    if amplifier_line_pin is not None:
+        try:
+            GPIO.gpio_free(gpio_handle, amplifier_line_pin)
+        except GPIOError as exc:
+            logging.debug(
+                "Alte Endstufen-Leitung GPIO%s konnte nicht freigegeben werden: %s",
+                amplifier_line_pin,
+                exc,
+            )
+        amplifier_line_pin = None
+    try:
+        GPIO.gpio_claim_output(
+            gpio_handle, GPIO_PIN_ENDSTUFE, lFlags=0, level=level
+        )
+    except GPIOError as e:
+        if "GPIO busy" in str(e):
+            logging.warning(
+                "GPIO busy beim Belegen der Endstufen-Leitung, Aktion wird übersprungen"
+            )
+            return False
+        raise
+    amplifier_line_pin = GPIO_PIN_ENDSTUFE
+    return True
+
+
+# Zuletzt geschriebener (Pin, Pegel); erspart ioctl-Aufrufe, wenn sich der
+# Pegel der Endstufen-Leitung nicht ändert.
+_amp_output_state: Optional[Tuple[int, int]] = None
+
+
+def _release_amplifier_line() -> None:
+    """Schaltet die Endstufe aus und gibt die dauerhaft belegte Leitung frei."""
+
+    global amplifier_line_pin, amplifier_claimed, _amp_output_state
+    pin = amplifier_line_pin
+    if pin is None or not GPIO_AVAILABLE or gpio_handle is None:
+        return
+    try:
+        GPIO.gpio_write(gpio_handle, pin, AMP_OFF_LEVEL)
+        GPIO.gpio_free(gpio_handle, pin)
+    except GPIOError as exc:
+        logging.debug("Endstufen-Leitung GPIO%s nicht freigegeben: %s", pin, exc)
+    amplifier_line_pin = None
+    amplifier_claimed = False
+    _amp_output_state = None
+
+
+def _set_amp_output(level, *, keep_claimed=None, force=False):
+    """Schreibt einen GPIO-Pegel auf die dauerhaft belegte Endstufen-Leitung.
+
+    ``keep_claimed`` bestimmt nur noch den logischen Zustand (Endstufe an/aus);
+    die Leitung selbst bleibt bis zum Prozessende belegt. Liegt der Pegel
+    bereits an, entfällt der Schreibzugriff, sofern ``force`` nicht gesetzt ist.
+    """
+
+    global amplifier_claimed, _amp_output_state
     if keep_claimed is None:
         keep_claimed = amplifier_claimed
 
@@ -3030,36 +3761,26 @@ def _set_amp_output(level, *, keep_claimed=None):
         )
         return False
 
+    if not _ensure_amp_line_claimed(level):
+        amplifier_claimed = False
+        return False
+    target_state = (GPIO_PIN_ENDSTUFE, level)
+    if not force and _amp_output_state == target_state:
+        amplifier_claimed = bool(keep_claimed)
+        return True
     try:
-        if amplifier_claimed:
-            GPIO.gpio_write(gpio_handle, GPIO_PIN_ENDSTUFE, level)
-            if not keep_claimed:
-                GPIO.gpio_free(gpio_handle, GPIO_PIN_ENDSTUFE)
-                amplifier_claimed = False
-            return True
-
-        GPIO.gpio_claim_output(
-            gpio_handle, GPIO_PIN_ENDSTUFE, lFlags=0, level=level
-        )
         GPIO.gpio_write(gpio_handle, GPIO_PIN_ENDSTUFE, level)
-        if keep_claimed:
-            amplifier_claimed = True
-        else:
-            GPIO.gpio_free(gpio_handle, GPIO_PIN_ENDSTUFE)
-        return True
     except GPIOError as e:
+        _amp_output_state = None
         if "GPIO busy" in str(e):
             logging.warning(
                 "GPIO busy beim Setzen des Endstufenpegels, Aktion wird übersprungen"
             )
-            if amplifier_claimed and not keep_claimed:
-                try:
-                    GPIO.gpio_free(gpio_handle, GPIO_PIN_ENDSTUFE)
-                except GPIOError:
-                    pass
-                amplifier_claimed = False
             return False
         raise
+    _amp_output_state = target_state
+    amplifier_claimed = bool(keep_claimed)
+    return True
 
 
 class User(UserMixin):
@@ -3090,15 +3811,11 @@ def load_user(user_id):
 
 
 def allowed_file(filename):
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
 
 
 def validate_time(time_str):
-    try:
-        datetime.strptime(time_str, "%H:%M:%S")
-        return True
-    except ValueError:
-        return False
+    return _TIME_PATTERN.fullmatch(time_str) is not None
 
 
 def parse_once_datetime(time_str):
@@ -3118,7 +3835,7 @@ def parse_once_datetime(time_str):
             continue
 
     relaxed = normalized.replace("T", " ")
-    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
+    for fmt in _ONCE_FORMATS:
         try:
             return datetime.strptime(relaxed, fmt)
         except ValueError:
@@ -3127,11 +3844,23 @@ def parse_once_datetime(time_str):
     raise ValueError(f"Ungültige Zeitangabe: {time_str}")
 
 
+def _parse_iso_date(value: str) -> date:
+    """Parst ``YYYY-MM-DD`` über ``date.fromisoformat`` statt ``strptime``.
+
+    Ab Python 3.11 akzeptiert ``fromisoformat`` auch Kurz- und Wochenformate;
+    die Längen-/Trennzeichenprüfung hält das Format so streng wie bisher.
+    """
+
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError(f"Ungültiges Datum: {value}")
+    return date.fromisoformat(value)
+
+
 def parse_schedule_date(date_str):
     if not date_str:
         return None
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
+        return _parse_iso_date(date_str)
     except ValueError:
         logging.warning(f"Ungültiges Datumsformat für Schedule: {date_str}")
         return None
@@ -3225,7 +3954,7 @@ def _schedule_interval_on_date(
         if end_date_obj and effective_date > end_date_obj:
             return None
         try:
-            base_time = datetime.strptime(schedule_data.get("time"), "%H:%M:%S").time()
+            base_time = datetime.strptime(schedule_data.get("time"), _TIME_FORMAT).time()
         except (TypeError, ValueError):
             return None
         if repeat == "monthly":
@@ -3302,6 +4031,61 @@ def _get_first_occurrence_date(schedule_data):
     return start_date_obj
 
 
+_ISO_DATE_GLOB = "[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]"
+# Vorfilter für die Konfliktprüfung: ausgeführte Einmal-Zeitpläne und
+# wiederkehrende Zeitpläne, deren Datumsbereich das Fenster des neuen
+# Zeitplans nicht berührt, erreichen die Intervallprüfung gar nicht erst.
+# Nicht-ISO-Datumswerte gelten wie in parse_schedule_date als unbegrenzt.
+# Die Dauer jedes Kandidaten liefert dieselbe Abfrage (wie _get_item_duration),
+# statt je Datei/Playlist eine eigene Abfrage abzusetzen.
+_SCHEDULE_CONFLICT_CANDIDATES_SQL = f"""
+    SELECT
+        s.item_id, s.item_type, s.time, s.repeat, s.delay, s.start_date,
+        s.end_date, s.day_of_month, s.executed,
+        CASE s.item_type
+            WHEN 'file' THEN (
+                SELECT f.duration_seconds FROM audio_files f WHERE f.id = s.item_id
+            )
+            WHEN 'playlist' THEN (
+                SELECT SUM(f.duration_seconds)
+                FROM playlist_files pf
+                JOIN audio_files f ON pf.file_id = f.id
+                WHERE pf.playlist_id = s.item_id
+            )
+        END AS item_duration_seconds
+    FROM schedules s
+    WHERE NOT (repeat IS 'once' AND IFNULL(executed, 0))
+      AND (
+        :window_start IS NULL OR repeat IS 'once' OR end_date IS NULL
+        OR end_date NOT GLOB '{_ISO_DATE_GLOB}' OR end_date >= :window_start
+      )
+      AND (
+        :window_end IS NULL OR repeat IS 'once' OR start_date IS NULL
+        OR start_date NOT GLOB '{_ISO_DATE_GLOB}' OR start_date <= :window_end
+      )
+"""
+# include_adjacent betrachtet Vortag und Folgetag: Zeitpläne können sich
+# nur überschneiden, wenn ihre Datumsbereiche höchstens zwei Tage auseinander liegen.
+_SCHEDULE_CONFLICT_WINDOW_MARGIN = timedelta(days=2)
+
+
+def _schedule_conflict_window(
+    schedule_data, first_date: Optional[date]
+) -> Tuple[Optional[str], Optional[str]]:
+    if schedule_data.get("repeat") == "once":
+        lower = upper = first_date
+    else:
+        lower = parse_schedule_date(schedule_data.get("start_date"))
+        upper = parse_schedule_date(schedule_data.get("end_date"))
+    window_start = (
+        (lower - _SCHEDULE_CONFLICT_WINDOW_MARGIN).isoformat() if lower else None
+    )
+    window_end = (
+        (upper + _SCHEDULE_CONFLICT_WINDOW_MARGIN).isoformat() if upper else None
+    )
+    return window_start, window_end
+
+
 def _has_schedule_conflict(cursor, new_schedule_data, new_duration_seconds, new_first_date):
     if new_duration_seconds is None:
         return False
@@ -3311,27 +4095,20 @@ def _has_schedule_conflict(cursor, new_schedule_data, new_duration_seconds, new_
         return False
     if duration_value <= 0:
         return False
+    window_start, window_end = _schedule_conflict_window(
+        new_schedule_data, new_first_date
+    )
     cursor.execute(
-        """
-        SELECT item_id, item_type, time, repeat, delay, start_date, end_date, day_of_month, executed
-        FROM schedules
-        """
+        _SCHEDULE_CONFLICT_CANDIDATES_SQL,
+        {"window_start": window_start, "window_end": window_end},
     )
     existing_rows = cursor.fetchall()
-    duration_cache = {}
     base_dates = set()
     if new_first_date is not None:
         base_dates.add(new_first_date)
     for row in existing_rows:
         schedule = dict(row)
-        if schedule.get("repeat") == "once" and schedule.get("executed"):
-            continue
-        key = (schedule.get("item_type"), schedule.get("item_id"))
-        if key not in duration_cache:
-            duration_cache[key] = _get_item_duration(
-                cursor, schedule.get("item_type"), schedule.get("item_id")
-            )
-        existing_duration = duration_cache[key]
+        existing_duration = schedule.pop("item_duration_seconds")
         if existing_duration is None:
             continue
         try:
@@ -3389,7 +4166,49 @@ def is_within_schedule_range(start_date_str, end_date_str, reference=None):
 
 
 # PulseAudio
+_PULSE_UNAVAILABLE = object()
+_pulse_client = None
+# pulsectl.Pulse ist nicht threadsicher; Aufrufe laufen seriell über eine
+# dauerhaft geöffnete Verbindung statt je Abfrage einen pactl-Prozess zu starten.
+_pulse_client_lock = threading.Lock()
+
+
+def _pulse_call(operation: Callable[[Any], Any]) -> Any:
+    """Führt ``operation(pulse)`` über libpulse aus.
+
+    Liefert ``_PULSE_UNAVAILABLE``, wenn pulsectl fehlt oder der Server nicht
+    erreichbar ist; der Aufrufer greift dann auf ``pactl`` zurück. Fehler der
+    Operation selbst (``pulsectl.PulseError``, etwa ein unbekannter Sink)
+    gehen an den Aufrufer, die Verbindung bleibt dabei bestehen.
+    """
+
+    global _pulse_client
+
+    if not PULSECTL_AVAILABLE:
+        return _PULSE_UNAVAILABLE
+    with _pulse_client_lock:
+        if _pulse_client is None:
+            try:
+                _pulse_client = pulsectl.Pulse("audio-pi")
+            except (pulsectl.PulseError, OSError) as exc:
+                logging.debug("libpulse-Verbindung fehlgeschlagen, verwende pactl: %s", exc)
+                return _PULSE_UNAVAILABLE
+        try:
+            return operation(_pulse_client)
+        except pulsectl.PulseDisconnected as exc:
+            logging.debug("libpulse-Verbindung getrennt, verwende pactl: %s", exc)
+            try:
+                _pulse_client.close()
+            except Exception:
+                pass
+            _pulse_client = None
+            return _PULSE_UNAVAILABLE
+
+
 def get_current_sink():
+    default_sink = _pulse_call(lambda pulse: pulse.server_info().default_sink_name)
+    if default_sink is not _PULSE_UNAVAILABLE and default_sink:
+        return default_sink
     output = _run_pactl_command("get-default-sink")
     if not output:
         return "Nicht verfügbar"
@@ -3397,6 +4216,9 @@ def get_current_sink():
 
 
 def _list_pulse_sinks():
+    sink_names = _pulse_call(lambda pulse: [sink.name for sink in pulse.sink_list()])
+    if sink_names is not _PULSE_UNAVAILABLE:
+        return sink_names
     try:
         result = subprocess.run(
             ["pactl", "list", "short", "sinks"],
@@ -3501,7 +4323,18 @@ def set_sink(sink_name):
         return False
 
     try:
-        exit_code = subprocess.call(["pactl", "set-default-sink", resolved])
+        pulse_result = _pulse_call(lambda pulse: pulse.sink_default_set(resolved))
+    except pulsectl.PulseError as exc:
+        logging.warning("PulseAudio-Sink konnte nicht gesetzt werden: %s", exc)
+        audio_status["dac_sink_detected"] = False
+        if has_request_context():
+            _notify_audio_unavailable("PulseAudio-Sink konnte nicht gesetzt werden")
+        return False
+    try:
+        if pulse_result is not _PULSE_UNAVAILABLE:
+            exit_code = 0
+        else:
+            exit_code = subprocess.call(["pactl", "set-default-sink", resolved])
     except (FileNotFoundError, OSError) as exc:
         logging.warning(
             "PulseAudio-Sink konnte nicht gesetzt werden, 'pactl' fehlt oder ist nicht aufrufbar: %s",
@@ -3523,6 +4356,7 @@ def set_sink(sink_name):
     if _sink_is_configured(resolved):
         DAC_SINK = resolved
         audio_status["dac_sink_detected"] = True
+    _invalidate_dashboard_status_cache()
     logging.info("Switch zu Sink: %s", resolved)
     return True
 
@@ -3545,16 +4379,18 @@ def _sink_is_configured(sink_name: str) -> bool:
 def _describe_command(args: Sequence[str]) -> str:
     if not args:
         return "<unbekannt>"
-    if args[0] == "sudo" and len(args) > 1:
-        return " ".join(args[1:])
+    prefix = _sudo_prefix_length(args)
+    if prefix and len(args) > prefix:
+        return " ".join(args[prefix:])
     return " ".join(args)
 
 
 def _extract_primary_command(args: Sequence[str]) -> str:
     if not args:
         return "<unbekannt>"
-    if args[0] == "sudo" and len(args) > 1:
-        return args[1]
+    prefix = _sudo_prefix_length(args)
+    if prefix and len(args) > prefix:
+        return args[prefix]
     return args[0]
 
 
@@ -3653,31 +4489,148 @@ def _run_wifi_tool(
     return True, stdout
 
 
-def gather_status():
-    if app.testing and has_request_context():
-        success = False
-        wlan_output = "Nicht verfügbar (Testmodus)"
-    else:
-        wifi_interface = get_wifi_interface()
+def _ttl_cached(
+    seconds: float, cache_if: Optional[Callable[[Any], bool]] = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Merkt sich das Ergebnis einer Statusabfrage je Argumentsatz für ``seconds``.
+
+    Ausnahmen und Ergebnisse, für die ``cache_if`` ``False`` liefert, werden
+    nicht zwischengespeichert. ``invalidate()`` am Wrapper verwirft alle Einträge.
+    """
+
+    def decorator(probe: Callable[..., Any]) -> Callable[..., Any]:
+        lock = threading.Lock()
+        entries: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        state = {"generation": 0}
+
+        @functools.wraps(probe)
+        def cached_probe(*args):
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(args)
+                if entry is not None and now < entry[0]:
+                    return entry[1]
+                generation = state["generation"]
+            value = probe(*args)
+            if cache_if is not None and not cache_if(value):
+                return value
+            with lock:
+                # Wurde währenddessen invalidiert, ist der Wert bereits veraltet.
+                if state["generation"] == generation:
+                    entries[args] = (now + seconds, value)
+            return value
+
+        def invalidate() -> None:
+            with lock:
+                state["generation"] += 1
+                entries.clear()
+
+        cached_probe.invalidate = invalidate  # type: ignore[attr-defined]
+        return cached_probe
+
+    return decorator
+
+
+# Das Dashboard wird nach jeder Aktion neu geladen; die SSID ändert sich
+# selten, daher wird iwgetid höchstens alle paar Sekunden gestartet.
+WLAN_STATUS_CACHE_SECONDS = 5.0
+
+
+def _invalidate_wlan_status_cache() -> None:
+    _probe_wlan_status.invalidate()
+
+
+_SIOCGIWESSID = 0x8B1B
+_IW_ESSID_MAX_SIZE = 32
+_IWREQ_ESSID_FORMAT = "16sPHH"
+_IWREQ_SIZE = 32
+
+
+def _read_wlan_ssid_ioctl(wifi_interface: str) -> Optional[str]:
+    """Liest die SSID per ``SIOCGIWESSID`` direkt vom Kernel.
+
+    Liefert ``None``, wenn die Wireless-Extensions nicht verfügbar sind; der
+    Aufrufer fällt dann auf ``iwgetid`` zurück.
+    """
+
+    if fcntl is None:
+        return None
+    essid = array.array("B", bytes(_IW_ESSID_MAX_SIZE + 1))
+    address, length = essid.buffer_info()
+    request_data = struct.pack(
+        _IWREQ_ESSID_FORMAT,
+        wifi_interface.encode("utf-8")[:15],
+        address,
+        length,
+        0,
+    )
+    request_data = request_data.ljust(_IWREQ_SIZE, b"\0")
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            response = fcntl.ioctl(sock.fileno(), _SIOCGIWESSID, request_data)
+    except OSError:
+        return None
+    essid_length = struct.unpack_from(_IWREQ_ESSID_FORMAT, response)[2]
+    return essid.tobytes()[: min(essid_length, _IW_ESSID_MAX_SIZE)].decode(
+        "utf-8", errors="replace"
+    )
+
+
+# Fehler nicht zwischenspeichern, damit sie weiterhin protokolliert werden.
+@_ttl_cached(WLAN_STATUS_CACHE_SECONDS, cache_if=lambda result: result[0])
+def _probe_wlan_status(wifi_interface: str) -> Tuple[bool, str]:
+    wlan_output = _read_wlan_ssid_ioctl(wifi_interface)
+    if wlan_output is None:
         success, wlan_output = _run_wifi_tool(
             ["iwgetid", wifi_interface, "-r"],
             "Nicht verfügbar (iwgetid fehlt)",
             "iwgetid für WLAN-Status",
         )
-    if success:
-        wlan_ssid = wlan_output or "Nicht verbunden"
+        if not success:
+            return False, wlan_output
+    return True, wlan_output or "Nicht verbunden"
+
+
+def _get_wlan_status(wifi_interface: str) -> str:
+    return _probe_wlan_status(wifi_interface)[1]
+
+
+# Standard-Sink und Bluetooth-Status kosten je eine PulseAudio-Abfrage; beim
+# Neuladen des Dashboards genügt ein kurz zwischengespeicherter Wert.
+# Änderungen über die Oberfläche verwerfen ihn.
+DASHBOARD_STATUS_CACHE_SECONDS = 2.0
+
+
+@_ttl_cached(DASHBOARD_STATUS_CACHE_SECONDS)
+def _dashboard_current_sink():
+    return get_current_sink()
+
+
+@_ttl_cached(DASHBOARD_STATUS_CACHE_SECONDS)
+def _dashboard_bt_connected() -> bool:
+    return is_bt_connected()
+
+
+def _invalidate_dashboard_status_cache() -> None:
+    _dashboard_current_sink.invalidate()
+    _dashboard_bt_connected.invalidate()
+
+
+def gather_status():
+    if app.testing and has_request_context():
+        wlan_ssid = "Nicht verfügbar (Testmodus)"
     else:
-        wlan_ssid = wlan_output
+        wlan_ssid = _get_wlan_status(get_wifi_interface())
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     system_metrics = gather_system_metrics()
 
     volume_output = _run_pactl_command("get-sink-volume", "@DEFAULT_SINK@")
     current_volume = "Unbekannt"
     if volume_output:
-        match = re.search(r"(\d+)%", volume_output)
+        match = _VOL_RE.search(volume_output)
         if match:
             current_volume = f"{match.group(1)}%"
-    current_sink_name = get_current_sink()
+    current_sink_name = _dashboard_current_sink()
     if DAC_SINK:
         sink_detected = audio_status.get("dac_sink_detected")
         sink_available = _is_sink_available(DAC_SINK)
@@ -3724,7 +4677,9 @@ def gather_status():
 
     return {
         "playing": is_playing,
-        "bluetooth_status": "Verbunden" if is_bt_connected() else "Nicht verbunden",
+        "bluetooth_status": (
+            "Verbunden" if _dashboard_bt_connected() else "Nicht verbunden"
+        ),
         "wlan_status": wlan_ssid,
         "current_sink": current_sink_name,
         "current_time": current_time,
@@ -3763,7 +4718,7 @@ def gather_status():
 def _parse_auto_reboot_time(time_str):
     if not time_str:
         return None
-    for fmt in ("%H:%M", "%H:%M:%S"):
+    for fmt in _AUTO_REBOOT_TIME_FORMATS:
         try:
             dt = datetime.strptime(time_str, fmt)
             return dt.hour, dt.minute
@@ -3887,9 +4842,6 @@ def activate_amplifier():
         return
     was_claimed = amplifier_claimed
     try:
-        if not was_claimed:
-            if not _set_amp_output(AMP_OFF_LEVEL, keep_claimed=True):
-                return
         if _set_amp_output(AMP_ON_LEVEL, keep_claimed=True):
             logging.info(
                 "Endstufe EIN (bereits belegt)"
@@ -3928,11 +4880,55 @@ def deactivate_amplifier():
             raise e
 
 
-# Endstufe beim Start aus
+# Endstufe beim Start aus; die Leitung bleibt danach bis Prozessende belegt
 if not TESTING:
     deactivate_amplifier()
 
-play_lock = threading.Lock()
+
+class _FifoLock:
+    """Lock, der wartende Threads in Ankunftsreihenfolge bedient.
+
+    Gleichzeitig fällige Zeitpläne warten so als Warteschlange auf die
+    laufende Wiedergabe, statt in zufälliger Reihenfolge geweckt zu werden.
+    """
+
+    def __init__(self):
+        self._mutex = threading.Lock()
+        self._waiters: deque = deque()
+        self._locked = False
+
+    def acquire(self) -> bool:
+        with self._mutex:
+            if not self._locked:
+                self._locked = True
+                return True
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+        waiter.wait()
+        return True
+
+    def release(self) -> None:
+        with self._mutex:
+            if self._waiters:
+                # Besitz direkt an den ältesten Wartenden übergeben
+                self._waiters.popleft().set()
+            else:
+                self._locked = False
+
+    def locked(self) -> bool:
+        with self._mutex:
+            return self._locked
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.release()
+        return False
+
+
+play_lock = _FifoLock()
 
 
 # Wiedergabe Funktion
@@ -3995,25 +4991,67 @@ def _temporary_volume_scale(volume_percent):
 # Wiedergabe Funktion
 def _handle_audio_decode_failure(file_path: str, error: Exception) -> None:
     logging.error("Konnte Audiodatei %s nicht dekodieren: %s", file_path, error)
-    if has_request_context():
-        try:
-            flash(
-                "Audio-Datei konnte nicht dekodiert werden: "
-                f"{os.path.basename(file_path)}"
+    _notify_user(
+        f"Audio-Datei konnte nicht dekodiert werden: {os.path.basename(file_path)}"
+    )
+
+
+# Dekodieren/Normalisieren läuft in einem eigenen Prozess, damit ffmpeg- und
+# pydub-Arbeit weder den GIL noch die APScheduler-Threads blockiert.
+AUDIO_DECODE_IN_SUBPROCESS = _env_to_bool(
+    os.environ.get("AUDIO_PI_DECODE_IN_SUBPROCESS", "1")
+)
+_decode_pool: Optional[ProcessPoolExecutor] = None
+_decode_pool_lock = threading.Lock()
+
+
+def _get_decode_pool() -> Optional[ProcessPoolExecutor]:
+    global _decode_pool
+
+    if not AUDIO_DECODE_IN_SUBPROCESS:
+        return None
+    with _decode_pool_lock:
+        if _decode_pool is None:
+            # "spawn" statt fork: der Webprozess ist mehrfädig, und der
+            # Worker importiert nur audio_decode, nicht die Anwendung.
+            _decode_pool = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
             )
-        except Exception:
-            logging.debug(
-                "Konnte Flash-Nachricht für Dekodierfehler nicht senden.",
-                exc_info=True,
+        return _decode_pool
+
+
+def _shutdown_decode_pool() -> None:
+    global _decode_pool
+
+    with _decode_pool_lock:
+        pool = _decode_pool
+        _decode_pool = None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_shutdown_decode_pool)
+
+
+def _normalize_audio_file(file_path: str, temp_path: str, headroom: float) -> None:
+    pool = _get_decode_pool()
+    if pool is not None:
+        try:
+            pool.submit(normalize_to_wav, file_path, temp_path, headroom).result()
+            return
+        except BrokenProcessPool:
+            logging.warning(
+                "Dekodier-Prozess ausgefallen, normalisiere %s im Webprozess.",
+                file_path,
             )
+            _shutdown_decode_pool()
+    normalize_to_wav(file_path, temp_path, headroom)
 
 
 def _prepare_audio_for_playback(file_path: str, temp_path: str) -> bool:
     try:
-        sound = AudioSegment.from_file(file_path)
         headroom = float(get_normalization_headroom_db())
-        normalized = sound.normalize(headroom=headroom)
-        normalized.export(temp_path, format="wav")
+        _normalize_audio_file(file_path, temp_path, headroom)
     except CouldntDecodeError as exc:
         _handle_audio_decode_failure(file_path, exc)
         return False
@@ -4021,18 +5059,219 @@ def _prepare_audio_for_playback(file_path: str, temp_path: str) -> bool:
         logging.exception(
             "Unerwarteter Fehler beim Vorbereiten der Audiodatei %s", file_path
         )
-        if has_request_context():
-            try:
-                flash(
-                    "Beim Vorbereiten der Audio-Datei ist ein Fehler aufgetreten: "
-                    f"{os.path.basename(file_path)}"
-                )
-            except Exception:
-                logging.debug(
-                    "Konnte Flash-Nachricht für allgemeinen Dekodierfehler nicht senden.",
-                    exc_info=True,
-                )
+        _notify_user(
+            "Beim Vorbereiten der Audio-Datei ist ein Fehler aufgetreten: "
+            f"{os.path.basename(file_path)}"
+        )
+        return False
+    return True
+
+
+NORMALIZED_AUDIO_CACHE_DIRNAME = "_norm"
+# WAV-Fassungen sind ein Vielfaches der MP3-Größe; oberhalb dieser Grenze
+# werden die am längsten nicht gespielten Einträge verworfen.
+NORMALIZED_AUDIO_CACHE_MAX_BYTES = (
+    _resolve_positive_int_env("AUDIO_PI_NORMALIZED_CACHE_MAX_MB", 1024) * 1024 * 1024
+)
+
+
+def _normalized_audio_cache_dir() -> str:
+    return os.path.join(app.config["UPLOAD_FOLDER"], NORMALIZED_AUDIO_CACHE_DIRNAME)
+
+
+def _normalized_audio_cache_prefix(file_path: str) -> str:
+    return hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:16]
+
+
+def _remove_normalized_audio_cache(file_path: str, keep: Optional[str] = None) -> None:
+    """Entfernt zwischengespeicherte WAV-Fassungen einer Quelldatei."""
+
+    cache_dir = _normalized_audio_cache_dir()
+    prefix = f"{_normalized_audio_cache_prefix(file_path)}-"
+    try:
+        entries = os.listdir(cache_dir)
+    except FileNotFoundError:
+        return
+    except OSError:
+        logging.debug("Normalisierungs-Cache %s nicht lesbar.", cache_dir, exc_info=True)
+        return
+    for entry in entries:
+        if not entry.startswith(prefix) or entry == keep:
+            continue
+        try:
+            os.remove(os.path.join(cache_dir, entry))
+        except OSError:
+            logging.debug(
+                "Veraltete Cache-Datei %s konnte nicht entfernt werden.",
+                entry,
+                exc_info=True,
+            )
+
+
+def _trim_normalized_audio_cache(keep: str) -> None:
+    """Hält den Cache unter ``NORMALIZED_AUDIO_CACHE_MAX_BYTES`` (LRU über mtime)."""
+
+    cache_dir = _normalized_audio_cache_dir()
+    entries = []
+    total_size = 0
+    try:
+        with os.scandir(cache_dir) as iterator:
+            for entry in iterator:
+                if not entry.name.endswith(".wav") or entry.name == keep:
+                    continue
+                stat_result = entry.stat()
+                entries.append((stat_result.st_mtime_ns, stat_result.st_size, entry.path))
+                total_size += stat_result.st_size
+        total_size += os.stat(os.path.join(cache_dir, keep)).st_size
+    except OSError:
+        logging.debug("Normalisierungs-Cache %s nicht lesbar.", cache_dir, exc_info=True)
+        return
+    for _mtime_ns, size, path in sorted(entries):
+        if total_size <= NORMALIZED_AUDIO_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            logging.debug(
+                "Cache-Datei %s konnte nicht entfernt werden.", path, exc_info=True
+            )
+            continue
+        total_size -= size
+
+
+def _get_normalized_audio_path(file_path: str) -> Optional[str]:
+    """Liefert eine normalisierte WAV-Fassung aus dem Cache oder erzeugt sie.
+
+    Der Cache-Schlüssel umfasst Pfad, Änderungszeit, Größe und Headroom, damit
+    ersetzte Dateien oder geänderte Einstellungen neu dekodiert werden.
+    """
+
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        logging.warning("Datei fehlt: %s", file_path)
+        return None
+    headroom = float(get_normalization_headroom_db())
+    version = hashlib.sha1(
+        f"{stat_result.st_mtime_ns}:{stat_result.st_size}:{headroom!r}".encode("utf-8")
+    ).hexdigest()[:16]
+    cache_dir = _normalized_audio_cache_dir()
+    cache_name = f"{_normalized_audio_cache_prefix(file_path)}-{version}.wav"
+    cache_path = os.path.join(cache_dir, cache_name)
+    if os.path.exists(cache_path):
+        try:
+            # Treffer als zuletzt genutzt markieren, siehe _trim_normalized_audio_cache.
+            os.utime(cache_path)
+        except OSError:
+            logging.debug("Cache-Datei %s nicht aktualisierbar.", cache_path, exc_info=True)
+        return cache_path
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_file = tempfile.NamedTemporaryFile(
+        delete=False, suffix=".wav.tmp", dir=cache_dir
+    )
+    temp_path = tmp_file.name
+    tmp_file.close()
+    try:
+        if not _prepare_audio_for_playback(file_path, temp_path):
+            return None
+        os.replace(temp_path, cache_path)
+    finally:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+    if not os.path.exists(file_path):
+        # Während des Dekodierens gelöscht: keinen verwaisten Eintrag hinterlassen.
+        _remove_normalized_audio_cache(file_path)
+        return None
+    _remove_normalized_audio_cache(file_path, keep=cache_name)
+    _trim_normalized_audio_cache(cache_name)
+    return cache_path
+
+
+_normalize_prewarm_executor: Optional[ThreadPoolExecutor] = None
+_normalize_prewarm_lock = threading.Lock()
+
+
+def _prewarm_normalized_audio(file_path: str) -> None:
+    """Legt die normalisierte WAV-Fassung einer neuen Datei im Hintergrund an.
+
+    So dekodiert nicht erst die erste Wiedergabe die Datei; der Upload-Request
+    wartet nicht auf das Normalisieren.
+    """
+
+    global _normalize_prewarm_executor
+
+    with _normalize_prewarm_lock:
+        if _normalize_prewarm_executor is None:
+            _normalize_prewarm_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="normalize-prewarm"
+            )
+        executor = _normalize_prewarm_executor
+    future = executor.submit(_get_normalized_audio_path, file_path)
+    future.add_done_callback(_log_prewarm_failure)
+
+
+def _log_prewarm_failure(future: "Future[Optional[str]]") -> None:
+    exc = future.exception()
+    if exc is not None:
+        logging.warning("Vorab-Normalisierung fehlgeschlagen: %s", exc)
+
+
+def _shutdown_normalize_prewarm() -> None:
+    global _normalize_prewarm_executor
+
+    with _normalize_prewarm_lock:
+        executor = _normalize_prewarm_executor
+        _normalize_prewarm_executor = None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_shutdown_normalize_prewarm)
+
+
+_MUSIC_END_WAIT_MAX_SECONDS = 5.0
+# Nur der Watcher-Thread liest die SDL-Ereignis-Queue; Wiedergabe-Threads
+# warten auf dieses Signal.
+_music_end_signal = threading.Event()
+_music_end_watcher: Optional[threading.Thread] = None
+_music_end_watcher_lock = threading.Lock()
+
+
+def _watch_music_end_events(end_event: int) -> None:
+    global MUSIC_END_EVENT
+    while True:
+        try:
+            event = pygame.event.wait()
+        except pygame_error as exc:
+            logging.info(
+                "pygame-Ereignis-Queue beendet, Wiedergabeende wird gepollt: %s", exc
+            )
+            MUSIC_END_EVENT = None
+            _music_end_signal.set()
+            return
+        if event.type == end_event:
+            _music_end_signal.set()
+
+
+def _ensure_music_end_watcher() -> bool:
+    """Startet bei Bedarf den Thread, der das pygame-Endereignis weiterreicht."""
+
+    global _music_end_watcher
+    end_event = MUSIC_END_EVENT
+    if end_event is None:
         return False
+    with _music_end_watcher_lock:
+        if _music_end_watcher is None or not _music_end_watcher.is_alive():
+            _music_end_watcher = threading.Thread(
+                target=_watch_music_end_events,
+                args=(end_event,),
+                name="music-end-watcher",
+                daemon=True,
+            )
+            _music_end_watcher.start()
     return True
 
 
@@ -4048,20 +5287,33 @@ def _wait_for_music_playback(duration_seconds) -> None:
         timeout_at = time.monotonic() + max(duration_value + 5, duration_value * 1.25)
 
     while pygame.mixer.music.get_busy():
-        if timeout_at is not None and time.monotonic() >= timeout_at:
+        now = time.monotonic()
+        if timeout_at is not None and now >= timeout_at:
             logging.warning(
                 "Pygame meldet Wiedergabe laenger als erwartet als aktiv; stoppe Audio-Backend."
             )
             pygame.mixer.music.stop()
             break
-        time.sleep(0.25)
+        if not _ensure_music_end_watcher():
+            time.sleep(0.25)
+            continue
+        # Blockiert bis zum Endereignis (auch bei stop()); ein veraltetes
+        # Signal fuehrt nur zu einer erneuten get_busy()-Pruefung.
+        wait_seconds = _MUSIC_END_WAIT_MAX_SECONDS
+        if timeout_at is not None:
+            wait_seconds = max(0.001, min(wait_seconds, timeout_at - now))
+        if _music_end_signal.wait(wait_seconds):
+            _music_end_signal.clear()
 
 
 def play_item(item_id, item_type, delay, is_schedule=False, volume_percent=100):
-    global is_paused
     if not pygame_available:
         _notify_audio_unavailable("Wiedergabe kann nicht gestartet werden")
         return False
+    if play_lock.locked():
+        logging.info(
+            "Wiedergabe für %s %s wartet auf laufende Wiedergabe", item_type, item_id
+        )
     with play_lock:
         if pygame.mixer.music.get_busy():
             logging.info(
@@ -4077,9 +5329,6 @@ def play_item(item_id, item_type, delay, is_schedule=False, volume_percent=100):
         time.sleep(delay)
         logging.info(f"Starte Wiedergabe für {item_type} {item_id}")
         sanitized_volume = _coerce_volume_percent(volume_percent)
-        tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-        temp_path = tmp_file.name
-        tmp_file.close()
         playback_started = False
         try:
             if item_type == "file":
@@ -4098,23 +5347,20 @@ def play_item(item_id, item_type, delay, is_schedule=False, volume_percent=100):
                 if not os.path.exists(file_path):
                     logging.warning(f"Datei fehlt: {file_path}")
                     if not is_schedule:
-                        try:
-                            if has_request_context():
-                                flash("Audio-Datei nicht gefunden")
-                        except Exception:
-                            pass
+                        _notify_user("Audio-Datei nicht gefunden")
                     return False
-                if not _prepare_audio_for_playback(file_path, temp_path):
+                normalized_path = _get_normalized_audio_path(file_path)
+                if normalized_path is None:
                     return False
                 with _temporary_volume_scale(sanitized_volume):
-                    pygame.mixer.music.load(temp_path)
+                    pygame.mixer.music.load(normalized_path)
                     pygame.mixer.music.play()
                     playback_started = True
                     if duration_seconds is not None:
                         logging.info(
                             "Spiele Datei %s (%.2f s)", filename, duration_seconds
                         )
-                    is_paused = False
+                    _playback_paused.clear()
                     _wait_for_music_playback(duration_seconds)
             elif item_type == "playlist":
                 with get_db_connection() as (conn, cursor):
@@ -4135,45 +5381,74 @@ def play_item(item_id, item_type, delay, is_schedule=False, volume_percent=100):
                         item_id,
                     )
                     return False
-                with _temporary_volume_scale(sanitized_volume):
-                    for file_info in files:
-                        filename = file_info["filename"]
-                        duration_seconds = file_info.get("duration_seconds")
-                        file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-                        if not os.path.exists(file_path):
-                            logging.warning(f"Datei fehlt: {file_path}")
-                            if not is_schedule:
-                                try:
-                                    if has_request_context():
-                                        flash("Audio-Datei nicht gefunden")
-                                except Exception:
-                                    pass
-                            continue
-                        if not _prepare_audio_for_playback(file_path, temp_path):
-                            if not playback_started:
-                                return False
-                            break
-                        pygame.mixer.music.load(temp_path)
-                        pygame.mixer.music.play()
-                        playback_started = True
-                        if duration_seconds is not None:
-                            logging.info(
-                                "Spiele Playlist-Datei %s (%.2f s)",
-                                filename,
-                                duration_seconds,
+                upload_folder = app.config["UPLOAD_FOLDER"]
+                file_paths = [
+                    os.path.join(upload_folder, file_info["filename"])
+                    for file_info in files
+                ]
+                # Nächsten Titel schon während der Wiedergabe vorbereiten, damit
+                # zwischen zwei Titeln nicht dekodiert werden muss.
+                prefetch_pool = (
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix="playlist-prefetch")
+                    if len(files) > 1
+                    else None
+                )
+                prefetched: Dict[int, Future] = {}
+                try:
+                    with _temporary_volume_scale(sanitized_volume):
+                        for index, file_info in enumerate(files):
+                            filename = file_info["filename"]
+                            duration_seconds = file_info.get("duration_seconds")
+                            file_path = file_paths[index]
+                            if not os.path.exists(file_path):
+                                logging.warning(f"Datei fehlt: {file_path}")
+                                if not is_schedule:
+                                    _notify_user("Audio-Datei nicht gefunden")
+                                continue
+                            pending = prefetched.pop(index, None)
+                            normalized_path = (
+                                pending.result()
+                                if pending is not None
+                                else _get_normalized_audio_path(file_path)
                             )
-                        is_paused = False
-                        _wait_for_music_playback(duration_seconds)
+                            if normalized_path is None:
+                                if not playback_started:
+                                    return False
+                                break
+                            pygame.mixer.music.load(normalized_path)
+                            pygame.mixer.music.play()
+                            playback_started = True
+                            if prefetch_pool is not None:
+                                next_index = next(
+                                    (
+                                        candidate
+                                        for candidate in range(index + 1, len(files))
+                                        if os.path.exists(file_paths[candidate])
+                                    ),
+                                    None,
+                                )
+                                if next_index is not None:
+                                    prefetched[next_index] = prefetch_pool.submit(
+                                        _get_normalized_audio_path,
+                                        file_paths[next_index],
+                                    )
+                            if duration_seconds is not None:
+                                logging.info(
+                                    "Spiele Playlist-Datei %s (%.2f s)",
+                                    filename,
+                                    duration_seconds,
+                                )
+                            _playback_paused.clear()
+                            _wait_for_music_playback(duration_seconds)
+                finally:
+                    if prefetch_pool is not None:
+                        prefetch_pool.shutdown(wait=False, cancel_futures=True)
                 if not playback_started:
                     return False
             else:
                 logging.warning("Unbekannter Wiedergabetyp: %s", item_type)
                 return False
         finally:
-            try:
-                os.remove(temp_path)
-            except FileNotFoundError:
-                pass
             bt_connected = is_bt_connected()
             if bt_connected:
                 logging.info(
@@ -4221,12 +5496,12 @@ def schedule_job(schedule_id):
     )
     if repeat == "once":
         if playback_started:
-            with get_db_connection() as (conn, cursor):
-                cursor.execute(
+            run_write_transaction(
+                lambda _conn, cursor: cursor.execute(
                     "UPDATE schedules SET executed=1 WHERE id=?",
                     (schedule_id,),
                 )
-                conn.commit()
+            )
             load_schedules()
         else:
             logging.info(
@@ -4244,16 +5519,172 @@ def skip_past_once_schedules():
     with get_db_connection() as (conn, cursor):
         cursor.execute("SELECT id, time FROM schedules WHERE repeat='once' AND executed=0")
         schedules = cursor.fetchall()
-        for sch_id, sch_time in schedules:
-            try:
-                run_time = parse_once_datetime(sch_time)
-                run_time_local = _to_local_aware(run_time)
-                if run_time_local and run_time_local <= threshold:
-                    cursor.execute("UPDATE schedules SET executed=1 WHERE id=?", (sch_id,))
-                    logging.info(f"Skippe überfälligen 'once' Schedule {sch_id}")
-            except ValueError:
-                logging.warning(f"Skippe Schedule {sch_id} mit ungültiger Zeit {sch_time}")
-        conn.commit()
+    expired_ids: List[int] = []
+    for sch_id, sch_time in schedules:
+        try:
+            run_time = parse_once_datetime(sch_time)
+            run_time_local = _to_local_aware(run_time)
+            if run_time_local and run_time_local <= threshold:
+                expired_ids.append(sch_id)
+                logging.info(f"Skippe überfälligen 'once' Schedule {sch_id}")
+        except ValueError:
+            logging.warning(f"Skippe Schedule {sch_id} mit ungültiger Zeit {sch_time}")
+    if not expired_ids:
+        return
+
+    def _mark_executed(_conn, cursor):
+        # Ein UPDATE pro Block statt pro Zeile; Blockgröße bleibt unter dem
+        # Parameterlimit älterer SQLite-Versionen (999).
+        for start in range(0, len(expired_ids), _SQLITE_MAX_IN_PARAMETERS):
+            chunk = expired_ids[start : start + _SQLITE_MAX_IN_PARAMETERS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"UPDATE schedules SET executed=1 WHERE id IN ({placeholders})",
+                chunk,
+            )
+
+    run_write_transaction(_mark_executed)
+
+
+# Nur aktive Zeitpläne laden: abgelaufene Wiederholungen filtert bereits
+# SQLite. Nicht im ISO-Format gespeicherte Enddaten bleiben der Python-Prüfung
+# überlassen, damit sie wie bisher als "ohne Ende" gelten.
+_LOAD_SCHEDULES_SQL = """
+    SELECT id, time, repeat, start_date, end_date, day_of_month
+    FROM schedules
+    WHERE (executed = 0 OR executed IS NULL)
+      AND (
+        repeat = 'once'
+        OR end_date IS NULL
+        OR end_date >= ?
+        OR end_date NOT GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'
+      )
+    ORDER BY repeat, id
+"""
+
+
+def _parse_schedule_clock(time_str: str) -> Tuple[int, int, int]:
+    hour, minute, second = map(int, time_str.split(":"))
+    return hour, minute, second
+
+
+def _build_once_trigger(sch, _start_date, _end_date):
+    run_dt = parse_once_datetime(sch["time"])
+    run_time = _to_local_aware(run_dt)
+    if run_time is None:
+        logging.warning(
+            "Zeitplan %s besitzt keine gültige lokale Ausführungszeit (%s)",
+            sch["id"],
+            sch["time"],
+        )
+        return None
+    return DateTrigger(run_date=run_time)
+
+
+def _build_daily_trigger(sch, start_date, end_date):
+    h, m, s = _parse_schedule_clock(sch["time"])
+    start_dt = (
+        datetime.combine(start_date, datetime.min.time()).replace(
+            hour=h, minute=m, second=s
+        )
+        if start_date
+        else None
+    )
+    start_dt = _ensure_local_timezone(start_dt)
+    end_dt = datetime.combine(end_date, datetime.max.time()) if end_date else None
+    end_dt = _ensure_local_timezone(end_dt)
+    return CronTrigger(
+        hour=h,
+        minute=m,
+        second=s,
+        start_date=start_dt,
+        end_date=end_dt,
+        timezone=LOCAL_TZ,
+    )
+
+
+def _build_monthly_trigger(sch, start_date, end_date):
+    sch_id = sch["id"]
+    h, m, s = _parse_schedule_clock(sch["time"])
+    raw_day_of_month = sch["day_of_month"]
+    if raw_day_of_month is None and start_date:
+        raw_day_of_month = start_date.day
+    try:
+        day_of_month = int(raw_day_of_month)
+    except (TypeError, ValueError):
+        logging.warning(
+            "Zeitplan %s besitzt keinen gültigen Tag im Monat und wird übersprungen",
+            sch_id,
+        )
+        return None
+    if not 1 <= day_of_month <= 31:
+        logging.warning(
+            "Zeitplan %s hat einen ungültigen Tag im Monat (%s)",
+            sch_id,
+            day_of_month,
+        )
+        return None
+    start_dt = None
+    if start_date:
+        try:
+            first_occurrence = calculate_first_monthly_occurrence(
+                start_date, day_of_month
+            )
+        except ValueError as exc:
+            logging.warning(
+                "Zeitplan %s kann nicht geladen werden: %s",
+                sch_id,
+                exc,
+            )
+            return None
+        start_dt = datetime.combine(first_occurrence, datetime.min.time()).replace(
+            hour=h, minute=m, second=s
+        )
+    start_dt = _ensure_local_timezone(start_dt)
+    end_dt = datetime.combine(end_date, datetime.max.time()) if end_date else None
+    end_dt = _ensure_local_timezone(end_dt)
+    return CronTrigger(
+        day=day_of_month,
+        hour=h,
+        minute=m,
+        second=s,
+        start_date=start_dt,
+        end_date=end_dt,
+        timezone=LOCAL_TZ,
+    )
+
+
+# Zeilen kommen nach repeat sortiert; pro Gruppe wird der Builder einmal gewählt.
+_SCHEDULE_TRIGGER_BUILDERS: Dict[str, Callable[..., Any]] = {
+    "once": _build_once_trigger,
+    "daily": _build_daily_trigger,
+    "monthly": _build_monthly_trigger,
+}
+
+
+# Zuletzt eingeplante Zeitpläne: ID → Signatur aus Zeile, Misfire-Puffer und Zeitzone.
+# Beim Neuladen werden nur Jobs mit geänderter Signatur ersetzt.
+_loaded_schedule_jobs: Dict[int, Tuple[Any, ...]] = {}
+
+
+def _schedule_job_signature(sch, misfire_grace_seconds) -> Tuple[Any, ...]:
+    return (
+        sch["repeat"],
+        sch["time"],
+        sch["start_date"],
+        sch["end_date"],
+        sch["day_of_month"],
+        misfire_grace_seconds,
+        str(LOCAL_TZ),
+    )
+
+
+def _remove_schedule_job(sch_id) -> None:
+    _loaded_schedule_jobs.pop(sch_id, None)
+    try:
+        scheduler.remove_job(str(sch_id))
+    except JobLookupError:
+        pass
 
 
 def load_schedules():
@@ -4263,7 +5694,6 @@ def load_schedules():
     except Exception:
         auto_reboot_job_existed = False
 
-    scheduler.remove_all_jobs()
     # Misfire-Puffer: Default 60 s, optional via Settings-Key 'scheduler_misfire_grace_time'.
     raw_misfire_value = get_setting("scheduler_misfire_grace_time")
     default_grace_seconds = 60
@@ -4276,140 +5706,109 @@ def load_schedules():
             default_grace_seconds,
         )
         misfire_grace_seconds = default_grace_seconds
+    # Stichtag einmal bestimmen statt die Systemuhr pro Zeile abzufragen
+    today = date.today()
     with get_db_connection() as (conn, cursor):
-        cursor.execute("SELECT * FROM schedules")
+        cursor.execute(_LOAD_SCHEDULES_SQL, (today.strftime(_DATE_FORMAT),))
         schedules = [dict(row) for row in cursor.fetchall()]
-    for sch in schedules:
-        sch_id = sch["id"]
-        time_str = sch["time"]
-        repeat = sch["repeat"]
-        executed = sch["executed"]
-        if executed:
-            continue
-        try:
-            start_date = parse_schedule_date(sch["start_date"])
-            end_date = parse_schedule_date(sch["end_date"])
-            if repeat != "once" and end_date and end_date < datetime.now().date():
-                logging.info(
-                    "Zeitplan %s endet am %s und wird nicht geladen",
-                    sch_id,
-                    end_date,
-                )
+    current_ids = {sch["id"] for sch in schedules}
+    for stale_id in [
+        sch_id for sch_id in _loaded_schedule_jobs if sch_id not in current_ids
+    ]:
+        _remove_schedule_job(stale_id)
+    for repeat, group in itertools.groupby(schedules, key=lambda row: row["repeat"]):
+        build_trigger = _SCHEDULE_TRIGGER_BUILDERS.get(repeat)
+        for sch in group:
+            sch_id = sch["id"]
+            time_str = sch["time"]
+            signature = _schedule_job_signature(sch, misfire_grace_seconds)
+            # Unveränderte Zeitpläne behalten ihren Job, sofern er noch existiert
+            # (einmalige Jobs entfernt APScheduler nach der Ausführung selbst).
+            if (
+                _loaded_schedule_jobs.get(sch_id) == signature
+                and scheduler.get_job(str(sch_id)) is not None
+            ):
                 continue
-            if repeat == "once":
-                run_dt = parse_once_datetime(time_str)
-                run_time = _to_local_aware(run_dt)
-                if run_time is None:
-                    logging.warning(
-                        "Zeitplan %s besitzt keine gültige lokale Ausführungszeit (%s)",
-                        sch_id,
-                        time_str,
-                    )
-                    continue
-                trigger = DateTrigger(run_date=run_time)
-            elif repeat == "daily":
-                h, m, s = [int(part) for part in time_str.split(":")]
-                start_dt = (
-                    datetime.combine(start_date, datetime.min.time()).replace(
-                        hour=h, minute=m, second=s
-                    )
-                    if start_date
-                    else None
-                )
-                start_dt = _ensure_local_timezone(start_dt)
-                end_dt = (
-                    datetime.combine(end_date, datetime.max.time())
-                    if end_date
-                    else None
-                )
-                end_dt = _ensure_local_timezone(end_dt)
-                trigger = CronTrigger(
-                    hour=h,
-                    minute=m,
-                    second=s,
-                    start_date=start_dt,
-                    end_date=end_dt,
-                    timezone=LOCAL_TZ,
-                )
-            elif repeat == "monthly":
-                h, m, s = [int(part) for part in time_str.split(":")]
-                raw_day_of_month = sch["day_of_month"]
-                if raw_day_of_month is None and start_date:
-                    raw_day_of_month = start_date.day
-                try:
-                    day_of_month = int(raw_day_of_month)
-                except (TypeError, ValueError):
-                    logging.warning(
-                        "Zeitplan %s besitzt keinen gültigen Tag im Monat und wird übersprungen",
-                        sch_id,
-                    )
-                    continue
-                if not 1 <= day_of_month <= 31:
-                    logging.warning(
-                        "Zeitplan %s hat einen ungültigen Tag im Monat (%s)",
+            _remove_schedule_job(sch_id)
+            if build_trigger is None:
+                logging.warning(f"Unbekannter Repeat-Typ {repeat} für Schedule {sch_id}")
+                continue
+            try:
+                start_date = parse_schedule_date(sch["start_date"])
+                end_date = parse_schedule_date(sch["end_date"])
+                if repeat != "once" and end_date and end_date < today:
+                    logging.info(
+                        "Zeitplan %s endet am %s und wird nicht geladen",
                         sch_id,
-                        day_of_month,
+                        end_date,
                     )
                     continue
-                start_dt = None
-                if start_date:
-                    try:
-                        first_occurrence = calculate_first_monthly_occurrence(
-                            start_date, day_of_month
-                        )
-                    except ValueError as exc:
-                        logging.warning(
-                            "Zeitplan %s kann nicht geladen werden: %s",
-                            sch_id,
-                            exc,
-                        )
-                        continue
-                    start_dt = datetime.combine(
-                        first_occurrence, datetime.min.time()
-                    ).replace(hour=h, minute=m, second=s)
-                start_dt = _ensure_local_timezone(start_dt)
-                end_dt = (
-                    datetime.combine(end_date, datetime.max.time()) if end_date else None
+                trigger = build_trigger(sch, start_date, end_date)
+                if trigger is None:
+                    continue
+                scheduler.add_job(
+                    schedule_job,
+                    trigger,
+                    args=[sch_id],
+                    misfire_grace_time=misfire_grace_seconds,
+                    id=str(sch_id),
                 )
-                end_dt = _ensure_local_timezone(end_dt)
-                trigger = CronTrigger(
-                    day=day_of_month,
-                    hour=h,
-                    minute=m,
-                    second=s,
-                    start_date=start_dt,
-                    end_date=end_dt,
-                    timezone=LOCAL_TZ,
+                _loaded_schedule_jobs[sch_id] = signature
+                display_time = (
+                    _format_schedule_time_for_display(time_str, repeat)
+                    if repeat == "once"
+                    else time_str
                 )
-            else:
-                logging.warning(f"Unbekannter Repeat-Typ {repeat} für Schedule {sch_id}")
-                continue
-            scheduler.add_job(
-                schedule_job,
-                trigger,
-                args=[sch_id],
-                misfire_grace_time=misfire_grace_seconds,
-                id=str(sch_id),
-            )
-            display_time = (
-                _format_schedule_time_for_display(time_str, repeat)
-                if repeat == "once"
-                else time_str
-            )
-            logging.info(
-                "Geplanter Job %s: Repeat=%s, Time=%s, Misfire-Grace=%s",
-                sch_id,
-                repeat,
-                display_time,
-                misfire_grace_seconds,
-            )
-        except ValueError:
-            logging.warning(f"Ungültige Zeit {time_str} für Schedule {sch_id}")
+                logging.info(
+                    "Geplanter Job %s: Repeat=%s, Time=%s, Misfire-Grace=%s",
+                    sch_id,
+                    repeat,
+                    display_time,
+                    misfire_grace_seconds,
+                )
+            except ValueError:
+                logging.warning(f"Ungültige Zeit {time_str} für Schedule {sch_id}")
 
     if auto_reboot_job_existed:
         update_auto_reboot_job()
 
 
+DATABASE_MAINTENANCE_JOB_ID = "database_maintenance"
+DATABASE_MAINTENANCE_INTERVAL_MINUTES = 5
+
+
+def run_database_maintenance() -> None:
+    """Gibt freie Seiten frei und setzt das WAL zurück, damit beide nicht anwachsen."""
+
+    try:
+        with get_db_connection() as (_conn, cursor):
+            cursor.execute(
+                f"PRAGMA incremental_vacuum({SQLITE_INCREMENTAL_VACUUM_PAGES})"
+            )
+            cursor.fetchall()
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            busy, log_frames, checkpointed = cursor.fetchone()
+    except sqlite3.Error as exc:
+        logging.warning("Datenbank-Wartung fehlgeschlagen: %s", exc)
+        return
+    logging.debug(
+        "WAL-Checkpoint: busy=%s, Frames=%s, übernommen=%s",
+        busy,
+        log_frames,
+        checkpointed,
+    )
+
+
+def _schedule_database_maintenance_job() -> None:
+    scheduler.add_job(
+        run_database_maintenance,
+        IntervalTrigger(minutes=DATABASE_MAINTENANCE_INTERVAL_MINUTES),
+        id=DATABASE_MAINTENANCE_JOB_ID,
+        replace_existing=True,
+        coalesce=True,
+    )
+
+
 def start_background_services(*, force: bool = False) -> bool:
     """Startet Scheduler und abhängige Hintergrundaufgaben idempotent."""
 
@@ -4429,6 +5828,7 @@ def start_background_services(*, force: bool = False) -> bool:
         skip_past_once_schedules()
         load_schedules()
         update_auto_reboot_job()
+        _schedule_database_maintenance_job()
 
         try:
             if not getattr(scheduler, "running", False):
@@ -4448,8 +5848,7 @@ def start_background_services(*, force: bool = False) -> bool:
         if force:
             _stop_bt_audio_monitor_thread()
             _stop_button_monitor()
-        _start_bluetooth_auto_accept_thread()
-        _start_bt_audio_monitor_thread()
+        _start_bluetooth_background_worker()
         _start_button_monitor()
 
     return True
@@ -4458,8 +5857,6 @@ def start_background_services(*, force: bool = False) -> bool:
 def _shutdown_audio_runtime() -> None:
     """Beendet die pygame-Audioengine sauber beim Prozessende."""
 
-    global is_paused
-
     if pygame is None or not pygame_imported:
         return
 
@@ -4487,7 +5884,7 @@ def _shutdown_audio_runtime() -> None:
         except Exception:
             logging.debug("pygame.quit() beim Shutdown fehlgeschlagen.", exc_info=True)
 
-    is_paused = False
+    _playback_paused.clear()
 
 
 def stop_background_services(*, wait: bool = False) -> bool:
@@ -4517,6 +5914,7 @@ def stop_background_services(*, wait: bool = False) -> bool:
     if helpers_were_active:
         _stop_bt_audio_monitor_thread()
         _stop_button_monitor()
+        _bluetooth_agent_session.stop()
 
     _shutdown_audio_runtime()
 
@@ -4546,16 +5944,39 @@ def _notify_missing_pactl() -> None:
         g._pactl_missing_notified = True
 
 
+_RESOLVED_EXECUTABLES: Dict[str, str] = {}
+
+
+def _resolve_executable(name: str) -> Optional[str]:
+    """Liefert den absoluten Programmpfad; nur Treffer werden gecacht."""
+
+    cached = _RESOLVED_EXECUTABLES.get(name)
+    if cached is not None:
+        return cached
+    resolved = shutil.which(name)
+    if resolved is not None:
+        _RESOLVED_EXECUTABLES[name] = resolved
+    return resolved
+
+
 def _run_pactl_command(*args: str) -> Optional[str]:
     """Führt einen pactl-Befehl aus und fängt häufige Fehler ab."""
 
     command = ["pactl", *args]
+    # pactl wird vom Audio-Monitor alle paar Sekunden gestartet: Pfad nur
+    # einmal auflösen und die fd-Schließschleife sparen (Python-eigene
+    # Deskriptoren sind ohnehin nicht vererbbar, PEP 446).
+    spawn_options: Dict[str, Any] = {"close_fds": False}
+    executable = _resolve_executable("pactl")
+    if executable is not None:
+        spawn_options["executable"] = executable
     try:
         result = subprocess.run(
             command,
             check=True,
             capture_output=True,
             text=True,
+            **spawn_options,
         )
     except FileNotFoundError:
         _notify_missing_pactl()
@@ -4731,35 +6152,62 @@ def _enforce_bluetooth_volume_cap_for_sink(
     return True
 
 
-def _list_bluetooth_sinks() -> List[str]:
-    sinks_output = _run_pactl_command("list", "short", "sinks")
-    if sinks_output is None:
-        return []
+def _parse_bluetooth_sinks(sinks_output: Optional[str]) -> List[Tuple[str, str]]:
+    """Liefert (Index, Name) aller bluez-Sinks aus ``pactl list short sinks``."""
 
-    sink_names: List[str] = []
+    if not sinks_output:
+        return []
+    sinks: List[Tuple[str, str]] = []
     for line in sinks_output.splitlines():
         parts = line.split()
         if len(parts) < 2:
             continue
         if "bluez" in parts[1]:
-            sink_names.append(parts[1])
-    return sink_names
+            sinks.append((parts[0], parts[1]))
+    return sinks
+
+
+def _pulse_bluetooth_sinks(pulse) -> List[Tuple[str, str]]:
+    """Liefert (Index, Name) aller bluez-Sinks über eine libpulse-Verbindung."""
+
+    return [
+        (str(sink.index), sink.name)
+        for sink in pulse.sink_list()
+        if "bluez" in sink.name
+    ]
+
+
+def _bluetooth_sinks() -> Optional[List[Tuple[str, str]]]:
+    """bluez-Sinks über libpulse, ersatzweise über ``pactl``; ``None`` bei Fehler."""
+
+    sinks = _pulse_call(_pulse_bluetooth_sinks)
+    if sinks is not _PULSE_UNAVAILABLE:
+        return sinks
+    sinks_output = _run_pactl_command("list", "short", "sinks")
+    if sinks_output is None:
+        return None
+    return _parse_bluetooth_sinks(sinks_output)
 
 
-def _enforce_bluetooth_volume_cap(cap: BluetoothVolumeCap) -> None:
+def _list_bluetooth_sinks() -> List[str]:
+    return [name for _index, name in _bluetooth_sinks() or []]
+
+
+def _enforce_bluetooth_volume_cap(
+    cap: BluetoothVolumeCap, sink_names: Optional[Iterable[str]] = None
+) -> None:
     if cap.percent >= 100 and cap.headroom_db <= 0:
         return
 
-    for sink_name in _list_bluetooth_sinks():
+    if sink_names is None:
+        sink_names = _list_bluetooth_sinks()
+    for sink_name in sink_names:
         _enforce_bluetooth_volume_cap_for_sink(sink_name, cap)
 
 
 def is_bt_connected():
     """Prüft, ob ein Bluetooth-Gerät verbunden ist."""
-    sinks_output = _run_pactl_command("list", "short", "sinks")
-    if sinks_output is None:
-        return False
-    return any("bluez" in line for line in sinks_output.splitlines())
+    return bool(_bluetooth_sinks())
 
 
 def resume_bt_audio():
@@ -4767,16 +6215,14 @@ def resume_bt_audio():
     if not pygame_available:
         _notify_audio_unavailable("Bluetooth-Wiedergabe kann nicht reaktiviert werden")
         return
-    sinks_output = _run_pactl_command("list", "short", "sinks")
-    if sinks_output is None:
+    bluetooth_sinks = _bluetooth_sinks()
+    if bluetooth_sinks is None:
         return False
-
-    sink_lines = [line for line in sinks_output.splitlines() if "bluez" in line]
-    if not sink_lines:
+    if not bluetooth_sinks:
         logging.info("Kein Bluetooth-Sink zum Resume gefunden")
         return False
 
-    bt_sink = sink_lines[0].split()[1]
+    bt_sink = bluetooth_sinks[0][1]
     previous_detection = audio_status.get("dac_sink_detected")
     cap = get_bluetooth_volume_cap_percent()
     if cap.percent < 100 or cap.headroom_db > 0:
@@ -4791,9 +6237,16 @@ def resume_bt_audio():
 
 def load_loopback():
     """Aktiviert PulseAudio-Loopback von der Bluetooth-Quelle zum DAC."""
-    modules_output = _run_pactl_command("list", "short", "modules")
-    if modules_output is None:
-        return False
+    modules = _pulse_call(
+        lambda pulse: [
+            f"{module.name}\t{module.argument or ''}" for module in pulse.module_list()
+        ]
+    )
+    if modules is _PULSE_UNAVAILABLE:
+        modules_output = _run_pactl_command("list", "short", "modules")
+        if modules_output is None:
+            return False
+        modules = modules_output.splitlines()
 
     target_sink = (
         _resolve_sink_name(DAC_SINK)
@@ -4807,28 +6260,40 @@ def load_loopback():
         )
         return False
 
-    for mod in modules_output.splitlines():
+    for mod in modules:
         if "module-loopback" in mod and target_sink in mod:
             logging.info("Loopback bereits aktiv")
             return True
 
-    sources_output = _run_pactl_command("list", "short", "sources")
-    if sources_output is None:
-        return False
-
-    sources = [line for line in sources_output.splitlines() if "bluez" in line]
+    sources = _pulse_call(
+        lambda pulse: [
+            source.name for source in pulse.source_list() if "bluez" in source.name
+        ]
+    )
+    if sources is _PULSE_UNAVAILABLE:
+        sources_output = _run_pactl_command("list", "short", "sources")
+        if sources_output is None:
+            return False
+        sources = [
+            line.split()[1]
+            for line in sources_output.splitlines()
+            if "bluez" in line and len(line.split()) >= 2
+        ]
     if not sources:
         logging.info("Kein Bluetooth-Source für Loopback gefunden")
         return False
 
-    bt_source = sources[0].split()[1]
-    load_result = _run_pactl_command(
-        "load-module",
-        "module-loopback",
-        f"source={bt_source}",
-        f"sink={target_sink}",
-        "latency_msec=30",
-    )
+    bt_source = sources[0]
+    loopback_args = (f"source={bt_source}", f"sink={target_sink}", "latency_msec=30")
+    try:
+        load_result = _pulse_call(
+            lambda pulse: pulse.module_load("module-loopback", " ".join(loopback_args))
+        )
+    except pulsectl.PulseError as exc:
+        logging.warning("Loopback konnte nicht geladen werden: %s", exc)
+        return False
+    if load_result is _PULSE_UNAVAILABLE:
+        load_result = _run_pactl_command("load-module", "module-loopback", *loopback_args)
     if load_result is None:
         return False
 
@@ -4839,54 +6304,206 @@ def load_loopback():
 # --- Bluetooth Audio Monitor (A2DP-Sink Erkennung & Verstärkersteuerung) ---
 _bt_audio_monitor_thread: Optional[threading.Thread] = None
 _bt_audio_monitor_stop_event: Optional[threading.Event] = None
+_bt_auto_accept_pending = False
+_bt_auto_accept_pending_lock = threading.Lock()
 
 
-def is_bt_audio_active():
-    # Prüft, ob ein Bluetooth-Audio-Stream anliegt (A2DP)
-    sinks_output = _run_pactl_command("list", "short", "sinks")
-    if sinks_output is None:
-        return False
+def _pulse_bluetooth_audio_state(pulse) -> Tuple[bool, List[str]]:
+    bluetooth_sinks = {
+        sink.index: sink.name for sink in pulse.sink_list() if "bluez" in sink.name
+    }
+    if not bluetooth_sinks:
+        return False, []
+    active = any(
+        sink_input.sink in bluetooth_sinks for sink_input in pulse.sink_input_list()
+    )
+    return active, list(bluetooth_sinks.values())
 
-    bluetooth_sink_ids = set()
-    bluetooth_sink_names = set()
-    for line in sinks_output.splitlines():
-        parts = line.split()
-        if len(parts) < 2:
-            continue
-        index, name = parts[0], parts[1]
-        if "bluez" in name:
-            bluetooth_sink_ids.add(index)
-            bluetooth_sink_names.add(name)
 
-    if not bluetooth_sink_ids and not bluetooth_sink_names:
-        return False
+def _bluetooth_audio_state() -> Tuple[bool, List[str]]:
+    """Ermittelt A2DP-Aktivität und bluez-Sinks mit höchstens zwei pactl-Aufrufen.
+
+    Der Audio-Monitor nutzt die Sink-Liste desselben Durchlaufs auch für die
+    Lautstärkebegrenzung, statt ``list short sinks`` erneut aufzurufen. Mit
+    pulsectl laufen beide Abfragen über die bestehende libpulse-Verbindung.
+    """
+
+    pulse_state = _pulse_call(_pulse_bluetooth_audio_state)
+    if pulse_state is not _PULSE_UNAVAILABLE:
+        return pulse_state
+
+    bluetooth_sinks = _parse_bluetooth_sinks(
+        _run_pactl_command("list", "short", "sinks")
+    )
+    if not bluetooth_sinks:
+        return False, []
+
+    bluetooth_sink_ids = {index for index, _name in bluetooth_sinks}
+    bluetooth_sink_names = [name for _index, name in bluetooth_sinks]
+    # Namen nur als ganzes Feld vergleichen: ein Teilstring-Treffer würde etwa
+    # "bluez_sink.x" auch in "bluez_sink.x.monitor" finden.
+    bluetooth_sink_name_set = set(bluetooth_sink_names)
 
     sink_inputs_output = _run_pactl_command("list", "short", "sink-inputs")
     if sink_inputs_output is None:
-        return False
+        return False, bluetooth_sink_names
 
     for sink_input in sink_inputs_output.splitlines():
         parts = sink_input.split()
         if len(parts) < 2:
             continue
 
-        sink_id = parts[1]
-        if sink_id in bluetooth_sink_ids:
-            return True
+        if parts[1] in bluetooth_sink_ids:
+            return True, bluetooth_sink_names
+
+        if not bluetooth_sink_name_set.isdisjoint(parts[2:]):
+            return True, bluetooth_sink_names
+    return False, bluetooth_sink_names
+
+
+def is_bt_audio_active():
+    # Prüft, ob ein Bluetooth-Audio-Stream anliegt (A2DP)
+    active, _sink_names = _bluetooth_audio_state()
+    return active
+
+
+_BT_MONITOR_POLL_SECONDS = 3
+_BT_MONITOR_RESUBSCRIBE_SECONDS = 3
+# Relevante Zeilen von "pactl subscribe", z. B. "Event 'new' on sink-input #51"
+_PACTL_SUBSCRIBE_EVENT_RE = re.compile(
+    r"^Event '(?:new|remove|change)' on (?:sink-input|sink) #\d+"
+)
+# Sicherheits-Timeout für event_listen(), falls ein Stopp-Signal eintrifft,
+# bevor libpulse seine Ereignisschleife betreten hat.
+_BT_MONITOR_EVENT_LISTEN_TIMEOUT_SECONDS = 30
+_bt_audio_monitor_subscription: Optional[Any] = None
+
+
+class _PulseEventSubscription:
+    """Sink- und Sink-Input-Ereignisse über eine eigene libpulse-Verbindung.
+
+    Bietet dieselbe Schnittstelle wie der ``pactl subscribe``-Prozess
+    (``stdout``, ``poll``, ``terminate``, ``wait``) und liefert Zeilen im
+    pactl-Format, kommt aber ohne Hilfsprozess und Textausgabe aus. Die
+    Verbindung ist getrennt von ``_pulse_client``, da ``event_listen()``
+    blockiert.
+    """
+
+    def __init__(self, pulse) -> None:
+        self._pulse = pulse
+        self._events: deque = deque()
+        self._closed = False
+        self._started = False
+        pulse.event_mask_set("sink", "sink_input")
+        pulse.event_callback_set(self._on_event)
+
+    def _on_event(self, event) -> None:
+        # pulsectl-Enums haben kein __str__; der Klartext steht in ``_value``.
+        facility = event.facility._value.replace("_", "-")
+        self._events.append(
+            f"Event '{event.t._value}' on {facility} #{event.index}\n"
+        )
+        raise pulsectl.PulseLoopStop
+
+    @property
+    def stdout(self):
+        self._started = True
+        return self._lines()
+
+    def _lines(self):
+        try:
+            while not self._closed:
+                try:
+                    self._pulse.event_listen(
+                        timeout=_BT_MONITOR_EVENT_LISTEN_TIMEOUT_SECONDS
+                    )
+                except Exception as exc:
+                    logging.warning("libpulse-Ereignisverbindung getrennt: %s", exc)
+                    break
+                while self._events:
+                    yield self._events.popleft()
+        finally:
+            self._closed = True
+            self._pulse.close()
+
+    def poll(self) -> Optional[int]:
+        return 0 if self._closed else None
+
+    def terminate(self) -> None:
+        self._closed = True
+        self._pulse.event_listen_stop()
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if not self._started:
+            self._pulse.close()
+        return 0
+
+
+def _open_pulse_event_subscription() -> Optional[Any]:
+    """Abonniert PulseAudio-Ereignisse per libpulse, sonst per ``pactl subscribe``."""
+
+    if PULSECTL_AVAILABLE:
+        pulse = None
+        try:
+            pulse = pulsectl.Pulse("audio-pi-monitor")
+            return _PulseEventSubscription(pulse)
+        except Exception as exc:
+            if pulse is not None:
+                pulse.close()
+            logging.info(
+                "libpulse-Ereignisse nicht verfügbar, verwende pactl subscribe: %s", exc
+            )
+    return _open_pactl_subscription()
+
+
+def _open_pactl_subscription() -> Optional[subprocess.Popen]:
+    executable = _resolve_executable("pactl") or "pactl"
+    try:
+        return subprocess.Popen(
+            [executable, "subscribe"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+    except (FileNotFoundError, OSError, ValueError) as exc:
+        logging.info(
+            "pactl subscribe nicht verfügbar, Bluetooth-Audio-Monitor pollt: %s", exc
+        )
+        return None
+
+
+def _terminate_pactl_subscription(process: Optional[subprocess.Popen]) -> None:
+    if process is None or process.poll() is not None:
+        return
+    try:
+        process.terminate()
+        process.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        process.kill()
+    except OSError:
+        logging.debug("pactl subscribe konnte nicht beendet werden", exc_info=True)
+
 
-        if any(name in sink_input for name in bluetooth_sink_names):
-            return True
-    return False
 def bt_audio_monitor(stop_event: Optional[threading.Event] = None) -> None:
+    """Schaltet die Endstufe passend zu A2DP-Streams.
+
+    Mit ``stop_event`` (Hintergrund-Thread) reagiert der Monitor auf
+    PulseAudio-Ereignisse für Sinks und Sink-Inputs (libpulse oder
+    ``pactl subscribe``) und pollt nur, wenn keine Subscription möglich ist.
+    """
+
+    global _bt_audio_monitor_subscription
+
     was_active = False
-    while True:
-        if stop_event is not None and stop_event.is_set():
-            break
 
-        active = is_bt_audio_active()
+    def refresh() -> None:
+        nonlocal was_active
+        active, bluetooth_sink_names = _bluetooth_audio_state()
         if active:
             cap = get_bluetooth_volume_cap_percent()
-            _enforce_bluetooth_volume_cap(cap)
+            _enforce_bluetooth_volume_cap(cap, bluetooth_sink_names)
         if active and not was_active:
             activate_amplifier()
             was_active = True
@@ -4896,11 +6513,47 @@ def bt_audio_monitor(stop_event: Optional[threading.Event] = None) -> None:
             was_active = False
             logging.info("Bluetooth Audio gestoppt, Verstärker AUS")
 
-        if stop_event is not None:
-            if stop_event.wait(3):
-                break
-        else:
-            time.sleep(3)
+    def stopped() -> bool:
+        return stop_event is not None and stop_event.is_set()
+
+    subscribe = stop_event is not None
+    while not stopped():
+        refresh()
+        if stopped():
+            break
+
+        process = _open_pulse_event_subscription() if subscribe else None
+        if process is None:
+            subscribe = False
+            if stop_event is not None:
+                if stop_event.wait(_BT_MONITOR_POLL_SECONDS):
+                    break
+            else:
+                time.sleep(_BT_MONITOR_POLL_SECONDS)
+            continue
+
+        _bt_audio_monitor_subscription = process
+        try:
+            # Zustand nach dem Abonnieren erneut prüfen, damit kein Ereignis
+            # zwischen erster Abfrage und Subscription verloren geht.
+            if not stopped():
+                refresh()
+                for line in process.stdout:
+                    if stopped():
+                        break
+                    if _PACTL_SUBSCRIBE_EVENT_RE.match(line):
+                        refresh()
+        finally:
+            _bt_audio_monitor_subscription = None
+            _terminate_pactl_subscription(process)
+
+        if stopped():
+            break
+        logging.warning(
+            "pactl subscribe beendet, Bluetooth-Audio-Monitor abonniert erneut."
+        )
+        if stop_event.wait(_BT_MONITOR_RESUBSCRIBE_SECONDS):
+            break
 
     if was_active:
         deactivate_amplifier()
@@ -4917,23 +6570,62 @@ def _start_bluetooth_auto_accept_thread() -> None:
     thread.start()
 
 
-def _start_bt_audio_monitor_thread() -> None:
+def _claim_pending_bluetooth_auto_accept() -> bool:
+    global _bt_auto_accept_pending
+
+    with _bt_auto_accept_pending_lock:
+        pending = _bt_auto_accept_pending
+        _bt_auto_accept_pending = False
+    return pending
+
+
+def _bluetooth_background_worker(stop_event: threading.Event) -> None:
+    """Führt Auto-Accept und Audio-Monitor nacheinander in einem Thread aus."""
+
+    if _claim_pending_bluetooth_auto_accept():
+        try:
+            bluetooth_auto_accept()
+        except Exception:
+            logging.exception("Bluetooth Auto-Accept im Hintergrund fehlgeschlagen")
+    if stop_event.is_set():
+        return
+    bt_audio_monitor(stop_event=stop_event)
+
+
+def _start_bluetooth_background_worker() -> None:
+    """Startet Auto-Accept und Audio-Monitor gemeinsam in einem Thread.
+
+    Läuft der Monitor bereits, erhält Auto-Accept wie bisher einen eigenen,
+    kurzlebigen Thread.
+    """
+
+    global _bt_auto_accept_pending
+
+    with _bt_auto_accept_pending_lock:
+        _bt_auto_accept_pending = True
+    started = _start_bt_audio_monitor_thread()
+    if not started and _claim_pending_bluetooth_auto_accept():
+        _start_bluetooth_auto_accept_thread()
+
+
+def _start_bt_audio_monitor_thread() -> bool:
     global _bt_audio_monitor_thread, _bt_audio_monitor_stop_event
 
     existing = _bt_audio_monitor_thread
     if existing and existing.is_alive():
-        return
+        return False
 
     stop_event = threading.Event()
     _bt_audio_monitor_stop_event = stop_event
     thread = threading.Thread(
-        target=bt_audio_monitor,
-        kwargs={"stop_event": stop_event},
+        target=_bluetooth_background_worker,
+        args=(stop_event,),
         name="bt-audio-monitor",
         daemon=True,
     )
     _bt_audio_monitor_thread = thread
     thread.start()
+    return True
 
 
 def _stop_bt_audio_monitor_thread(timeout: float = 2.0) -> None:
@@ -4946,6 +6638,8 @@ def _stop_bt_audio_monitor_thread(timeout: float = 2.0) -> None:
     stop_event = _bt_audio_monitor_stop_event
     if stop_event is not None:
         stop_event.set()
+    # Blockierendes Warten auf PulseAudio-Ereignisse beenden
+    _terminate_pactl_subscription(_bt_audio_monitor_subscription)
 
     thread.join(timeout=timeout)
 
@@ -4960,7 +6654,17 @@ def _stop_bt_audio_monitor_thread(timeout: float = 2.0) -> None:
 
 # AP-Modus
 def has_network():
-    return "default" in subprocess.getoutput("ip route")
+    try:
+        result = subprocess.run(
+            ["ip", "route", "show", "default"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError as exc:
+        logging.warning("Routing-Tabelle konnte nicht gelesen werden: %s", exc)
+        return False
+    return "default" in (result.stdout or "")
 
 
 def _handle_systemctl_failure(action: str, service: str, exit_code: int) -> None:
@@ -5042,7 +6746,9 @@ def login():
         with get_db_connection() as (conn, cursor):
             cursor.execute("SELECT * FROM users WHERE username=?", (username,))
             user_data = cursor.fetchone()
-        if user_data and check_password_hash(user_data["password"], password):
+        stored_hash = user_data["password"] if user_data else None
+        if verify_password_or_dummy(stored_hash, password):
+            _rehash_password_if_needed(user_data["id"], user_data["password"], password)
             user_columns = set(user_data.keys())
             must_change_value = (
                 user_data["must_change_password"]
@@ -5063,6 +6769,22 @@ def login():
     return render_template("login.html", next_value=next_param)
 
 
+def _rehash_password_if_needed(user_id: int, stored_hash: str, password: str) -> None:
+    """Migriert Altbestands-Hashes nach erfolgreichem Login auf Argon2."""
+
+    if not password_needs_rehash(stored_hash):
+        return
+    try:
+        run_write_transaction(
+            lambda _conn, cursor: cursor.execute(
+                "UPDATE users SET password=? WHERE id=? AND password=?",
+                (hash_password(password), user_id, stored_hash),
+            )
+        )
+    except sqlite3.Error as exc:
+        logging.warning("Passworthash konnte nicht migriert werden: %s", exc)
+
+
 @app.route("/logout", methods=["POST"], endpoint="logout_route")
 @login_required
 def logout():
@@ -5070,6 +6792,28 @@ def logout():
     return redirect(url_for("login"))
 
 
+_DASHBOARD_SCHEDULES_SQL = """
+    SELECT
+        s.id,
+        CASE WHEN s.item_type='file' THEN f.filename ELSE p.name END as name,
+        s.time,
+        s.repeat,
+        s.delay,
+        s.item_type,
+        s.executed,
+        s.start_date,
+        s.end_date,
+        s.day_of_month,
+        f.duration_seconds AS file_duration,
+        s.volume_percent
+    FROM schedules s
+    LEFT JOIN audio_files f ON s.item_id = f.id AND s.item_type='file'
+    LEFT JOIN playlists p ON s.item_id = p.id AND s.item_type='playlist'
+    ORDER BY s.time
+"""
+_DASHBOARD_SCHEDULES_PAGE_SQL = _DASHBOARD_SCHEDULES_SQL + " LIMIT ? OFFSET ?"
+
+
 def _build_dashboard_context():
     file_page_size = _parse_page_size(request.args.get("file_page_size"))
     schedule_page_size = _parse_page_size(request.args.get("schedule_page_size"))
@@ -5077,31 +6821,22 @@ def _build_dashboard_context():
     schedule_page_number = _parse_page_number(request.args.get("schedule_page"))
 
     with get_db_connection() as (conn, cursor):
-        cursor.execute("SELECT COUNT(*) FROM audio_files")
-        files_total_count = cursor.fetchone()[0]
+        # Die vollständige Dateiliste wird ohnehin für die Auswahlfelder gebraucht;
+        # Anzahl und aktuelle Seite ergeben sich daraus ohne weitere Abfragen.
+        cursor.execute(
+            "SELECT id, filename, duration_seconds FROM audio_files ORDER BY filename"
+        )
+        files_all = [dict(row) for row in cursor.fetchall()]
+        files_total_count = len(files_all)
         files_meta = _compute_pagination_meta(
             files_total_count, file_page_number, file_page_size
         )
         if files_meta["limit"] is None:
-            cursor.execute(
-                "SELECT id, filename, duration_seconds FROM audio_files ORDER BY filename"
-            )
+            files_page_items = files_all
         else:
-            cursor.execute(
-                """
-                SELECT id, filename, duration_seconds
-                FROM audio_files
-                ORDER BY filename
-                LIMIT ? OFFSET ?
-                """,
-                (files_meta["limit"], files_meta["offset"]),
-            )
-        files_page_items = [dict(row) for row in cursor.fetchall()]
-
-        cursor.execute(
-            "SELECT id, filename, duration_seconds FROM audio_files ORDER BY filename"
-        )
-        files_all = [dict(row) for row in cursor.fetchall()]
+            files_page_items = files_all[
+                files_meta["offset"] : files_meta["offset"] + files_meta["limit"]
+            ]
 
         cursor.execute("SELECT id, name FROM playlists ORDER BY name")
         playlists_all = [dict(row) for row in cursor.fetchall()]
@@ -5111,30 +6846,11 @@ def _build_dashboard_context():
         schedules_meta = _compute_pagination_meta(
             schedules_total_count, schedule_page_number, schedule_page_size
         )
-        schedule_query = """
-            SELECT
-                s.id,
-                CASE WHEN s.item_type='file' THEN f.filename ELSE p.name END as name,
-                s.time,
-                s.repeat,
-                s.delay,
-                s.item_type,
-                s.executed,
-                s.start_date,
-                s.end_date,
-                s.day_of_month,
-                f.duration_seconds AS file_duration,
-                s.volume_percent
-            FROM schedules s
-            LEFT JOIN audio_files f ON s.item_id = f.id AND s.item_type='file'
-            LEFT JOIN playlists p ON s.item_id = p.id AND s.item_type='playlist'
-            ORDER BY s.time
-        """
         if schedules_meta["limit"] is None:
-            cursor.execute(schedule_query)
+            cursor.execute(_DASHBOARD_SCHEDULES_SQL)
         else:
             cursor.execute(
-                schedule_query + " LIMIT ? OFFSET ?",
+                _DASHBOARD_SCHEDULES_PAGE_SQL,
                 (schedules_meta["limit"], schedules_meta["offset"]),
             )
         schedule_rows = cursor.fetchall()
@@ -5687,6 +7403,46 @@ def handle_request_entity_too_large(error):
     )
 
 
+UPLOAD_COPY_CHUNK_SIZE = 1 << 20
+
+
+def _save_uploaded_file(file, target_path: Path) -> None:
+    """Schreibt einen Upload nach ``target_path``.
+
+    Größere Uploads puffert Werkzeug in einer echten Temporärdatei; diese wird
+    per ``os.sendfile`` im Kernel kopiert. Speicherpuffer (BytesIO, noch nicht
+    ausgelagerte ``SpooledTemporaryFile``) oder ein fehlschlagendes
+    ``sendfile`` fallen auf ``FileStorage.save`` mit großen Blöcken zurück.
+    """
+
+    stream = file.stream
+    sendfile = getattr(os, "sendfile", None)
+    source_fd = None
+    # fileno() würde eine SpooledTemporaryFile erst auf die SD-Karte auslagern.
+    if getattr(stream, "_rolled", True):
+        try:
+            source_fd = stream.fileno()
+            start_offset = stream.tell()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            source_fd = None
+    if sendfile is not None and source_fd is not None:
+        try:
+            with open(target_path, "wb") as target:
+                offset = start_offset
+                while True:
+                    sent = sendfile(
+                        target.fileno(), source_fd, offset, UPLOAD_COPY_CHUNK_SIZE
+                    )
+                    if not sent:
+                        break
+                    offset += sent
+            return
+        except OSError as exc:
+            logging.debug("sendfile für Upload nicht möglich, kopiere blockweise: %s", exc)
+            stream.seek(start_offset)
+    file.save(str(target_path), buffer_size=UPLOAD_COPY_CHUNK_SIZE)
+
+
 @app.route("/upload", methods=["POST"])
 @login_required
 def upload():
@@ -5749,10 +7505,9 @@ def upload():
 
         for message in flash_messages:
             flash(message)
-        file.save(str(file_path))
+        _save_uploaded_file(file, file_path)
         try:
-            sound = AudioSegment.from_file(str(file_path))
-            duration_seconds = len(sound) / 1000.0
+            duration_seconds = _probe_audio_duration(str(file_path))
         except Exception as exc:
             logging.error("Fehler beim Auslesen der Audiodauer von %s: %s", filename, exc)
             try:
@@ -5767,6 +7522,7 @@ def upload():
                 (filename, duration_seconds),
             )
             conn.commit()
+        _prewarm_normalized_audio(str(file_path))
         return redirect(url_for("index"))
     flash("Dateiformat wird nicht unterstützt")
     return redirect(url_for("index"))
@@ -5775,25 +7531,28 @@ def upload():
 @app.route("/delete/<int:file_id>", methods=["POST"])
 @login_required
 def delete(file_id):
-    with get_db_connection() as (conn, cursor):
+    def _delete_rows(_conn, cursor):
         cursor.execute(
             "SELECT filename, duration_seconds FROM audio_files WHERE id=?",
             (file_id,),
         )
         row = cursor.fetchone()
         if not row:
-            flash("Datei nicht gefunden")
-            return redirect(url_for("index"))
-        filename = row["filename"]
-        file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-        if os.path.exists(file_path):
-            os.remove(file_path)
+            return None
         cursor.execute("DELETE FROM audio_files WHERE id=?", (file_id,))
-        cursor.execute("DELETE FROM playlist_files WHERE file_id=?", (file_id,))
         cursor.execute(
             "DELETE FROM schedules WHERE item_id=? AND item_type='file'", (file_id,)
         )
-        conn.commit()
+        return row["filename"]
+
+    filename = run_write_transaction(_delete_rows)
+    if filename is None:
+        flash("Datei nicht gefunden")
+        return redirect(url_for("index"))
+    file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
+    if os.path.exists(file_path):
+        os.remove(file_path)
+    _remove_normalized_audio_cache(file_path)
     flash("Datei gelöscht")
     return redirect(url_for("index"))
 
@@ -5829,16 +7588,14 @@ def add_to_playlist():
         flash("Ungültige Playlist- oder Datei-ID.")
         return redirect(url_for("index"))
 
-    with get_db_connection() as (conn, cursor):
+    def _insert_entry(_conn, cursor):
         cursor.execute("SELECT 1 FROM playlists WHERE id=?", (playlist_id,))
         if cursor.fetchone() is None:
-            flash("Playlist wurde nicht gefunden.")
-            return redirect(url_for("index"))
+            return "missing_playlist", None
 
         cursor.execute("SELECT 1 FROM audio_files WHERE id=?", (file_id,))
         if cursor.fetchone() is None:
-            flash("Audiodatei wurde nicht gefunden.")
-            return redirect(url_for("index"))
+            return "missing_file", None
 
         cursor.execute(
             "SELECT COALESCE(MAX(position), -1) FROM playlist_files WHERE playlist_id=?",
@@ -5860,19 +7617,29 @@ def add_to_playlist():
                 (playlist_id, file_id, next_position),
             )
         except sqlite3.IntegrityError as exc:
-            conn.rollback()
-            error_message = str(exc)
-            sqlite_errorname = getattr(exc, "sqlite_errorname", "") or ""
-            if "UNIQUE" in error_message.upper() or sqlite_errorname == "SQLITE_CONSTRAINT_UNIQUE":
-                flash("Diese Datei ist bereits in der Playlist vorhanden.")
-            else:
-                flash(
-                    "Datei konnte nicht zur Playlist hinzugefügt werden: "
-                    f"{error_message}"
-                )
-            return redirect(url_for("index"))
-
-        conn.commit()
+            return "integrity", exc
+        return "inserted", None
+
+    # Positionsermittlung und INSERT unter derselben Schreibsperre, damit
+    # parallele Anfragen keine doppelten Positionen vergeben.
+    insert_result, integrity_error = run_write_transaction(_insert_entry)
+    if insert_result == "missing_playlist":
+        flash("Playlist wurde nicht gefunden.")
+        return redirect(url_for("index"))
+    if insert_result == "missing_file":
+        flash("Audiodatei wurde nicht gefunden.")
+        return redirect(url_for("index"))
+    if insert_result == "integrity":
+        error_message = str(integrity_error)
+        sqlite_errorname = getattr(integrity_error, "sqlite_errorname", "") or ""
+        if "UNIQUE" in error_message.upper() or sqlite_errorname == "SQLITE_CONSTRAINT_UNIQUE":
+            flash("Diese Datei ist bereits in der Playlist vorhanden.")
+        else:
+            flash(
+                "Datei konnte nicht zur Playlist hinzugefügt werden: "
+                f"{error_message}"
+            )
+        return redirect(url_for("index"))
 
     flash("Datei zur Playlist hinzugefügt")
     return redirect(url_for("index"))
@@ -5881,13 +7648,13 @@ def add_to_playlist():
 @app.route("/delete_playlist/<int:playlist_id>", methods=["POST"])
 @login_required
 def delete_playlist(playlist_id):
-    with get_db_connection() as (conn, cursor):
+    def _delete_rows(_conn, cursor):
         cursor.execute("DELETE FROM playlists WHERE id=?", (playlist_id,))
-        cursor.execute("DELETE FROM playlist_files WHERE playlist_id=?", (playlist_id,))
         cursor.execute(
             "DELETE FROM schedules WHERE item_id=? AND item_type='playlist'", (playlist_id,)
         )
-        conn.commit()
+
+    run_write_transaction(_delete_rows)
     flash("Playlist gelöscht")
     return redirect(url_for("index"))
 
@@ -5918,29 +7685,29 @@ def play_now(item_type, item_id):
 @app.route("/toggle_pause", methods=["POST"])
 @login_required
 def toggle_pause():
-    global is_paused
     if not pygame_available:
         _notify_audio_unavailable("Pausenstatus kann nicht geändert werden")
         return redirect(url_for("index"))
-    if pygame.mixer.music.get_busy() or is_paused:
-        if is_paused:
-            pygame.mixer.music.unpause()
-            is_paused = False
-            logging.info("Wiedergabe fortgesetzt")
-        else:
-            pygame.mixer.music.pause()
-            is_paused = True
-            logging.info("Wiedergabe pausiert")
+    with _pause_toggle_lock:
+        paused = _playback_paused.is_set()
+        if paused or pygame.mixer.music.get_busy():
+            music = pygame.mixer.music
+            action, update_flag, message = {
+                True: (music.unpause, _playback_paused.clear, "Wiedergabe fortgesetzt"),
+                False: (music.pause, _playback_paused.set, "Wiedergabe pausiert"),
+            }[paused]
+            action()
+            update_flag()
+            logging.info(message)
     return redirect(url_for("index"))
 
 
 def _perform_stop_playback(*, flash_user: bool) -> bool:
-    global is_paused
     if not pygame_available:
         _notify_audio_unavailable("Wiedergabe kann nicht gestoppt werden")
         return False
     pygame.mixer.music.stop()
-    is_paused = False
+    _playback_paused.clear()
     if not is_bt_connected():
         deactivate_amplifier()
     logging.info("Wiedergabe gestoppt")
@@ -6068,9 +7835,9 @@ def set_relay_invert():
     set_setting("relay_invert", "1" if RELAY_INVERT else "0")
     update_amp_levels()
     if amplifier_claimed:
-        _set_amp_output(AMP_ON_LEVEL, keep_claimed=True)
+        _set_amp_output(AMP_ON_LEVEL, keep_claimed=True, force=True)
     else:
-        _set_amp_output(AMP_OFF_LEVEL, keep_claimed=False)
+        _set_amp_output(AMP_OFF_LEVEL, keep_claimed=False, force=True)
     flash("Relais-Logik invertiert" if RELAY_INVERT else "Relais-Logik normal")
     return redirect(url_for("index"))
 
@@ -6670,10 +8437,8 @@ def add_schedule():
         if repeat == "once":
             time_only = dt.isoformat(timespec="seconds")
         else:
-            time_only = dt.strftime("%H:%M:%S")
-            if not validate_time(time_only):
-                flash("Ungültiges Zeitformat")
-                return redirect(url_for("index"))
+            # strftime auf einem gültigen datetime liefert stets HH:MM:SS.
+            time_only = dt.strftime(_TIME_FORMAT)
     except ValueError:
         flash("Ungültiges Datums-/Zeitformat")
         return redirect(url_for("index"))
@@ -6685,14 +8450,14 @@ def add_schedule():
         end_date_dt = None
         if repeat != "once":
             if start_date_input:
-                start_date_dt = datetime.strptime(start_date_input, "%Y-%m-%d").date()
+                start_date_dt = _parse_iso_date(start_date_input)
             else:
                 start_date_dt = dt.date()
             start_date_value = start_date_dt.isoformat()
             if repeat == "daily":
                 first_occurrence_date = start_date_dt
             if end_date_input:
-                end_date_dt = datetime.strptime(end_date_input, "%Y-%m-%d").date()
+                end_date_dt = _parse_iso_date(end_date_input)
                 if end_date_dt < start_date_dt:
                     flash("Enddatum darf nicht vor dem Startdatum liegen")
                     return redirect(url_for("index"))
@@ -6755,13 +8520,13 @@ def add_schedule():
         "day_of_month": day_of_month_value,
     }
 
-    with get_db_connection() as (conn, cursor):
+    if first_occurrence_date is None and repeat != "once":
+        first_occurrence_date = parse_schedule_date(start_date_value)
+
+    def _insert_schedule(_conn, cursor):
         duration_seconds = _get_item_duration(cursor, item_type, item_id)
         if duration_seconds is None:
-            flash("Ausgewähltes Element existiert nicht mehr.")
-            return redirect(url_for("index"))
-        if first_occurrence_date is None and repeat != "once":
-            first_occurrence_date = parse_schedule_date(start_date_value)
+            return "missing"
         if first_occurrence_date is not None:
             if _has_schedule_conflict(
                 cursor,
@@ -6769,8 +8534,7 @@ def add_schedule():
                 duration_seconds,
                 first_occurrence_date,
             ):
-                flash("Zeitplan überschneidet sich mit einer bestehenden Wiedergabe")
-                return redirect(url_for("index"))
+                return "conflict"
         cursor.execute(
             """
             INSERT INTO schedules (
@@ -6799,7 +8563,15 @@ def add_schedule():
                 volume_percent,
             ),
         )
-        conn.commit()
+        return "inserted"
+
+    insert_result = run_write_transaction(_insert_schedule)
+    if insert_result == "missing":
+        flash("Ausgewähltes Element existiert nicht mehr.")
+        return redirect(url_for("index"))
+    if insert_result == "conflict":
+        flash("Zeitplan überschneidet sich mit einer bestehenden Wiedergabe")
+        return redirect(url_for("index"))
     if getattr(scheduler, "running", False):
         load_schedules()
     else:
@@ -6811,9 +8583,9 @@ def add_schedule():
 @app.route("/delete_schedule/<int:sch_id>", methods=["POST"])
 @login_required
 def delete_schedule(sch_id):
-    with get_db_connection() as (conn, cursor):
-        cursor.execute("DELETE FROM schedules WHERE id=?", (sch_id,))
-        conn.commit()
+    run_write_transaction(
+        lambda _conn, cursor: cursor.execute("DELETE FROM schedules WHERE id=?", (sch_id,))
+    )
     if getattr(scheduler, "running", False):
         load_schedules()
     else:
@@ -7025,6 +8797,170 @@ def _run_wpa_cli(
     return stdout
 
 
+WPA_CTRL_DIR = os.environ.get("AUDIO_PI_WPA_CTRL_DIR", "/var/run/wpa_supplicant")
+# Antwort-Socket im RuntimeDirectory der Unit: /tmp ist wegen PrivateTmp=yes
+# für wpa_supplicant nicht erreichbar.
+WPA_CTRL_REPLY_DIR = (
+    os.environ.get("RUNTIME_DIRECTORY", "").split(":")[0] or "/run/audio-pi"
+)
+_WPA_CTRL_TIMEOUT_SECONDS = 5.0
+_WPA_CTRL_REPLY_SIZE = 4096
+
+
+class _WpaControlSession:
+    """Eine Verbindung zum Control-Socket von wpa_supplicant für mehrere Befehle.
+
+    Ersetzt die Kette einzelner ``sudo wpa_cli``-Aufrufe; der Zugriff setzt die
+    Gruppe ``netdev`` voraus, die der Installer dem Dienstnutzer zuweist.
+    """
+
+    def __init__(self, interface: str):
+        self._ctrl_path = os.path.join(WPA_CTRL_DIR, interface)
+        self._local_path = os.path.join(
+            WPA_CTRL_REPLY_DIR, f"wpa-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        )
+        self._sock: Optional[socket.socket] = None
+
+    def __enter__(self) -> "_WpaControlSession":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.settimeout(_WPA_CTRL_TIMEOUT_SECONDS)
+            sock.bind(self._local_path)
+            sock.connect(self._ctrl_path)
+        except OSError:
+            sock.close()
+            self._unlink_local()
+            raise
+        self._sock = sock
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self._unlink_local()
+
+    def _unlink_local(self) -> None:
+        try:
+            os.unlink(self._local_path)
+        except FileNotFoundError:
+            pass
+
+    def request(self, command: str) -> str:
+        assert self._sock is not None
+        self._sock.send(command.encode("utf-8"))
+        return self.receive()
+
+    def receive(self) -> str:
+        assert self._sock is not None
+        return self._sock.recv(_WPA_CTRL_REPLY_SIZE).decode("utf-8", "replace").strip()
+
+    def drain(self) -> None:
+        """Verwirft bereits eingetroffene, verspätete Antworten."""
+
+        assert self._sock is not None
+        self._sock.setblocking(False)
+        try:
+            while True:
+                self._sock.recv(_WPA_CTRL_REPLY_SIZE)
+        except BlockingIOError:
+            pass
+        finally:
+            self._sock.settimeout(_WPA_CTRL_TIMEOUT_SECONDS)
+
+
+def _find_unconfigured_wpa_network(session: _WpaControlSession) -> Optional[str]:
+    """Ermittelt per ``LIST_NETWORKS`` ein frisch angelegtes, noch leeres Netz.
+
+    ADD_NETWORK vergibt die höchste ID und legt das Netz ohne SSID an; ist die
+    Antwort verloren gegangen, lässt es sich so dennoch wieder entfernen.
+    Eine verspätet eintreffende ADD_NETWORK-Antwort darf dabei nicht als
+    Netzliste gelesen werden.
+    """
+
+    session.drain()
+    reply = session.request("LIST_NETWORKS")
+    if not reply.startswith("network id"):
+        reply = session.receive()
+    rows = reply.splitlines()[1:]
+    networks = [row.split("\t") for row in rows]
+    networks = [fields for fields in networks if fields[0].isdigit()]
+    if not networks:
+        return None
+    newest = max(networks, key=lambda fields: int(fields[0]))
+    if len(newest) > 1 and newest[1]:
+        return None
+    return newest[0]
+
+
+def _configure_wlan_via_control_socket(
+    wifi_interface: str, network_fields: Sequence[Tuple[str, str]]
+) -> Optional[bool]:
+    """Legt das WLAN-Netz über den Control-Socket an.
+
+    ``None``: Socket nicht nutzbar, der Aufrufer fällt auf ``wpa_cli`` zurück.
+    ``True``/``False``: Konfiguration erfolgreich bzw. fehlgeschlagen.
+    """
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    with ExitStack() as stack:
+        try:
+            session = stack.enter_context(_WpaControlSession(wifi_interface))
+        except OSError as exc:
+            logging.debug(
+                "wpa_supplicant-Control-Socket nicht nutzbar, verwende wpa_cli: %s", exc
+            )
+            return None
+        net_id: Optional[str] = None
+        try:
+            try:
+                net_id = session.request("ADD_NETWORK")
+            except OSError as exc:
+                # Transportfehler vor angelegtem Netz: wpa_cli übernimmt. Ein trotz
+                # verlorener Antwort angelegtes Netz wird vorher wieder entfernt.
+                logging.warning(
+                    "wpa_supplicant antwortet nicht auf ADD_NETWORK, verwende wpa_cli: %s",
+                    exc,
+                )
+                try:
+                    orphan_id = _find_unconfigured_wpa_network(session)
+                    if orphan_id is not None:
+                        session.request(f"REMOVE_NETWORK {orphan_id}")
+                except OSError as cleanup_error:
+                    logging.warning(
+                        "Aufräumen nach ADD_NETWORK fehlgeschlagen: %s", cleanup_error
+                    )
+                return None
+            if not net_id.isdigit():
+                raise RuntimeError(f"ADD_NETWORK lieferte '{net_id}'")
+            commands = [
+                f"SET_NETWORK {net_id} {field} {value}" for field, value in network_fields
+            ]
+            commands.extend([f"ENABLE_NETWORK {net_id}", "SAVE_CONFIG", "RECONFIGURE"])
+            for command in commands:
+                reply = session.request(command)
+                if reply != "OK":
+                    # Befehl ohne Werte protokollieren, damit keine Passphrase im Log landet.
+                    raise RuntimeError(f"{command.split(' ', 2)[0]} lieferte '{reply}'")
+            return True
+        except (OSError, RuntimeError) as exc:
+            logging.error("Fehler beim WLAN-Verbindungsaufbau über wpa_supplicant: %s", exc)
+            if net_id and net_id.isdigit():
+                try:
+                    session.request(f"REMOVE_NETWORK {net_id}")
+                    logging.info(
+                        "Unvollständiges WLAN-Netzwerk %s nach Fehler entfernt.", net_id
+                    )
+                except OSError as cleanup_error:
+                    logging.warning(
+                        "Aufräumen des WLAN-Netzwerks %s fehlgeschlagen: %s",
+                        net_id,
+                        cleanup_error,
+                    )
+            return False
+
+
 @app.route("/wlan_connect", methods=["POST"])
 @login_required
 def wlan_connect():
@@ -7054,6 +8990,22 @@ def wlan_connect():
             )
             return redirect(url_for("index"))
     wifi_interface = get_wifi_interface()
+    network_fields: List[Tuple[str, str]] = [("ssid", formatted_ssid)]
+    if is_open_network:
+        network_fields.extend([("key_mgmt", "NONE"), ("auth_alg", "OPEN")])
+    else:
+        psk_value = raw_password if is_hex_psk else _quote_wpa_cli(raw_password)
+        network_fields.append(("psk", psk_value))
+
+    socket_result = _configure_wlan_via_control_socket(wifi_interface, network_fields)
+    if socket_result is not None:
+        if socket_result:
+            _invalidate_wlan_status_cache()
+            flash("Versuche, mit WLAN zu verbinden")
+        else:
+            flash("Fehler beim WLAN-Verbindungsaufbau. Details im Log einsehbar.")
+        return redirect(url_for("index"))
+
     base_cmd = privileged_command("wpa_cli", "-i", wifi_interface)
     net_id: Optional[str] = None
 
@@ -7064,19 +9016,12 @@ def wlan_connect():
 
     try:
         net_id = _run_wpa_cli(base_cmd + ["add_network"], expect_ok=False).strip()
-        _run_wpa_cli(base_cmd + ["set_network", net_id, "ssid", formatted_ssid])
-        if is_open_network:
-            _run_wpa_cli(base_cmd + ["set_network", net_id, "key_mgmt", "NONE"])
-            _run_wpa_cli(base_cmd + ["set_network", net_id, "auth_alg", "OPEN"])
-        else:
-            if is_hex_psk:
-                psk_value = raw_password
-            else:
-                psk_value = _quote_wpa_cli(raw_password)
-            _run_wpa_cli(base_cmd + ["set_network", net_id, "psk", psk_value])
+        for field, value in network_fields:
+            _run_wpa_cli(base_cmd + ["set_network", net_id, field, value])
         _run_wpa_cli(base_cmd + ["enable_network", net_id])
         _run_wpa_cli(base_cmd + ["save_config"])
         _run_wpa_cli(base_cmd + ["reconfigure"])
+        _invalidate_wlan_status_cache()
         flash("Versuche, mit WLAN zu verbinden")
     except FileNotFoundError as e:
         logging.error("wpa_cli nicht gefunden oder nicht ausführbar: %s", e)
@@ -7156,9 +9101,13 @@ def set_volume():
             commands.append(["pactl", "set-sink-volume", sink_for_pactl, f"{int_vol}%"])
         else:
             logging.info("Überspringe pactl-Aufruf, da kein Sink verfügbar ist.")
-        if is_sudo_disabled():
+        persistence_queued = is_sudo_disabled()
+        if persistence_queued:
+            # --no-block: systemd reiht den Job nur ein, alsactl läuft ohne
+            # den Request aufzuhalten; fehlende Unit/Rechte melden sich sofort.
+            # Ob alsactl store gelingt, steht erst nach dem Request fest.
             persistent_command = privileged_command(
-                "systemctl", "start", "audio-pi-alsactl.service"
+                "systemctl", "start", "--no-block", "audio-pi-alsactl.service"
             )
             logging.debug(
                 "Persistente Lautstärke wird über systemctl start audio-pi-alsactl.service ausgelöst."
@@ -7234,7 +9183,12 @@ def set_volume():
         flash("Fehler beim Setzen der Lautstärke")
     else:
         if audio_command_success:
-            if persistence_success:
+            if persistence_success and persistence_queued:
+                logging.info(
+                    f"Lautstärke auf {int_vol}% gesetzt, Speicherung über audio-pi-alsactl.service eingereiht"
+                )
+                flash("Lautstärke gesetzt, Speicherung wird im Hintergrund ausgeführt")
+            elif persistence_success:
                 logging.info(f"Lautstärke auf {int_vol}% gesetzt (persistent)")
                 flash("Lautstärke persistent gesetzt")
                 if info_on_missing_pygame and has_request_context():
@@ -7257,25 +9211,29 @@ def _read_log_tail(path: Path, *, max_bytes: int, max_lines: int) -> Tuple[List[
     effective_max_bytes = max_bytes if max_bytes > 0 else DEFAULT_LOG_VIEW_MAX_BYTES
     effective_max_lines = max_lines if max_lines > 0 else DEFAULT_LOG_VIEW_MAX_LINES
 
-    file_size = path.stat().st_size
     truncated = False
     start_offset = 0
 
-    if file_size > effective_max_bytes:
-        truncated = True
-        start_offset = file_size - effective_max_bytes
-
-    with path.open("rb") as handle:
-        if start_offset:
-            handle.seek(start_offset)
-        data = handle.read()
+    # Größe und Inhalt über denselben Deskriptor lesen, damit ein zwischen
+    # stat() und open() rotierendes Log keine inkonsistente Ansicht erzeugt.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        file_size = os.fstat(fd).st_size
+        if file_size > effective_max_bytes:
+            truncated = True
+            start_offset = file_size - effective_max_bytes
+        data = os.pread(fd, file_size - start_offset, start_offset)
+        partial_first_line = bool(start_offset) and os.pread(
+            fd, 1, start_offset - 1
+        ) not in (b"\n", b"\r")
+    finally:
+        os.close(fd)
 
     text = data.decode("utf-8", errors="replace")
     lines = text.splitlines()
 
-    if start_offset and data[:1] not in (b"\n", b"\r"):
-        if lines:
-            lines = lines[1:]
+    if partial_first_line and lines:
+        lines = lines[1:]
 
     if len(lines) > effective_max_lines:
         truncated = True
@@ -7286,6 +9244,25 @@ def _read_log_tail(path: Path, *, max_bytes: int, max_lines: int) -> Tuple[List[
     return lines, truncated
 
 
+# Gecachte Log-Seiten enthalten ein CSRF-Token (Logout-Formular); das ETag
+# wechselt deshalb spätestens nach diesem Zeitfenster.
+_LOG_VIEW_ETAG_WINDOW_SECONDS = 1800
+
+
+def _log_view_etag(log_path: Path, max_bytes: int, max_lines: int) -> str:
+    try:
+        stat_result = os.stat(log_path)
+    except OSError:
+        file_marker = "missing"
+    else:
+        file_marker = f"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"
+    token_window = int(time.time() // _LOG_VIEW_ETAG_WINDOW_SECONDS)
+    return (
+        f"{file_marker}-{max_bytes:x}-{max_lines:x}-"
+        f"{current_user.get_id()}-{token_window:x}"
+    )
+
+
 @app.route("/logs")
 @login_required
 def logs():
@@ -7293,6 +9270,15 @@ def logs():
     max_bytes = int(current_app.config.get("LOG_VIEW_MAX_BYTES", DEFAULT_LOG_VIEW_MAX_BYTES))
     max_lines = int(current_app.config.get("LOG_VIEW_MAX_LINES", DEFAULT_LOG_VIEW_MAX_LINES))
 
+    etag = _log_view_etag(log_path, max_bytes, max_lines)
+    # Unverändertes Log: weder lesen noch rendern. Ausstehende Flash-Meldungen
+    # erzwingen trotzdem eine frische Seite, damit sie angezeigt werden.
+    if request.if_none_match.contains_weak(etag) and not session.get("_flashes"):
+        not_modified = make_response("", 304)
+        not_modified.set_etag(etag, weak=True)
+        not_modified.headers["Cache-Control"] = "private, no-cache"
+        return not_modified
+
     missing_file = False
     truncated = False
     log_lines: List[str]
@@ -7314,18 +9300,46 @@ def logs():
         )
         log_lines = []
 
-    return render_template(
-        "logs.html",
-        logs=log_lines,
-        missing_file=missing_file,
-        truncated=truncated,
-        max_lines=max_lines,
-        max_bytes=max_bytes,
-        max_bytes_label=f"{max_bytes / 1024:.1f}",
-        log_path=str(log_path),
+    response = make_response(
+        render_template(
+            "logs.html",
+            logs=log_lines,
+            missing_file=missing_file,
+            truncated=truncated,
+            max_lines=max_lines,
+            max_bytes=max_bytes,
+            max_bytes_label=f"{max_bytes / 1024:.1f}",
+            log_path=str(log_path),
+        )
+    )
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+@app.route("/logs/raw")
+@login_required
+def logs_raw():
+    log_path = Path(current_app.config.get("LOG_VIEW_FILE", DEFAULT_LOG_FILE_NAME))
+    if not log_path.is_file():
+        flash("Keine Logdatei vorhanden.")
+        return redirect(url_for("logs"))
+    # send_file mit conditional=True beantwortet unveränderte Abrufe mit 304
+    # und überlässt die Übertragung dem WSGI-File-Wrapper (sendfile).
+    return send_file(
+        log_path.resolve(),
+        mimetype="text/plain",
+        conditional=True,
+        max_age=0,
     )
 
 
+_SELECT_USER_PASSWORD_SQL = "SELECT password FROM users WHERE id=?"
+_UPDATE_USER_PASSWORD_SQL = (
+    "UPDATE users SET password=?, must_change_password=0 WHERE id=? AND password=?"
+)
+
+
 @app.route("/change_password", methods=["GET", "POST"])
 @login_required
 def change_password():
@@ -7336,27 +9350,40 @@ def change_password():
         if not old_pass or not new_pass:
             flash("Altes und neues Passwort sind erforderlich.")
             return redirect(url_for("change_password"))
-        if not new_pass or len(new_pass) < 8:
+        user_id = current_user.id
+        with get_db_connection() as (conn, cursor):
+            cursor.execute(_SELECT_USER_PASSWORD_SQL, (user_id,))
+            result = cursor.fetchone()
+        stored_hash = result["password"] if result else None
+        old_password_valid = verify_password_or_dummy(stored_hash, old_pass)
+        # Der neue Hash wird immer berechnet und die Längenprüfung folgt erst
+        # nach der Prüfung des alten Passworts, damit die Antwortzeit nicht
+        # verrät, welcher Zweig genommen wurde.
+        new_hashed = hash_password(new_pass)
+        if not old_password_valid:
+            flash("Falsches altes Passwort")
+            return render_template("change_password.html", force_change=force_change)
+        if len(new_pass) < 8:
             flash("Neues Passwort zu kurz")
             return render_template("change_password.html", force_change=force_change)
-        if new_pass == old_pass:
+        if hmac.compare_digest(new_pass.encode(), old_pass.encode()):
             flash("Neues Passwort muss sich vom alten unterscheiden")
             return render_template("change_password.html", force_change=force_change)
-        with get_db_connection() as (conn, cursor):
-            cursor.execute("SELECT password FROM users WHERE id=?", (current_user.id,))
-            result = cursor.fetchone()
-            if result and check_password_hash(result["password"], old_pass):
-                new_hashed = generate_password_hash(new_pass)
-                cursor.execute(
-                    "UPDATE users SET password=?, must_change_password=0 WHERE id=?",
-                    (new_hashed, current_user.id),
-                )
-                conn.commit()
-                current_user.must_change_password = False
-                flash("Passwort geändert")
-            else:
-                flash("Falsches altes Passwort")
-                return render_template("change_password.html", force_change=force_change)
+        # Hashing läuft außerhalb der Schreibsperre; das UPDATE greift nur,
+        # wenn der Hash seit dem Lesen nicht von anderer Seite geändert wurde.
+        password_updated = bool(
+            run_write_transaction(
+                lambda _conn, cursor: cursor.execute(
+                    _UPDATE_USER_PASSWORD_SQL,
+                    (new_hashed, user_id, stored_hash),
+                ).rowcount
+            )
+        )
+        if not password_updated:
+            flash("Falsches altes Passwort")
+            return render_template("change_password.html", force_change=force_change)
+        current_user.must_change_password = False
+        flash("Passwort geändert")
         return redirect(url_for("index"))
     return render_template("change_password.html", force_change=force_change)
 
@@ -7569,6 +9596,90 @@ def _start_boot_rtc_sync_thread(*, force: bool = False) -> bool:
         return True
 
 
+class _SingleFlightTask:
+    """Führt eine Aufgabe in einem Hintergrund-Thread aus, nie parallel.
+
+    Weitere Startversuche während eines laufenden Durchlaufs schließen sich
+    diesem an, statt die Aufgabe ein zweites Mal zu starten.
+    """
+
+    def __init__(self, name: str, target: Callable[[], Any]):
+        self.name = name
+        self._target = target
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._done = threading.Event()
+        self._done.set()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def running(self) -> bool:
+        return not self._done.is_set()
+
+    def start(self) -> bool:
+        with self._lock:
+            if self.running:
+                return False
+            self._done.clear()
+            self.result = None
+            self.error = None
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def _run(self) -> None:
+        try:
+            self.result = self._target()
+        except Exception as exc:  # pragma: no cover - Schutz für Hintergrund-Threads
+            logging.exception("Hintergrundaufgabe %s fehlgeschlagen: %s", self.name, exc)
+            self.error = exc
+        finally:
+            self._done.set()
+
+
+_TIMESYNC_REQUEST_WAIT_ENV = "AUDIO_PI_TIMESYNC_REQUEST_WAIT_SECONDS"
+_DEFAULT_TIMESYNC_REQUEST_WAIT_SECONDS = 10.0
+
+
+def _run_time_sync_task():
+    success, messages = perform_internet_time_sync()
+    for message in messages:
+        logging.info("Internet-Zeitsync: %s", message)
+    return success, messages
+
+
+_TIME_SYNC_TASK = _SingleFlightTask("internet-time-sync", _run_time_sync_task)
+
+
+def _request_internet_time_sync() -> Tuple[Optional[bool], List[str]]:
+    """Startet den Internet-Zeitsync im Hintergrund und wartet begrenzt darauf.
+
+    Liefert ``(None, [...])``, wenn der Sync nach der Wartezeit noch läuft; die
+    Anfrage blockiert dann nicht weiter und das Ergebnis landet im Log.
+    """
+
+    if not _TIME_SYNC_TASK.start():
+        logging.info("Internet-Zeitsync läuft bereits, Anfrage schließt sich an")
+    wait_seconds = _parse_float_env_with_min(
+        _TIMESYNC_REQUEST_WAIT_ENV, _DEFAULT_TIMESYNC_REQUEST_WAIT_SECONDS, minimum=0.0
+    )
+    if not _TIME_SYNC_TASK.wait(wait_seconds):
+        return None, [
+            "Zeit-Synchronisation läuft im Hintergrund, das Ergebnis wird protokolliert"
+        ]
+    result = _TIME_SYNC_TASK.result
+    if not result:
+        return False, ["Fehler bei der Synchronisation"]
+    success, messages = result
+    return success, list(messages)
+
+
 def perform_internet_time_sync():
     refresh_local_timezone()
     success = False
@@ -7934,10 +10045,10 @@ def set_time():
         sync_requested = sync_checkbox or bool(request.form.get("sync_internet_action"))
         set_setting(TIME_SYNC_INTERNET_SETTING_KEY, "1" if sync_checkbox else "0")
         if sync_requested:
-            sync_success, messages = perform_internet_time_sync()
+            sync_success, messages = _request_internet_time_sync()
             for message in messages:
                 flash(message)
-            if not sync_success:
+            if sync_success is False:
                 return redirect(url_for("set_time"))
             return redirect(url_for("index"))
         if not time_str:
@@ -8027,30 +10138,164 @@ def save_rtc_settings():
     return redirect(url_for("set_time"))
 
 
+def _wants_json_response() -> bool:
+    accept = request.accept_mimetypes
+    return accept.accept_json and not accept.accept_html
+
+
+def _accepted_job_response(job_id: str):
+    """202-Antwort mit Verweis auf den Status-Endpunkt eines Hintergrundjobs."""
+
+    status_url = url_for("job_status", job_id=job_id)
+    response = make_response({"job": job_id, "status_url": status_url}, 202)
+    response.headers["Location"] = status_url
+    return response
+
+
 @app.route("/sync_time_from_internet", methods=["POST"])
 @login_required
 def sync_time_from_internet():
-    _, messages = perform_internet_time_sync()
+    if _wants_json_response():
+        _TIME_SYNC_TASK.start()
+        return _accepted_job_response("time_sync")
+    _, messages = _request_internet_time_sync()
     for message in messages:
         flash(message)
     return redirect(url_for("index"))
 
 
-@app.route("/update", methods=["POST"])
-@login_required
-def update():
+_UPDATE_LOCK = threading.Lock()
+_UPDATE_TIMEOUT_SECONDS = 120
+_update_repository: Optional["pygit2.Repository"] = None
+
+
+def _get_update_repository() -> Optional["pygit2.Repository"]:
+    global _update_repository
+    if _update_repository is None:
+        repo_path = pygit2.discover_repository(
+            os.path.dirname(os.path.abspath(__file__))
+        )
+        if repo_path is None:
+            return None
+        _update_repository = pygit2.Repository(repo_path)
+    return _update_repository
+
+
+def _update_repository_with_pygit2() -> bool:
+    """Fetch + Fast-Forward im Prozess per libgit2.
+
+    Gibt ``False`` zurück, wenn pygit2 fehlt oder scheitert; der Aufrufer
+    nutzt dann ``git pull --ff-only``. Muss unter ``_UPDATE_LOCK`` laufen.
+    """
+
+    if not PYGIT2_AVAILABLE:
+        return False
+    try:
+        repo = _get_update_repository()
+        if repo is None or repo.head_is_detached:
+            return False
+        branch = repo.branches.local[repo.head.shorthand]
+        upstream = branch.upstream
+        if upstream is None:
+            return False
+        repo.remotes[upstream.remote_name].fetch()
+        target = repo.branches.remote[upstream.shorthand].target
+        analysis, _ = repo.merge_analysis(target)
+        if analysis & pygit2.GIT_MERGE_ANALYSIS_UP_TO_DATE:
+            return True
+        if not analysis & pygit2.GIT_MERGE_ANALYSIS_FASTFORWARD:
+            logging.warning("Update per pygit2: kein Fast-Forward möglich")
+            return False
+        repo.checkout_tree(repo.get(target))
+        repo.head.set_target(target)
+    except (pygit2.GitError, KeyError, ValueError) as exc:
+        logging.warning("Update per pygit2 fehlgeschlagen, nutze git-CLI: %s", exc)
+        return False
+    return True
+
+
+_UPDATE_REQUEST_WAIT_ENV = "AUDIO_PI_UPDATE_REQUEST_WAIT_SECONDS"
+_DEFAULT_UPDATE_REQUEST_WAIT_SECONDS = 10.0
+
+
+def _perform_update() -> Tuple[bool, List[str]]:
+    # Single-Flight: parallele Klicks starten keinen zweiten git-Prozess.
+    if not _UPDATE_LOCK.acquire(blocking=False):
+        return False, ["Update läuft bereits"]
     try:
-        subprocess.check_call(["git", "pull"])
-        flash("Update erfolgreich")
+        if not _update_repository_with_pygit2():
+            subprocess.run(
+                ["git", "pull", "--ff-only"],
+                check=True,
+                capture_output=True,
+                text=True,
+                timeout=_UPDATE_TIMEOUT_SECONDS,
+            )
+        return True, ["Update erfolgreich"]
     except FileNotFoundError as e:
         logging.error(f"Git nicht gefunden: {e}")
-        flash("git nicht verfügbar")
+        return False, ["git nicht verfügbar"]
     except subprocess.CalledProcessError as e:
-        logging.error(f"Update fehlgeschlagen: {e}")
-        flash("Update fehlgeschlagen")
+        stderr_text = e.stderr.strip() if isinstance(e.stderr, str) else ""
+        logging.error("Update fehlgeschlagen: %s%s", e, f" ({stderr_text})" if stderr_text else "")
+        return False, ["Update fehlgeschlagen"]
+    except subprocess.TimeoutExpired as e:
+        logging.error("Update abgebrochen (Zeitüberschreitung): %s", e)
+        return False, ["Update fehlgeschlagen (Zeitüberschreitung)"]
+    finally:
+        _UPDATE_LOCK.release()
+
+
+_UPDATE_TASK = _SingleFlightTask("repository-update", _perform_update)
+_BACKGROUND_JOBS: Dict[str, _SingleFlightTask] = {
+    "time_sync": _TIME_SYNC_TASK,
+    "update": _UPDATE_TASK,
+}
+
+
+@app.route("/update", methods=["POST"])
+@login_required
+def update():
+    already_running = _UPDATE_TASK.running or _UPDATE_LOCK.locked()
+    if _wants_json_response():
+        if not already_running:
+            _UPDATE_TASK.start()
+        return _accepted_job_response("update")
+    if already_running:
+        flash("Update läuft bereits")
+        return redirect(url_for("index"))
+    _UPDATE_TASK.start()
+    wait_seconds = _parse_float_env_with_min(
+        _UPDATE_REQUEST_WAIT_ENV, _DEFAULT_UPDATE_REQUEST_WAIT_SECONDS, minimum=0.0
+    )
+    if not _UPDATE_TASK.wait(wait_seconds):
+        flash("Update läuft im Hintergrund, das Ergebnis wird protokolliert")
+        return redirect(url_for("index"))
+    _success, messages = _UPDATE_TASK.result or (False, ["Update fehlgeschlagen"])
+    for message in messages:
+        flash(message)
     return redirect(url_for("index"))
 
 
+@app.route("/job_status/<job_id>")
+@login_required
+def job_status(job_id):
+    task = _BACKGROUND_JOBS.get(job_id)
+    if task is None:
+        return {"error": "unknown_job", "job": job_id}, 404
+    payload: Dict[str, Any] = {"job": job_id, "running": task.running}
+    if not task.running:
+        result = task.result
+        if task.error is not None:
+            payload.update(success=False, messages=[str(task.error)])
+        elif isinstance(result, tuple) and len(result) == 2:
+            success, messages = result
+            payload.update(success=success, messages=list(messages))
+        else:
+            payload.update(success=None, messages=[])
+    return payload
+
+
 BLUETOOTH_MISSING_CLI_FLASH_KEY = "_bluetooth_missing_cli_flashed"
 BLUETOOTH_MISSING_CLI_MESSAGE = (
     "bluetoothctl nicht gefunden oder keine Berechtigung. Bitte Installation überprüfen."
@@ -8096,7 +10341,73 @@ def _create_missing_command_error(
     return FileNotFoundError(message)
 
 
+BLUEZ_ADAPTER_PATH = os.environ.get("AUDIO_PI_BLUEZ_ADAPTER_PATH", "/org/bluez/hci0")
+_BLUEZ_ADAPTER_INTERFACE = "org.bluez.Adapter1"
+_bluez_adapter_properties = None
+_bluez_adapter_lock = threading.Lock()
+
+
+def _get_bluez_adapter_properties():
+    """Liefert das (gecachte) D-Bus-Properties-Interface des BlueZ-Adapters."""
+
+    global _bluez_adapter_properties
+    if not DBUS_AVAILABLE:
+        return None
+    with _bluez_adapter_lock:
+        if _bluez_adapter_properties is None:
+            adapter = dbus.SystemBus().get_object("org.bluez", BLUEZ_ADAPTER_PATH)
+            _bluez_adapter_properties = dbus.Interface(
+                adapter, "org.freedesktop.DBus.Properties"
+            )
+        return _bluez_adapter_properties
+
+
+def _set_bluez_adapter_properties(**properties: bool) -> bool:
+    """Setzt Adapter-Properties direkt über D-Bus.
+
+    Gibt ``False`` zurück, wenn D-Bus nicht verfügbar ist oder BlueZ den Aufruf
+    ablehnt; der Aufrufer fällt dann auf bluetoothctl zurück.
+    """
+
+    global _bluez_adapter_properties
+    try:
+        adapter_properties = _get_bluez_adapter_properties()
+        if adapter_properties is None:
+            return False
+        for name, value in properties.items():
+            adapter_properties.Set(
+                _BLUEZ_ADAPTER_INTERFACE, name, dbus.Boolean(value)
+            )
+    except dbus.exceptions.DBusException as exc:
+        logging.warning(
+            "BlueZ per D-Bus nicht erreichbar, verwende bluetoothctl: %s", exc
+        )
+        _bluez_adapter_properties = None
+        return False
+    return True
+
+
+def _get_bluez_adapter_powered() -> Optional[bool]:
+    global _bluez_adapter_properties
+    try:
+        adapter_properties = _get_bluez_adapter_properties()
+        if adapter_properties is None:
+            return None
+        return bool(adapter_properties.Get(_BLUEZ_ADAPTER_INTERFACE, "Powered"))
+    except dbus.exceptions.DBusException as exc:
+        logging.debug("BlueZ-Power-Status per D-Bus nicht lesbar: %s", exc)
+        _bluez_adapter_properties = None
+        return None
+
+
 def enable_bluetooth() -> BluetoothActionResult:
+    if _set_bluez_adapter_properties(Powered=True, Discoverable=True, Pairable=True):
+        if not _bluetooth_agent_session.ensure_running():
+            logging.error(
+                "Bluetooth konnte nach dem Einschalten nicht vollständig eingerichtet werden"
+            )
+            return "error"
+        return "success"
     command = privileged_command("bluetoothctl", "power", "on")
     try:
         subprocess.run(
@@ -8132,6 +10443,8 @@ def enable_bluetooth() -> BluetoothActionResult:
 
 
 def disable_bluetooth() -> BluetoothActionResult:
+    if _set_bluez_adapter_properties(Powered=False):
+        return "success"
     command = privileged_command("bluetoothctl", "power", "off")
     try:
         subprocess.run(
@@ -8162,7 +10475,10 @@ def disable_bluetooth() -> BluetoothActionResult:
 
 
 def get_bluetooth_power_state() -> Optional[bool]:
-    """Return adapter power state from bluetoothctl, or None if it cannot be read."""
+    """Return adapter power state from BlueZ/bluetoothctl, or None if it cannot be read."""
+    powered = _get_bluez_adapter_powered()
+    if powered is not None:
+        return powered
     command = privileged_command("bluetoothctl", "show")
     try:
         result = subprocess.run(
@@ -8228,6 +10544,7 @@ def toggle_bluetooth() -> BluetoothActionResult:
 def bluetooth_on():
     try:
         result = enable_bluetooth()
+        _invalidate_dashboard_status_cache()
         if result == "success":
             flash("Bluetooth aktiviert")
         elif result == "missing_cli":
@@ -8247,6 +10564,7 @@ def bluetooth_on():
 def bluetooth_off():
     try:
         result = disable_bluetooth()
+        _invalidate_dashboard_status_cache()
         if result == "success":
             flash("Bluetooth deaktiviert")
         elif result == "missing_cli":
@@ -8262,7 +10580,109 @@ def bluetooth_off():
     return redirect(url_for("index"))
 
 
+class _BluetoothAgentSession:
+    """Langlebiger bluetoothctl-Prozess, der den Pairing-Agenten hält.
+
+    BlueZ meldet einen über bluetoothctl registrierten Agenten ab, sobald der
+    Prozess endet. Der Prozess bleibt daher bestehen und wird bei weiteren
+    Aufrufen wiederverwendet statt erneut gestartet. ``popen`` ersetzt
+    ``subprocess.Popen`` zum Starten der Sitzung.
+    """
+
+    _AGENT_COMMANDS = ("agent on", "default-agent")
+
+    def __init__(self, popen: Optional[Callable[..., subprocess.Popen]] = None):
+        self._lock = threading.Lock()
+        self._popen = popen
+        self._process: Optional[subprocess.Popen] = None
+
+    def is_running(self) -> bool:
+        process = self._process
+        return process is not None and process.poll() is None
+
+    def ensure_running(self) -> bool:
+        with self._lock:
+            if self.is_running():
+                return True
+            popen = self._popen or subprocess.Popen
+            try:
+                process = popen(
+                    privileged_command("bluetoothctl"),
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    universal_newlines=True,
+                )
+            except FileNotFoundError as exc:
+                _handle_missing_bluetooth_command(exc, flash_user=False)
+                return False
+            except (OSError, ValueError) as exc:
+                logging.error("Bluetooth-Agent konnte nicht gestartet werden: %s", exc)
+                return False
+            try:
+                process.stdin.write("\n".join(self._AGENT_COMMANDS) + "\n")
+                process.stdin.flush()
+            except (OSError, ValueError) as exc:
+                logging.error("Bluetooth-Agent konnte nicht registriert werden: %s", exc)
+                process.kill()
+                process.wait()
+                return False
+            self._process = process
+            logging.info("Bluetooth-Agent-Sitzung gestartet (PID %s)", process.pid)
+            return True
+
+    def send_commands(self, commands: Sequence[str]) -> bool:
+        """Schreibt Befehle in die laufende Sitzung; ``False``, wenn keine läuft."""
+
+        with self._lock:
+            process = self._process
+            if process is None or process.poll() is not None:
+                return False
+            try:
+                process.stdin.write("\n".join(commands) + "\n")
+                process.stdin.flush()
+            except (OSError, ValueError) as exc:
+                logging.warning(
+                    "Bluetooth-Agent-Sitzung nimmt keine Befehle an: %s", exc
+                )
+                return False
+            return True
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._lock:
+            process = self._process
+            self._process = None
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.write("exit\n")
+            process.stdin.flush()
+            process.stdin.close()
+            process.wait(timeout=timeout)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            process.kill()
+
+
+_bluetooth_agent_session = _BluetoothAgentSession()
+
+_BLUETOOTH_AUTO_ACCEPT_COMMANDS = ("power on", "discoverable on", "pairable on")
+# Einmal gebautes Skript, in einem Schreibvorgang an bluetoothctl übergeben.
+_BLUETOOTH_AUTO_ACCEPT_SCRIPT = "\n".join(_BLUETOOTH_AUTO_ACCEPT_COMMANDS) + "\nexit\n"
+_BLUETOOTH_AUTO_ACCEPT_TIMEOUT_SECONDS = 5
+
+
 def bluetooth_auto_accept() -> BluetoothActionResult:
+    # Bevorzugt ohne neuen Prozess: direkt über D-Bus oder über die bereits
+    # laufende Agent-Sitzung. Nur beim ersten Start wird bluetoothctl einmalig
+    # mit Fehlerauswertung gestartet.
+    if _set_bluez_adapter_properties(Powered=True, Discoverable=True, Pairable=True):
+        if not _bluetooth_agent_session.ensure_running():
+            return "error"
+        logging.info("Bluetooth auto-accept über D-Bus eingerichtet")
+        return "success"
+    if _bluetooth_agent_session.send_commands(_BLUETOOTH_AUTO_ACCEPT_COMMANDS):
+        logging.info("Bluetooth auto-accept über laufende Agent-Sitzung eingerichtet")
+        return "success"
     try:
         command = privileged_command("bluetoothctl")
         p = subprocess.Popen(
@@ -8279,19 +10699,22 @@ def bluetooth_auto_accept() -> BluetoothActionResult:
         logging.error("Bluetooth auto-accept konnte nicht gestartet werden: %s", exc)
         return "error"
 
-    commands = [
-        "power on",
-        "discoverable on",
-        "pairable on",
-        "agent on",
-        "default-agent",
-    ]
-
     try:
-        stdout, stderr = p.communicate("\n".join(commands) + "\nexit\n")
+        stdout, stderr = p.communicate(
+            _BLUETOOTH_AUTO_ACCEPT_SCRIPT,
+            timeout=_BLUETOOTH_AUTO_ACCEPT_TIMEOUT_SECONDS,
+        )
     except FileNotFoundError as exc:
         _handle_missing_bluetooth_command(exc)
         return "missing_cli"
+    except subprocess.TimeoutExpired:
+        p.kill()
+        p.communicate()
+        logging.error(
+            "Bluetooth auto-accept antwortete nicht innerhalb von %s Sekunden",
+            _BLUETOOTH_AUTO_ACCEPT_TIMEOUT_SECONDS,
+        )
+        return "error"
     except Exception as exc:
         logging.error("Bluetooth auto-accept Kommunikation fehlgeschlagen: %s", exc)
         return "error"
@@ -8319,6 +10742,8 @@ def bluetooth_auto_accept() -> BluetoothActionResult:
         logging.info("Bluetooth auto-accept meldete Warnungen: %s", stderr.strip())
 
     logging.info("Bluetooth auto-accept setup: %s", stdout.strip())
+    if not _bluetooth_agent_session.ensure_running():
+        return "error"
     return "success"
 
 
@@ -8487,6 +10912,7 @@ def _stop_playback_from_button() -> None:
 def _enable_bluetooth_via_button() -> None:
     try:
         result = enable_bluetooth()
+        _invalidate_dashboard_status_cache()
     except FileNotFoundError as exc:
         _handle_missing_bluetooth_command(exc, flash_user=False)
         return
@@ -8509,6 +10935,7 @@ def _enable_bluetooth_via_button() -> None:
 def _disable_bluetooth_via_button() -> None:
     try:
         result = disable_bluetooth()
+        _invalidate_dashboard_status_cache()
     except FileNotFoundError as exc:
         _handle_missing_bluetooth_command(exc, flash_user=False)
         return
@@ -8921,6 +11348,7 @@ def _refresh_button_monitor_configuration() -> None:
     _start_button_monitor()
 
 
+atexit.register(_release_amplifier_line)
 atexit.register(_stop_button_monitor)
 atexit.register(stop_background_services)
 
@@ -0,0 +1,17 @@
+"""Dekodier- und Normalisierungsschritt für die Wiedergabe.
+
+Das Modul ist bewusst frei von Flask-, GPIO- und Datenbank-Importen, damit
+es in einem separaten Prozess geladen werden kann, ohne die Web-Anwendung
+erneut zu initialisieren.
+"""
+from __future__ import annotations
+
+from pydub import AudioSegment
+
+
+def normalize_to_wav(source_path: str, target_path: str, headroom: float) -> None:
+    """Dekodiert ``source_path``, normalisiert mit ``headroom`` dB und schreibt WAV."""
+
+    sound = AudioSegment.from_file(source_path)
+    normalized = sound.normalize(headroom=headroom)
+    normalized.export(target_path, format="wav")
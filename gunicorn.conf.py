@@ -58,7 +58,9 @@ bind_port = _read_int_from_env("FLASK_PORT", 80, minimum=1)
 bind = f"0.0.0.0:{bind_port}"
 
 workers = _configure_workers(multiprocessing.cpu_count)
-threads = _read_int_from_env("AUDIO_PI_GUNICORN_THREADS", 2, minimum=1)
+# Ein Worker, aber genügend Threads: Routen wie WLAN-Scan, Zeit-Sync oder Update
+# warten auf externe Kommandos und sollen andere Anfragen nicht blockieren.
+threads = _read_int_from_env("AUDIO_PI_GUNICORN_THREADS", 8, minimum=1)
 worker_class = "gthread"
 
 timeout = _read_int_from_env("AUDIO_PI_GUNICORN_TIMEOUT", 120, minimum=30)
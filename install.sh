@@ -1192,12 +1192,20 @@ apt_get install -y python3-smbus i2c-tools
 python3 -m venv venv
 source venv/bin/activate
 
-# Dev-Packages (für pydub/pygame etc.)
-apt_get install -y libasound2-dev libpulse-dev libportaudio2 ffmpeg libffi-dev libjpeg-dev libbluetooth-dev
+# Dev-Packages (für pydub/pygame etc.; dbus-python und pygit2 werden ggf. aus
+# den Quellen gebaut und brauchen dafür libdbus/GLib bzw. libgit2)
+apt_get install -y libasound2-dev libpulse-dev libportaudio2 ffmpeg libffi-dev libjpeg-dev libbluetooth-dev \
+    libdbus-1-dev libglib2.0-dev pkg-config libgit2-dev
 
 # Python-Abhängigkeiten installieren
 pip install -r requirements.txt
 
+# Optionale Bindings (libpulse, BlueZ D-Bus, libgit2); ohne sie nutzt die App
+# pactl, bluetoothctl und die git-CLI, daher bricht ein Fehler hier nicht ab.
+if ! pip install -r requirements-optional.txt; then
+    echo "Warnung: Optionale Python-Bindings konnten nicht installiert werden – verwende CLI-Fallbacks." >&2
+fi
+
 # I²C für RTC aktivieren (raspi-config oder Fallback)
 enable_i2c_support
 
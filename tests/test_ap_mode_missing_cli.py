@@ -53,7 +53,7 @@ def test_setup_ap_missing_systemctl_with_sudo(monkeypatch, caplog):
     original_run = app.subprocess.run
 
     def fake_run(cmd, *args, **kwargs):
-        if cmd[:2] == ["sudo", "systemctl"]:
+        if cmd[:3] == ["sudo", "-n", "systemctl"]:
             assert kwargs.get("check") is False
             assert kwargs.get("capture_output") is True
             assert kwargs.get("text") is True
@@ -86,3 +86,20 @@ def test_setup_ap_missing_systemctl_with_sudo(monkeypatch, caplog):
         else:
             os.environ["AUDIO_PI_DISABLE_SUDO"] = original_disable
         importlib.reload(app)
+
+
+def test_has_network_reads_default_route_without_shell(monkeypatch):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return types.SimpleNamespace(
+            returncode=0, stdout="default via 192.168.1.1 dev wlan0\n", stderr=""
+        )
+
+    monkeypatch.setattr(app.subprocess, "run", fake_run)
+    assert app.has_network() is True
+    assert calls == [["ip", "route", "show", "default"]]
+
+    monkeypatch.setattr(app.subprocess, "run", _raise_file_not_found)
+    assert app.has_network() is False
@@ -10,6 +10,14 @@ os.environ.setdefault('TESTING', '1')
 app = importlib.import_module('app')
 
 
+@pytest.fixture(autouse=True)
+def fresh_dashboard_cache():
+    # Die Tests tauschen die Sink-Abfrage aus; zwischengespeicherte Werte verwerfen.
+    app._invalidate_dashboard_status_cache()
+    yield
+    app._invalidate_dashboard_status_cache()
+
+
 def test_set_sink_detected(monkeypatch):
     calls = []
 
@@ -205,6 +213,7 @@ def test_gather_status_includes_dac_sink_flag(monkeypatch):
     monkeypatch.setattr(app.pygame.mixer.music, "get_busy", lambda: True)
     monkeypatch.setattr(app, "is_bt_connected", lambda: True)
     monkeypatch.setattr(app, "RELAY_INVERT", True)
+    monkeypatch.setattr(app, "_read_wlan_ssid_ioctl", lambda _interface: None)
     monkeypatch.setattr(
         app,
         "_run_wifi_tool",
@@ -251,6 +260,7 @@ def test_gather_status_recovers_from_stale_false_dac_state(monkeypatch):
     monkeypatch.setattr(app, "datetime", FakeDateTime)
     monkeypatch.setattr(app.pygame.mixer.music, "get_busy", lambda: False)
     monkeypatch.setattr(app, "is_bt_connected", lambda: False)
+    monkeypatch.setattr(app, "_read_wlan_ssid_ioctl", lambda _interface: None)
     monkeypatch.setattr(
         app,
         "_run_wifi_tool",
@@ -300,6 +310,7 @@ def test_gather_status_auto_detects_dac_sink(monkeypatch, sink_available):
     monkeypatch.setattr(app.pygame.mixer.music, "get_busy", lambda: True)
     monkeypatch.setattr(app, "is_bt_connected", lambda: True)
     monkeypatch.setattr(app, "RELAY_INVERT", True)
+    monkeypatch.setattr(app, "_read_wlan_ssid_ioctl", lambda _interface: None)
     monkeypatch.setattr(
         app,
         "_run_wifi_tool",
@@ -207,7 +207,7 @@ def test_run_auto_reboot_job_missing_systemctl_sudo(app_module, monkeypatch, cap
 
     app_module.run_auto_reboot_job()
 
-    assert captured["command"] == ["sudo", "systemctl", "reboot"]
+    assert captured["command"] == ["sudo", "-n", "systemctl", "reboot"]
     assert any(
         "Automatischer Neustart fehlgeschlagen: systemctl nicht gefunden" in message
         for message in (record.getMessage() for record in caplog.records)
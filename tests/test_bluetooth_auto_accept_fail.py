@@ -93,6 +93,9 @@ def test_start_background_services_triggers_bluetooth_helpers(monkeypatch, clien
         def shutdown(self, wait=False):
             self.running = False
 
+        def add_job(self, *_args, **_kwargs):
+            pass
+
     dummy_scheduler = _DummyScheduler()
     monkeypatch.setattr(app_module, "scheduler", dummy_scheduler, raising=False)
 
@@ -145,3 +148,241 @@ def test_start_background_services_triggers_bluetooth_helpers(monkeypatch, clien
     assert button_state["running"] is False
     assert "stop" in monitor_calls
     assert "button_stop" in monitor_calls
+
+
+def test_bluetooth_agent_session_reuses_running_process(monkeypatch, client):
+    _flask_client, app_module = client
+    spawned = []
+
+    class _Stdin:
+        def __init__(self):
+            self.written = []
+
+        def write(self, data):
+            self.written.append(data)
+
+        def flush(self):
+            pass
+
+        def close(self):
+            pass
+
+    class _AgentProcess:
+        pid = 4242
+
+        def __init__(self):
+            self.stdin = _Stdin()
+            self.returncode = None
+
+        def poll(self):
+            return self.returncode
+
+        def wait(self, timeout=None):
+            self.returncode = 0
+            return 0
+
+        def kill(self):
+            self.returncode = -9
+
+    def fake_popen(args, *popen_args, **popen_kwargs):
+        process = _AgentProcess()
+        spawned.append(process)
+        return process
+
+    session = app_module._BluetoothAgentSession(popen=fake_popen)
+
+    assert session.ensure_running() is True
+    assert session.ensure_running() is True
+    assert len(spawned) == 1
+    assert "default-agent" in "".join(spawned[0].stdin.written)
+
+    session.stop()
+    assert spawned[0].stdin.written[-1] == "exit\n"
+    assert session.is_running() is False
+
+
+def test_bluetooth_agent_session_reaps_process_on_write_failure(client):
+    _flask_client, app_module = client
+
+    class _BrokenStdin:
+        def write(self, data):
+            raise BrokenPipeError("bluetoothctl beendet")
+
+    class _AgentProcess:
+        pid = 4444
+
+        def __init__(self):
+            self.stdin = _BrokenStdin()
+            self.returncode = None
+            self.killed = False
+
+        def poll(self):
+            return self.returncode
+
+        def kill(self):
+            self.killed = True
+
+        def wait(self, timeout=None):
+            self.returncode = -9
+            return self.returncode
+
+    process = _AgentProcess()
+    session = app_module._BluetoothAgentSession(popen=lambda *_a, **_k: process)
+
+    assert session.ensure_running() is False
+    assert process.killed is True
+    assert process.returncode == -9
+    assert session.is_running() is False
+
+
+def test_bluetooth_auto_accept_reuses_agent_session(monkeypatch, client):
+    _flask_client, app_module = client
+    written = []
+
+    class _Stdin:
+        def write(self, data):
+            written.append(data)
+
+        def flush(self):
+            pass
+
+    class _AgentProcess:
+        pid = 4343
+        stdin = _Stdin()
+
+        def poll(self):
+            return None
+
+    session = app_module._BluetoothAgentSession(
+        popen=lambda *args, **kwargs: _AgentProcess()
+    )
+    assert session.ensure_running() is True
+    monkeypatch.setattr(app_module, "_bluetooth_agent_session", session)
+
+    def fail_popen(*_args, **_kwargs):
+        raise AssertionError("bluetoothctl sollte nicht erneut gestartet werden")
+
+    monkeypatch.setattr(app_module.subprocess, "Popen", fail_popen)
+
+    assert app_module.bluetooth_auto_accept() == "success"
+    assert written[-1] == "power on\ndiscoverable on\npairable on\n"
+
+
+def test_enable_bluetooth_prefers_bluez_dbus(monkeypatch, client):
+    _flask_client, app_module = client
+    calls = []
+
+    class _DBusException(Exception):
+        pass
+
+    class _Properties:
+        def Set(self, interface, name, value):
+            calls.append((interface, name, value))
+
+        def Get(self, interface, name):
+            return True
+
+    class _SystemBus:
+        def get_object(self, service, path):
+            calls.append(("get_object", service, path))
+            return object()
+
+    dummy_dbus = type(
+        "dummy_dbus",
+        (),
+        {
+            "SystemBus": _SystemBus,
+            "Interface": staticmethod(lambda obj, interface: _Properties()),
+            "Boolean": staticmethod(bool),
+            "exceptions": type("exceptions", (), {"DBusException": _DBusException}),
+        },
+    )
+
+    def fail_run(*_args, **_kwargs):
+        raise AssertionError("bluetoothctl sollte nicht aufgerufen werden")
+
+    monkeypatch.setattr(app_module, "dbus", dummy_dbus, raising=False)
+    monkeypatch.setattr(app_module, "DBUS_AVAILABLE", True)
+    monkeypatch.setattr(app_module, "_bluez_adapter_properties", None)
+    monkeypatch.setattr(app_module.subprocess, "run", fail_run)
+    monkeypatch.setattr(
+        app_module._bluetooth_agent_session, "ensure_running", lambda: True
+    )
+
+    assert app_module.enable_bluetooth() == "success"
+    assert app_module.disable_bluetooth() == "success"
+    assert app_module.get_bluetooth_power_state() is True
+
+    property_calls = [call for call in calls if call[0] == "org.bluez.Adapter1"]
+    assert [call[1:] for call in property_calls] == [
+        ("Powered", True),
+        ("Discoverable", True),
+        ("Pairable", True),
+        ("Powered", False),
+    ]
+    assert sum(1 for call in calls if call[0] == "get_object") == 1
+
+
+def test_bluetooth_auto_accept_times_out(monkeypatch, client, caplog):
+    _flask_client, app_module = client
+
+    class _HangingProcess:
+        def __init__(self):
+            self.returncode = None
+            self.killed = False
+            self.inputs = []
+
+        def communicate(self, input=None, timeout=None):
+            self.inputs.append(input)
+            if not self.killed:
+                raise app_module.subprocess.TimeoutExpired("bluetoothctl", timeout)
+            return "", ""
+
+        def kill(self):
+            self.killed = True
+
+    process = _HangingProcess()
+    monkeypatch.setattr(app_module.subprocess, "Popen", lambda *_a, **_k: process)
+
+    with caplog.at_level(logging.ERROR):
+        result = app_module.bluetooth_auto_accept()
+
+    assert result == "error"
+    assert process.killed is True
+    assert process.inputs[0] == app_module._BLUETOOTH_AUTO_ACCEPT_SCRIPT
+    assert any("antwortete nicht" in record.getMessage() for record in caplog.records)
+
+
+def test_bluetooth_auto_accept_starts_agent_after_setup(monkeypatch, client):
+    _flask_client, app_module = client
+    agent_starts = []
+
+    class _Stdin:
+        def write(self, data):
+            pass
+
+        def flush(self):
+            pass
+
+    class _AgentProcess:
+        pid = 4545
+        stdin = _Stdin()
+
+        def poll(self):
+            return None
+
+    def fake_agent_popen(*_args, **_kwargs):
+        agent_starts.append(True)
+        return _AgentProcess()
+
+    session = app_module._BluetoothAgentSession(popen=fake_agent_popen)
+    monkeypatch.setattr(app_module, "_bluetooth_agent_session", session)
+    monkeypatch.setattr(
+        app_module.subprocess,
+        "Popen",
+        lambda *_a, **_k: _DummyProcess(returncode=0, stderr=""),
+    )
+
+    assert app_module.bluetooth_auto_accept() == "success"
+    assert agent_starts == [True]
+    assert session.is_running() is True
@@ -58,7 +58,7 @@ def test_bluetooth_on_missing_cli_sudo_enabled(monkeypatch, sudo_env, client):
     _login_admin(flask_client)
 
     def fake_run(args, **kwargs):
-        if args[:2] == ["sudo", "bluetoothctl"] and args[2:4] == ["power", "on"]:
+        if args[:3] == ["sudo", "-n", "bluetoothctl"] and args[3:5] == ["power", "on"]:
             raise CalledProcessError(
                 1,
                 args,
@@ -136,12 +136,12 @@ def test_bluetooth_auto_accept_missing_cli_sudo_enabled(
     _login_admin(flask_client)
 
     def fake_run(args, **kwargs):
-        if args[:2] == ["sudo", "bluetoothctl"] and args[2:4] == ["power", "on"]:
+        if args[:3] == ["sudo", "-n", "bluetoothctl"] and args[3:5] == ["power", "on"]:
             return CompletedProcess(args, 0, stdout="", stderr="")
         return CompletedProcess(args, 0, stdout="", stderr="")
 
     def fake_popen(args, *popen_args, **kwargs):
-        if isinstance(args, (list, tuple)) and args[:2] == ["sudo", "bluetoothctl"]:
+        if isinstance(args, (list, tuple)) and args[:3] == ["sudo", "-n", "bluetoothctl"]:
             return _MissingCommandProcess()
         raise AssertionError("Unerwartetes Kommando")
 
@@ -95,3 +95,26 @@ def test_missing_pactl_disables_bt_detection(monkeypatch, app_module):
         app_module.bt_audio_monitor()
 
     assert amplifier_triggered is False
+
+
+def test_run_pactl_command_reuses_resolved_executable(monkeypatch, app_module):
+    lookups = []
+    calls = []
+
+    def fake_which(name):
+        lookups.append(name)
+        return "/usr/bin/pactl"
+
+    def fake_run(cmd, *args, **kwargs):
+        calls.append((list(cmd), kwargs.get("executable"), kwargs.get("close_fds")))
+        return app_module.subprocess.CompletedProcess(cmd, 0, "ok", "")
+
+    monkeypatch.setattr(app_module.shutil, "which", fake_which)
+    monkeypatch.setattr(app_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(app_module, "_RESOLVED_EXECUTABLES", {})
+
+    assert app_module._run_pactl_command("info") == "ok"
+    assert app_module._run_pactl_command("info") == "ok"
+
+    assert lookups == ["pactl"]
+    assert calls == [(["pactl", "info"], "/usr/bin/pactl", False)] * 2
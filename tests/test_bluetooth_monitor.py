@@ -1,10 +1,16 @@
 import threading
 import sys
+import types
 
 import pytest
 
 from tests.test_playback_decode_failure import _setup_app
 
+try:
+    import pulsectl
+except (ImportError, OSError):  # libpulse fehlt
+    pulsectl = None
+
 
 @pytest.fixture(autouse=True)
 def clear_app_module():
@@ -58,6 +64,19 @@ def test_is_bt_audio_active_true_with_name_fallback(monkeypatch, app_module):
     assert app_module.is_bt_audio_active() is True
 
 
+def test_is_bt_audio_active_ignores_sink_name_substrings(monkeypatch, app_module):
+    def fake_run_pactl(*args):
+        if args[:3] == ("list", "short", "sinks"):
+            return "2\tbluez_sink.test\tmodule-bluetooth-device.c"
+        if args[:3] == ("list", "short", "sink-inputs"):
+            return "54\t7\tprotocol-native.c\tbluez_sink.test.monitor"
+        raise AssertionError(f"Unbekannter pactl-Befehl: {args}")
+
+    monkeypatch.setattr(app_module, "_run_pactl_command", fake_run_pactl)
+
+    assert app_module.is_bt_audio_active() is False
+
+
 def test_background_services_control_bt_monitor(monkeypatch, app_module):
     monkeypatch.setattr(app_module, "TESTING", False, raising=False)
     monkeypatch.setattr(app_module, "skip_past_once_schedules", lambda: None)
@@ -74,6 +93,9 @@ def test_background_services_control_bt_monitor(monkeypatch, app_module):
         def shutdown(self, wait=False):
             self.running = False
 
+        def add_job(self, *_args, **_kwargs):
+            pass
+
     dummy_scheduler = _DummyScheduler()
     monkeypatch.setattr(app_module, "scheduler", dummy_scheduler, raising=False)
 
@@ -116,3 +138,262 @@ def test_background_services_control_bt_monitor(monkeypatch, app_module):
     assert stop_event.is_set()
     assert button_stop_calls
     assert app_module._bt_audio_monitor_thread is None
+
+
+def test_bluetooth_worker_runs_auto_accept_and_monitor_in_one_thread(
+    monkeypatch, app_module
+):
+    thread_names = []
+    monitor_started = threading.Event()
+
+    def fake_auto_accept():
+        thread_names.append(("accept", threading.current_thread().name))
+        return "success"
+
+    def fake_bt_audio_monitor(*, stop_event=None):
+        thread_names.append(("monitor", threading.current_thread().name))
+        monitor_started.set()
+        stop_event.wait()
+
+    monkeypatch.setattr(app_module, "bluetooth_auto_accept", fake_auto_accept)
+    monkeypatch.setattr(app_module, "bt_audio_monitor", fake_bt_audio_monitor)
+    app_module._bt_audio_monitor_thread = None
+
+    app_module._start_bluetooth_background_worker()
+    assert monitor_started.wait(1.0)
+    app_module._stop_bt_audio_monitor_thread()
+
+    assert thread_names == [
+        ("accept", "bt-audio-monitor"),
+        ("monitor", "bt-audio-monitor"),
+    ]
+    assert app_module._bt_auto_accept_pending is False
+
+
+def test_bt_audio_monitor_lists_sinks_once_per_cycle(monkeypatch, app_module):
+    pactl_calls = []
+
+    def fake_run_pactl(*args):
+        pactl_calls.append(args)
+        if args[:3] == ("list", "short", "sinks"):
+            return "2\tbluez_sink.test\tmodule-bluetooth-device.c"
+        if args[:3] == ("list", "short", "sink-inputs"):
+            return "51\t2\tprotocol-native.c\tTest-Stream"
+        raise AssertionError(f"Unbekannter pactl-Befehl: {args}")
+
+    capped_sinks = []
+    stop_event = threading.Event()
+
+    def fake_activate():
+        stop_event.set()
+
+    monkeypatch.setattr(app_module, "_run_pactl_command", fake_run_pactl)
+    monkeypatch.setattr(
+        app_module,
+        "get_bluetooth_volume_cap_percent",
+        lambda: app_module.BluetoothVolumeCap(percent=80, headroom_db=1.0),
+    )
+    monkeypatch.setattr(
+        app_module,
+        "_enforce_bluetooth_volume_cap_for_sink",
+        lambda sink_name, _cap: capped_sinks.append(sink_name),
+    )
+    monkeypatch.setattr(app_module, "activate_amplifier", fake_activate)
+    monkeypatch.setattr(app_module, "deactivate_amplifier", lambda: None)
+
+    app_module.bt_audio_monitor(stop_event=stop_event)
+
+    assert capped_sinks == ["bluez_sink.test"]
+    assert pactl_calls == [
+        ("list", "short", "sinks"),
+        ("list", "short", "sink-inputs"),
+    ]
+
+
+def test_bt_audio_monitor_reacts_to_pactl_subscribe_events(monkeypatch, app_module):
+    stop_event = threading.Event()
+    states = iter([(False, []), (False, []), (True, ["bluez_sink.test"]), (False, [])])
+    refreshes = []
+
+    def fake_state():
+        state = next(states)
+        refreshes.append(state[0])
+        if len(refreshes) == 4:
+            stop_event.set()
+        return state
+
+    class FakeSubscription:
+        def __init__(self):
+            self.stdout = iter(
+                [
+                    "Event 'change' on client #7\n",
+                    "Event 'new' on sink-input #51\n",
+                    "Event 'remove' on sink-input #51\n",
+                ]
+            )
+            self.terminated = False
+
+        def poll(self):
+            return 0 if self.terminated else None
+
+        def terminate(self):
+            self.terminated = True
+
+        def wait(self, timeout=None):
+            return 0
+
+    subscription = FakeSubscription()
+    amp_calls = []
+
+    monkeypatch.setattr(app_module, "_bluetooth_audio_state", fake_state)
+    monkeypatch.setattr(app_module, "_open_pactl_subscription", lambda: subscription)
+    monkeypatch.setattr(
+        app_module,
+        "get_bluetooth_volume_cap_percent",
+        lambda: app_module.BluetoothVolumeCap(percent=100, headroom_db=0.0),
+    )
+    monkeypatch.setattr(app_module, "activate_amplifier", lambda: amp_calls.append("on"))
+    monkeypatch.setattr(
+        app_module, "deactivate_amplifier", lambda: amp_calls.append("off")
+    )
+
+    app_module.bt_audio_monitor(stop_event=stop_event)
+
+    assert refreshes == [False, False, True, False]
+    assert amp_calls == ["on", "off"]
+    assert subscription.terminated is True
+
+
+def test_bluetooth_helpers_use_libpulse_session(monkeypatch, app_module):
+    class FakePulseError(Exception):
+        pass
+
+    class FakePulse:
+        instances = []
+        reject_modules = False
+
+        def __init__(self, client_name):
+            self.client_name = client_name
+            self.loaded = []
+            FakePulse.instances.append(self)
+
+        def sink_list(self):
+            return [
+                types.SimpleNamespace(index=1, name="alsa_output.dac"),
+                types.SimpleNamespace(index=2, name="bluez_sink.test.a2dp_sink"),
+            ]
+
+        def sink_input_list(self):
+            return [types.SimpleNamespace(sink=2)]
+
+        def source_list(self):
+            return [types.SimpleNamespace(name="bluez_source.test.a2dp_source")]
+
+        def module_list(self):
+            return [types.SimpleNamespace(name="module-null-sink", argument=None)]
+
+        def module_load(self, name, args):
+            self.loaded.append((name, args))
+            if FakePulse.reject_modules:
+                raise FakePulseError(f"Failed to load module: {name} {args}")
+            return 17
+
+    def fail_pactl(*args):
+        pytest.fail(f"pactl sollte nicht gestartet werden: {args}")
+
+    monkeypatch.setattr(app_module, "PULSECTL_AVAILABLE", True)
+    monkeypatch.setattr(
+        app_module,
+        "pulsectl",
+        types.SimpleNamespace(
+            Pulse=FakePulse, PulseError=FakePulseError, PulseDisconnected=ConnectionError
+        ),
+    )
+    monkeypatch.setattr(app_module, "_pulse_client", None)
+    monkeypatch.setattr(app_module, "_run_pactl_command", fail_pactl)
+    monkeypatch.setattr(app_module, "DAC_SINK", "alsa_output.dac")
+    monkeypatch.setattr(app_module, "_resolve_sink_name", lambda name, **_kw: name)
+
+    assert app_module.is_bt_connected() is True
+    assert app_module._bluetooth_audio_state() == (True, ["bluez_sink.test.a2dp_sink"])
+    assert app_module.load_loopback() is True
+
+    assert len(FakePulse.instances) == 1
+    assert FakePulse.instances[0].loaded == [
+        (
+            "module-loopback",
+            "source=bluez_source.test.a2dp_source sink=alsa_output.dac latency_msec=30",
+        )
+    ]
+
+    FakePulse.reject_modules = True
+    assert app_module.load_loopback() is False
+    assert len(FakePulse.instances) == 1
+
+
+@pytest.mark.skipif(pulsectl is None, reason="pulsectl/libpulse nicht verfügbar")
+def test_pulse_event_subscription_yields_pactl_style_lines(monkeypatch, app_module):
+    class FakePulse:
+        def __init__(self, client_name):
+            self.client_name = client_name
+            self.mask = None
+            self.callback = None
+            self.closed = False
+            self.pending = [
+                types.SimpleNamespace(
+                    facility=pulsectl.PulseEventFacilityEnum.client,
+                    t=pulsectl.PulseEventTypeEnum.change,
+                    index=7,
+                ),
+                types.SimpleNamespace(
+                    facility=pulsectl.PulseEventFacilityEnum.sink_input,
+                    t=pulsectl.PulseEventTypeEnum.new,
+                    index=51,
+                ),
+            ]
+
+        def event_mask_set(self, *facilities):
+            self.mask = facilities
+
+        def event_callback_set(self, callback):
+            self.callback = callback
+
+        def event_listen(self, timeout=None):
+            while self.pending:
+                try:
+                    self.callback(self.pending.pop(0))
+                except pulsectl.PulseLoopStop:
+                    return
+            raise OSError("Verbindung beendet")
+
+        def event_listen_stop(self):
+            pass
+
+        def close(self):
+            self.closed = True
+
+    fake_pulsectl = types.SimpleNamespace(
+        Pulse=FakePulse, PulseLoopStop=pulsectl.PulseLoopStop
+    )
+    monkeypatch.setattr(app_module, "PULSECTL_AVAILABLE", True)
+    monkeypatch.setattr(app_module, "pulsectl", fake_pulsectl)
+    monkeypatch.setattr(
+        app_module,
+        "_open_pactl_subscription",
+        lambda: pytest.fail("pactl subscribe sollte nicht gestartet werden"),
+    )
+
+    subscription = app_module._open_pulse_event_subscription()
+    lines = list(subscription.stdout)
+
+    assert subscription._pulse.mask == ("sink", "sink_input")
+    assert lines == [
+        "Event 'change' on client #7\n",
+        "Event 'new' on sink-input #51\n",
+    ]
+    assert [bool(app_module._PACTL_SUBSCRIBE_EVENT_RE.match(line)) for line in lines] == [
+        False,
+        True,
+    ]
+    assert subscription.poll() == 0
+    assert subscription._pulse.closed is True
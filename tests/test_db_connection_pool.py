@@ -0,0 +1,302 @@
+import os
+import sqlite3
+import subprocess
+
+import pytest
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test")
+os.environ.setdefault("TESTING", "1")
+os.environ.setdefault("INITIAL_ADMIN_PASSWORD", "password")
+
+import app  # noqa: E402
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "DB_FILE", str(tmp_path / "pool.db"))
+    monkeypatch.setattr(app, "_db_pool", app._SQLiteConnectionPool(2))
+    app.initialize_database()
+    yield app
+    app._db_pool.close_all()
+
+
+def test_get_db_connection_reuses_pooled_connection(app_module):
+    with app_module.get_db_connection() as (first_conn, _cursor):
+        pass
+    with app_module.get_db_connection() as (second_conn, cursor):
+        cursor.execute("PRAGMA journal_mode")
+        journal_mode = cursor.fetchone()[0]
+        cursor.execute("PRAGMA cache_size")
+        cache_size = cursor.fetchone()[0]
+
+    assert first_conn is second_conn
+    assert journal_mode.lower() == "wal"
+    assert cache_size == -app_module.SQLITE_CACHE_SIZE_KIB
+
+
+def test_released_connection_discards_uncommitted_changes(app_module):
+    with app_module.get_db_connection() as (_conn, cursor):
+        cursor.execute(
+            "INSERT INTO settings (key, value) VALUES (?, ?)", ("pool_test", "1")
+        )
+
+    with app_module.get_db_connection() as (_conn, cursor):
+        cursor.execute("SELECT value FROM settings WHERE key=?", ("pool_test",))
+        assert cursor.fetchone() is None
+
+
+def test_pool_drops_connections_when_db_file_changes(app_module, monkeypatch, tmp_path):
+    with app_module.get_db_connection() as (first_conn, _cursor):
+        pass
+
+    monkeypatch.setattr(app_module, "DB_FILE", str(tmp_path / "other.db"))
+    with app_module.get_db_connection() as (second_conn, _cursor):
+        pass
+
+    assert first_conn is not second_conn
+
+
+def test_get_setting_is_cached_until_database_changes(app_module, monkeypatch):
+    app_module.set_setting("cache_probe", "eins")
+    assert app_module.get_setting("cache_probe") == "eins"
+
+    original = app_module.get_db_connection
+    calls = []
+
+    def counting_connection():
+        calls.append(True)
+        return original()
+
+    monkeypatch.setattr(app_module, "get_db_connection", counting_connection)
+    assert app_module.get_setting("cache_probe") == "eins"
+    assert calls == []
+
+    external = sqlite3.connect(app_module.DB_FILE)
+    external.execute(
+        "UPDATE settings SET value=? WHERE key=?", ("zwei-extern", "cache_probe")
+    )
+    external.commit()
+    external.close()
+
+    assert app_module.get_setting("cache_probe") == "zwei-extern"
+    assert calls == [True]
+
+
+def test_initialize_database_runs_in_single_transaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "DB_FILE", str(tmp_path / "init.db"))
+    pool = app._SQLiteConnectionPool(1)
+    monkeypatch.setattr(app, "_db_pool", pool)
+
+    statements = []
+    original_connect = pool._connect
+
+    def tracing_connect(db_file):
+        conn = original_connect(db_file)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(pool, "_connect", tracing_connect)
+    try:
+        app.initialize_database()
+    finally:
+        pool.close_all()
+
+    keywords = [statement.split()[0].upper() for statement in statements]
+    assert keywords.count("BEGIN") == 1
+    assert keywords.count("COMMIT") == 1
+    assert keywords.index("BEGIN") < keywords.index("CREATE")
+    assert keywords.index("COMMIT") > max(
+        index for index, keyword in enumerate(keywords) if keyword == "CREATE"
+    )
+
+
+def test_initialize_database_adds_cascading_playlist_foreign_keys(tmp_path, monkeypatch):
+    db_file = tmp_path / "legacy.db"
+    legacy = sqlite3.connect(db_file)
+    legacy.executescript(
+        """
+        CREATE TABLE audio_files (id INTEGER PRIMARY KEY, filename TEXT, duration_seconds REAL);
+        CREATE TABLE playlists (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE playlist_files (playlist_id INTEGER, file_id INTEGER, position INTEGER DEFAULT 0);
+        INSERT INTO audio_files (id, filename, duration_seconds) VALUES (1, 'a.mp3', 1.0);
+        INSERT INTO playlists (id, name) VALUES (1, 'Liste');
+        INSERT INTO playlist_files VALUES (1, 1, 0);
+        INSERT INTO playlist_files VALUES (1, 99, 1);
+        """
+    )
+    legacy.commit()
+    legacy.close()
+
+    monkeypatch.setattr(app, "DB_FILE", str(db_file))
+    monkeypatch.setattr(app, "_db_pool", app._SQLiteConnectionPool(1))
+    try:
+        app.initialize_database()
+        with app.get_db_connection() as (conn, cursor):
+            cursor.execute("PRAGMA foreign_key_list(playlist_files)")
+            referenced = {row["table"] for row in cursor.fetchall()}
+            cursor.execute("SELECT file_id FROM playlist_files")
+            remaining = [row["file_id"] for row in cursor.fetchall()]
+            cursor.execute("DELETE FROM audio_files WHERE id=1")
+            conn.commit()
+            cursor.execute("SELECT COUNT(*) FROM playlist_files")
+            after_delete = cursor.fetchone()[0]
+    finally:
+        app._db_pool.close_all()
+
+    assert referenced == {"audio_files", "playlists"}
+    assert remaining == [1]
+    assert after_delete == 0
+
+
+def test_schedule_item_lookups_use_index(app_module):
+    with app_module.get_db_connection() as (_conn, cursor):
+        cursor.execute(
+            "EXPLAIN QUERY PLAN DELETE FROM schedules WHERE item_id=? AND item_type='file'",
+            (1,),
+        )
+        plan = " ".join(row["detail"] for row in cursor.fetchall())
+        cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT 1 FROM playlist_files WHERE file_id=?", (1,)
+        )
+        playlist_plan = " ".join(row["detail"] for row in cursor.fetchall())
+
+    assert "idx_schedules_item" in plan
+    assert "idx_playlist_files_file" in playlist_plan
+
+
+def test_run_database_maintenance_truncates_wal(app_module):
+    app_module.set_setting("wal_probe", "1")
+    wal_path = app_module.DB_FILE + "-wal"
+    assert os.path.getsize(wal_path) > 0
+
+    app_module.run_database_maintenance()
+
+    assert os.path.getsize(wal_path) == 0
+
+
+def test_initialize_database_converts_to_incremental_auto_vacuum(tmp_path, monkeypatch):
+    db_file = tmp_path / "legacy_vacuum.db"
+    legacy = sqlite3.connect(db_file)
+    legacy.execute("CREATE TABLE settings (key TEXT PRIMARY KEY, value TEXT)")
+    legacy.commit()
+    legacy.close()
+
+    monkeypatch.setattr(app, "DB_FILE", str(db_file))
+    monkeypatch.setattr(app, "_db_pool", app._SQLiteConnectionPool(1))
+    try:
+        app.initialize_database()
+        with app.get_db_connection() as (_conn, cursor):
+            cursor.execute("PRAGMA auto_vacuum")
+            mode = cursor.fetchone()[0]
+    finally:
+        app._db_pool.close_all()
+
+    assert mode == app.SQLITE_AUTO_VACUUM_INCREMENTAL
+
+
+def test_wal_mode_persists_for_new_connections(app_module):
+    app_module._db_pool.close_all()
+    plain = sqlite3.connect(app_module.DB_FILE)
+    try:
+        journal_mode = plain.execute("PRAGMA journal_mode").fetchone()[0]
+    finally:
+        plain.close()
+
+    assert journal_mode.lower() == "wal"
+    assert not any("journal_mode" in pragma for pragma in app_module._SQLITE_CONNECTION_PRAGMAS)
+
+
+def test_default_pool_keeps_one_connection_per_gunicorn_thread(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "DB_FILE", str(tmp_path / "threads.db"))
+    pool = app._SQLiteConnectionPool(app.SQLITE_POOL_SIZE)
+    checked_out = [pool.acquire() for _ in range(app.SQLITE_POOL_SIZE)]
+    for conn, db_file in checked_out:
+        pool.release(conn, db_file)
+    reused = [pool.acquire() for _ in range(app.SQLITE_POOL_SIZE)]
+    for conn, db_file in reused:
+        pool.release(conn, db_file)
+    pool.close_all()
+
+    assert {id(conn) for conn, _ in reused} == {id(conn) for conn, _ in checked_out}
+
+
+def test_initialize_database_backfills_legacy_durations(tmp_path, monkeypatch):
+    upload_dir = tmp_path / "uploads"
+    upload_dir.mkdir()
+    for name in ("a.mp3", "b.mp3"):
+        (upload_dir / name).write_bytes(b"data")
+    db_file = tmp_path / "durations.db"
+    legacy = sqlite3.connect(db_file)
+    legacy.executescript(
+        """
+        CREATE TABLE audio_files (id INTEGER PRIMARY KEY, filename TEXT);
+        INSERT INTO audio_files (id, filename) VALUES (1, 'a.mp3');
+        INSERT INTO audio_files (id, filename) VALUES (2, 'b.mp3');
+        INSERT INTO audio_files (id, filename) VALUES (3, 'fehlt.mp3');
+        """
+    )
+    legacy.commit()
+    legacy.close()
+
+    monkeypatch.setitem(app.app.config, "UPLOAD_FOLDER", str(upload_dir))
+    monkeypatch.setattr(
+        app.AudioSegment, "from_file", staticmethod(lambda _path: b"x" * 2500)
+    )
+    monkeypatch.setattr(app, "DB_FILE", str(db_file))
+    monkeypatch.setattr(app, "_db_pool", app._SQLiteConnectionPool(1))
+    try:
+        app.initialize_database()
+        with app.get_db_connection() as (_conn, cursor):
+            cursor.execute("SELECT id, duration_seconds FROM audio_files ORDER BY id")
+            durations = [tuple(row) for row in cursor.fetchall()]
+    finally:
+        app._db_pool.close_all()
+
+    assert durations == [(1, 2.5), (2, 2.5), (3, None)]
+
+
+def test_probe_audio_duration_prefers_ffprobe(monkeypatch):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="12.345000\n", stderr="")
+
+    monkeypatch.setattr(app, "_resolve_executable", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(app.subprocess, "run", fake_run)
+    monkeypatch.setattr(
+        app.AudioSegment,
+        "from_file",
+        staticmethod(lambda _path: pytest.fail("pydub sollte nicht dekodieren")),
+    )
+
+    assert app._probe_audio_duration("/tmp/a.mp3") == pytest.approx(12.345)
+    assert calls[0][0] == "/usr/bin/ffprobe"
+    assert calls[0][-1] == "/tmp/a.mp3"
+
+
+def test_probe_audio_duration_decodes_when_ffprobe_estimates(monkeypatch):
+    def fake_run(args, **kwargs):
+        return subprocess.CompletedProcess(
+            args,
+            0,
+            stdout="30.000000\n",
+            stderr="[mp3 @ 0x1] Estimating duration from bitrate, this may be inaccurate\n",
+        )
+
+    monkeypatch.setattr(app, "_resolve_executable", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(app.subprocess, "run", fake_run)
+    monkeypatch.setattr(
+        app.AudioSegment, "from_file", staticmethod(lambda _path: b"x" * 42500)
+    )
+
+    assert app._probe_audio_duration("/tmp/vbr.mp3") == pytest.approx(42.5)
+
+
+def test_probe_audio_duration_falls_back_to_decoding(monkeypatch):
+    monkeypatch.setattr(app, "_resolve_executable", lambda _name: None)
+    monkeypatch.setattr(
+        app.AudioSegment, "from_file", staticmethod(lambda _path: b"x" * 1500)
+    )
+
+    assert app._probe_audio_duration("/tmp/a.mp3") == pytest.approx(1.5)
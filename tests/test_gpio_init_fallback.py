@@ -34,7 +34,7 @@ def _create_dummy_pygame():
             pass
 
     dummy_music = DummyMusic()
-    dummy_mixer = types.SimpleNamespace(init=lambda: None, music=dummy_music)
+    dummy_mixer = types.SimpleNamespace(init=lambda **_kwargs: None, music=dummy_music)
     dummy_pygame = types.ModuleType("pygame")
     dummy_pygame.mixer = dummy_mixer
     return dummy_pygame
@@ -173,6 +173,9 @@ def test_button_monitor_lifecycle_managed_by_background_services(monkeypatch):
         def shutdown(self, wait=False):
             self.running = False
 
+        def add_job(self, *_args, **_kwargs):
+            pass
+
     dummy_scheduler = _DummyScheduler()
     monkeypatch.setattr(app_module, "scheduler", dummy_scheduler, raising=False)
 
@@ -17,7 +17,7 @@ def _create_dummy_pygame_module():
         pause=lambda: None,
         unpause=lambda: None,
     )
-    dummy_mixer = types.SimpleNamespace(init=lambda: None, music=dummy_music)
+    dummy_mixer = types.SimpleNamespace(init=lambda **_kwargs: None, music=dummy_music)
     dummy_pygame = types.ModuleType("pygame")
     dummy_pygame.mixer = dummy_mixer
     return dummy_pygame
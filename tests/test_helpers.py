@@ -23,6 +23,31 @@ def test_validate_time_invalid():
     assert not validate_time('12:00:60')
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "8:5:3",
+        "08:05:03",
+        "19:59:09",
+        "20:00:00",
+        "1:00:00 ",
+        " 1:00:00",
+        "",
+        "12:00:00\n",
+        "a1:00:00",
+        "123:00:00",
+    ],
+)
+def test_validate_time_matches_strptime(value):
+    try:
+        datetime.strptime(value, "%H:%M:%S")
+    except ValueError:
+        expected = False
+    else:
+        expected = True
+    assert validate_time(value) is expected
+
+
 def test_parse_once_datetime_iso_z():
     dt = parse_once_datetime('2024-05-13T12:30:45Z')
     assert dt == datetime(2024, 5, 13, 12, 30, 45, tzinfo=dt.tzinfo)
@@ -41,3 +66,62 @@ def test_parse_once_datetime_space_minute():
 def test_parse_once_datetime_invalid():
     with pytest.raises(ValueError):
         parse_once_datetime('invalid')
+
+
+@pytest.mark.parametrize(
+    'filename, expected',
+    [
+        ('song.mp3', True),
+        ('Jingle.WAV', True),
+        ('archive.tar.mp3', True),
+        ('notes.txt', False),
+        ('mp3', False),
+        ('track.mp3.exe', False),
+    ],
+)
+def test_allowed_file_checks_suffix(filename, expected):
+    assert app.allowed_file(filename) is expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ('2024-02-29', datetime(2024, 2, 29).date()),
+        ('20240229', None),
+        ('2024-W09-4', None),
+        ('2023-02-29', None),
+        ('', None),
+    ],
+)
+def test_parse_schedule_date_accepts_only_iso_dates(value, expected):
+    assert app.parse_schedule_date(value) == expected
+
+
+def test_bcd_tables_match_arithmetic():
+    for value in range(100):
+        bcd = ((value // 10) << 4) | (value % 10)
+        assert app.dec_to_bcd(value) == bcd
+        assert app.bcd_to_dec(bcd) == value
+    for raw in range(256):
+        assert app.bcd_to_dec(raw) == ((raw >> 4) * 10) + (raw & 0x0F)
+
+
+def test_template_cache_prewarms_bytecode(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "jinja"
+    monkeypatch.setattr(app, "JINJA_BYTECODE_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(app.app.jinja_env, "bytecode_cache", None)
+    monkeypatch.setattr(app.app.jinja_env, "cache", {})
+
+    app._configure_template_cache()
+
+    assert app.app.jinja_env.auto_reload is False
+    assert app.app.jinja_env.bytecode_cache is not None
+    assert any(cache_dir.iterdir())
+
+
+def test_sudo_non_interactive_prefix_is_stripped_and_described():
+    command = ["sudo", "-n", "systemctl", "reboot"]
+    assert app._strip_sudo_from_command(command) == ["systemctl", "reboot"]
+    assert app._strip_sudo_from_command("sudo -n systemctl reboot") == "systemctl reboot"
+    assert app._describe_command(command) == "systemctl reboot"
+    assert app._extract_primary_command(command) == "systemctl"
@@ -77,3 +77,78 @@ def test_index_hides_guest_login_notice_for_authenticated_user(client):
     assert response.status_code == 200
     html = response.get_data(as_text=True)
     assert "Bitte melden Sie sich an, um alle Funktionen zu nutzen." not in html
+
+
+def test_change_password_rejects_wrong_old_password(client):
+    test_client, app_module = client
+
+    csrf_post(
+        test_client,
+        "/login",
+        data={"username": "admin", "password": "password"},
+        follow_redirects=True,
+        source_url="/login",
+    )
+    response = csrf_post(
+        test_client,
+        "/change_password",
+        data={"old_password": "falsch", "new_password": "password1234"},
+        follow_redirects=True,
+        source_url="/change_password",
+    )
+
+    assert "Falsches altes Passwort" in response.get_data(as_text=True)
+    with app_module.get_db_connection() as (_conn, cursor):
+        cursor.execute("SELECT password FROM users WHERE username='admin'")
+        stored_hash = cursor.fetchone()["password"]
+    assert app_module.verify_password(stored_hash, "password")
+
+
+def test_login_migrates_legacy_password_hash(client):
+    test_client, app_module = client
+    if not app_module.ARGON2_AVAILABLE:
+        pytest.skip("argon2-cffi nicht installiert")
+
+    legacy_hash = app_module.generate_password_hash("password")
+    with app_module.get_db_connection() as (conn, cursor):
+        cursor.execute(
+            "UPDATE users SET password=? WHERE username='admin'", (legacy_hash,)
+        )
+        conn.commit()
+
+    csrf_post(
+        test_client,
+        "/login",
+        data={"username": "admin", "password": "password"},
+        follow_redirects=True,
+        source_url="/login",
+    )
+
+    with app_module.get_db_connection() as (_conn, cursor):
+        cursor.execute("SELECT password FROM users WHERE username='admin'")
+        stored_hash = cursor.fetchone()["password"]
+    assert stored_hash.startswith("$argon2")
+    assert app_module.verify_password(stored_hash, "password")
+
+
+def test_login_unknown_user_verifies_against_dummy_hash(client, monkeypatch):
+    test_client, app_module = client
+    verified_hashes = []
+    original_verify = app_module.verify_password
+
+    def tracking_verify(stored_hash, password):
+        verified_hashes.append(stored_hash)
+        return original_verify(stored_hash, password)
+
+    monkeypatch.setattr(app_module, "verify_password", tracking_verify)
+
+    response = csrf_post(
+        test_client,
+        "/login",
+        data={"username": "unbekannt", "password": "password"},
+        follow_redirects=True,
+        source_url="/login",
+    )
+
+    assert "Falsche Anmeldedaten" in response.get_data(as_text=True)
+    assert verified_hashes == [app_module._dummy_password_hash()]
@@ -110,3 +110,73 @@ def test_logs_endpoint_limits_response_size(client):
     assert visible_indices[0] >= len(lines) - max_lines
     assert visible_lines[-1] == "line0199-" + "x" * 20
     assert len(pre_content.encode("utf-8")) <= max_bytes
+
+
+def test_logs_raw_serves_full_file_with_conditional_get(client):
+    client, app_module = client
+    log_path = Path(app_module.app.config["LOG_VIEW_FILE"])
+    content = "".join(f"zeile{i:04d}\n" for i in range(300))
+    log_path.write_text(content, encoding="utf-8")
+
+    _login(client)
+
+    response = client.get("/logs/raw")
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == content
+    etag = response.headers.get("ETag")
+    assert etag
+
+    cached = client.get("/logs/raw", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_logs_endpoint_answers_unchanged_log_with_304(client):
+    client, app_module = client
+    log_path = Path(app_module.app.config["LOG_VIEW_FILE"])
+    log_path.write_text("erste zeile\n", encoding="utf-8")
+
+    _login(client)
+
+    first = client.get("/logs")
+    assert first.status_code == 200
+    etag = first.headers.get("ETag")
+    assert etag
+
+    cached = client.get("/logs", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.get_data() == b""
+
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write("zweite zeile\n")
+
+    refreshed = client.get("/logs", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert "zweite zeile" in refreshed.get_data(as_text=True)
+
+
+def test_configure_logging_writes_through_queue_listener(app_module, tmp_path, monkeypatch):
+    import atexit
+    import logging
+    import logging.handlers
+
+    root_logger = logging.getLogger()
+    monkeypatch.setattr(root_logger, "handlers", [])
+    monkeypatch.setattr(root_logger, "level", root_logger.level)
+    monkeypatch.chdir(tmp_path)
+
+    listener = app_module._configure_logging()
+    assert listener is not None
+    try:
+        assert [type(handler) for handler in root_logger.handlers] == [
+            logging.handlers.QueueHandler
+        ]
+        assert listener._thread is not None
+        logging.getLogger("audio-pi-test").info("queue-eintrag")
+    finally:
+        atexit.unregister(listener.stop)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+    assert "INFO - queue-eintrag" in (tmp_path / "app.log").read_text(encoding="utf-8")
+    assert app_module._configure_logging() is None
@@ -1,4 +1,6 @@
+import os
 import sys
+from pathlib import Path
 
 import pytest
 
@@ -160,3 +162,151 @@ def test_save_normalization_headroom_rejects_non_finite_values(
     assert collector[0] == pytest.approx(
         app_module.DEFAULT_NORMALIZATION_HEADROOM_DB
     )
+
+
+def test_normalized_audio_is_cached_until_source_changes(monkeypatch, tmp_path):
+    monkeypatch.delenv("NORMALIZATION_HEADROOM_DB", raising=False)
+    app_module, _dummy_music = _setup_app(monkeypatch, tmp_path)
+
+    prepare_calls = []
+
+    def fake_prepare(file_path, temp_path):
+        prepare_calls.append(file_path)
+        with open(temp_path, "wb") as handle:
+            handle.write(b"RIFF")
+        return True
+
+    monkeypatch.setattr(app_module, "_prepare_audio_for_playback", fake_prepare)
+
+    source_path = tmp_path / "cached.mp3"
+    source_path.write_bytes(b"data")
+
+    first = app_module._get_normalized_audio_path(str(source_path))
+    second = app_module._get_normalized_audio_path(str(source_path))
+    assert first == second
+    assert len(prepare_calls) == 1
+    cache_dir = tmp_path / app_module.NORMALIZED_AUDIO_CACHE_DIRNAME
+    assert Path(first).parent == cache_dir
+
+    source_path.write_bytes(b"new data")
+    third = app_module._get_normalized_audio_path(str(source_path))
+    assert third != first
+    assert len(prepare_calls) == 2
+    assert [entry.name for entry in cache_dir.iterdir()] == [Path(third).name]
+
+
+def test_prepare_audio_falls_back_when_decode_pool_breaks(monkeypatch, tmp_path):
+    monkeypatch.delenv("NORMALIZATION_HEADROOM_DB", raising=False)
+    app_module, _dummy_music = _setup_app(monkeypatch, tmp_path)
+
+    class BrokenPool:
+        def submit(self, *_args, **_kwargs):
+            raise app_module.BrokenProcessPool("worker died")
+
+        def shutdown(self, **_kwargs):
+            return None
+
+    monkeypatch.setattr(app_module, "_decode_pool", BrokenPool())
+    monkeypatch.setattr(app_module, "_get_decode_pool", lambda: app_module._decode_pool)
+
+    collector = []
+    monkeypatch.setattr(
+        app_module.AudioSegment,
+        "from_file",
+        lambda *_args, **_kwargs: TrackingSegment(collector),
+    )
+
+    source_path = tmp_path / "pool.mp3"
+    source_path.write_bytes(b"data")
+
+    assert app_module._prepare_audio_for_playback(
+        str(source_path), str(tmp_path / "prepared.wav")
+    )
+    assert collector == [
+        pytest.approx(app_module.DEFAULT_NORMALIZATION_HEADROOM_DB)
+    ]
+    assert app_module._decode_pool is None
+
+
+def _fake_prepare_writing(payload, calls):
+    def fake_prepare(file_path, temp_path):
+        calls.append(file_path)
+        with open(temp_path, "wb") as handle:
+            handle.write(payload)
+        return True
+
+    return fake_prepare
+
+
+def test_normalized_audio_cache_evicts_least_recently_played(monkeypatch, tmp_path):
+    monkeypatch.delenv("NORMALIZATION_HEADROOM_DB", raising=False)
+    app_module, _dummy_music = _setup_app(monkeypatch, tmp_path)
+    prepare_calls = []
+    monkeypatch.setattr(
+        app_module,
+        "_prepare_audio_for_playback",
+        _fake_prepare_writing(b"x" * 8, prepare_calls),
+    )
+    monkeypatch.setattr(app_module, "NORMALIZED_AUDIO_CACHE_MAX_BYTES", 20)
+
+    sources = []
+    for name in ("a.mp3", "b.mp3", "c.mp3"):
+        source = tmp_path / name
+        source.write_bytes(b"data")
+        sources.append(str(source))
+
+    first = app_module._get_normalized_audio_path(sources[0])
+    second = app_module._get_normalized_audio_path(sources[1])
+    os.utime(first, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(second, ns=(2_000_000_000, 2_000_000_000))
+    # Treffer frischt den Eintrag auf, daher wird danach "b" verdrängt.
+    assert app_module._get_normalized_audio_path(sources[0]) == first
+    third = app_module._get_normalized_audio_path(sources[2])
+
+    cache_dir = tmp_path / app_module.NORMALIZED_AUDIO_CACHE_DIRNAME
+    assert sorted(entry.name for entry in cache_dir.iterdir()) == sorted(
+        [Path(first).name, Path(third).name]
+    )
+    assert len(prepare_calls) == 3
+
+
+def test_normalized_audio_is_dropped_when_source_is_deleted(monkeypatch, tmp_path):
+    monkeypatch.delenv("NORMALIZATION_HEADROOM_DB", raising=False)
+    app_module, _dummy_music = _setup_app(monkeypatch, tmp_path)
+    monkeypatch.setattr(
+        app_module,
+        "_prepare_audio_for_playback",
+        _fake_prepare_writing(b"RIFF", []),
+    )
+
+    source_path = tmp_path / "weg.mp3"
+    source_path.write_bytes(b"data")
+    with app_module.get_db_connection() as (conn, cursor):
+        cursor.execute(
+            "INSERT INTO audio_files (filename, duration_seconds) VALUES (?, ?)",
+            (source_path.name, 1.0),
+        )
+        file_id = cursor.lastrowid
+        conn.commit()
+    assert app_module._get_normalized_audio_path(str(source_path)) is not None
+
+    client = app_module.app.test_client()
+    with client:
+        response = csrf_post(client, f"/delete/{file_id}")
+    assert response.status_code == 302
+
+    cache_dir = tmp_path / app_module.NORMALIZED_AUDIO_CACHE_DIRNAME
+    assert not source_path.exists()
+    assert list(cache_dir.iterdir()) == []
+
+    # Ein Löschen während des Dekodierens hinterlässt ebenfalls keinen Eintrag.
+    source_path.write_bytes(b"data")
+
+    def prepare_and_delete(file_path, temp_path):
+        Path(temp_path).write_bytes(b"RIFF")
+        os.remove(file_path)
+        return True
+
+    monkeypatch.setattr(app_module, "_prepare_audio_for_playback", prepare_and_delete)
+    assert app_module._get_normalized_audio_path(str(source_path)) is None
+    assert list(cache_dir.iterdir()) == []
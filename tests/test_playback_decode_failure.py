@@ -1,6 +1,7 @@
 import importlib
 import logging
 import sys
+import threading
 import types
 from contextlib import contextmanager
 from pathlib import Path
@@ -93,6 +94,8 @@ def _setup_app(monkeypatch, tmp_path):
     monkeypatch.setenv("INITIAL_ADMIN_PASSWORD", "password")
     monkeypatch.setenv("DB_FILE", str(tmp_path / "test.db"))
     monkeypatch.setenv("TESTING", "1")
+    # AudioSegment wird im Testprozess ersetzt; Dekodieren daher ohne Worker.
+    monkeypatch.setenv("AUDIO_PI_DECODE_IN_SUBPROCESS", "0")
 
     dummy_music = DummyMusic()
     monkeypatch.setitem(sys.modules, "pygame", _create_dummy_pygame(dummy_music))
@@ -122,10 +125,15 @@ def test_play_item_handles_decode_error(monkeypatch, tmp_path, caplog):
     @contextmanager
     def dummy_connection():
         class DummyCursor:
-            def execute(self, *_args, **_kwargs):
-                return None
+            query = ""
+
+            def execute(self, query, *_args, **_kwargs):
+                self.query = query
+                return self
 
             def fetchone(self):
+                if "FROM settings" in self.query:
+                    return None
                 return {"filename": broken_file.name, "duration_seconds": 5}
 
         yield (None, DummyCursor())
@@ -158,7 +166,13 @@ def test_play_now_thread_handles_decode_error(monkeypatch, tmp_path, caplog):
     @contextmanager
     def dummy_playlist_connection():
         class DummyCursor:
-            def execute(self, *_args, **_kwargs):
+            query = ""
+
+            def execute(self, query, *_args, **_kwargs):
+                self.query = query
+                return self
+
+            def fetchone(self):
                 return None
 
             def fetchall(self):
@@ -193,10 +207,15 @@ def test_play_item_keeps_amp_active_for_bt(monkeypatch, tmp_path, caplog):
     @contextmanager
     def dummy_connection():
         class DummyCursor:
-            def execute(self, *_args, **_kwargs):
-                return None
+            query = ""
+
+            def execute(self, query, *_args, **_kwargs):
+                self.query = query
+                return self
 
             def fetchone(self):
+                if "FROM settings" in self.query:
+                    return None
                 return {"filename": "missing.mp3", "duration_seconds": 5}
 
         yield (None, DummyCursor())
@@ -228,3 +247,57 @@ def test_play_item_keeps_amp_active_for_bt(monkeypatch, tmp_path, caplog):
     assert any(
         "Bluetooth-Verbindung aktiv" in record.message for record in caplog.records
     )
+
+
+def test_wait_for_music_playback_blocks_on_end_event(monkeypatch, tmp_path):
+    app_module, dummy_music = _setup_app(monkeypatch, tmp_path)
+
+    finished = threading.Event()
+    monkeypatch.setattr(dummy_music, "get_busy", lambda: not finished.is_set())
+
+    wait_threads = []
+
+    def fake_event_wait():
+        wait_threads.append(threading.current_thread().name)
+        if len(wait_threads) == 1:
+            finished.set()
+            return types.SimpleNamespace(type=25)
+        raise RuntimeError("Ereignis-Queue geschlossen")
+
+    app_module.pygame.event = types.SimpleNamespace(wait=fake_event_wait)
+    monkeypatch.setattr(app_module, "MUSIC_END_EVENT", 25)
+    monkeypatch.setattr(app_module, "_music_end_signal", threading.Event())
+    monkeypatch.setattr(app_module, "_music_end_watcher", None)
+
+    def fail_sleep(*_args, **_kwargs):
+        raise AssertionError("Polling-Sleep sollte nicht genutzt werden")
+
+    monkeypatch.setattr(app_module.time, "sleep", fail_sleep)
+
+    app_module._wait_for_music_playback(None)
+    app_module._music_end_watcher.join(timeout=1)
+
+    assert wait_threads == ["music-end-watcher", "music-end-watcher"]
+    assert threading.current_thread().name not in wait_threads
+    assert app_module.MUSIC_END_EVENT is None
+
+
+def test_background_decode_error_is_shown_on_next_request(monkeypatch, tmp_path):
+    app_module, _dummy_music = _setup_app(monkeypatch, tmp_path)
+
+    error = CouldntDecodeError("kaputt")
+    app_module._handle_audio_decode_failure(str(tmp_path / "broken.mp3"), error)
+    app_module._handle_audio_decode_failure(str(tmp_path / "broken.mp3"), error)
+    assert list(app_module._pending_user_messages) == [
+        "Audio-Datei konnte nicht dekodiert werden: broken.mp3"
+    ]
+
+    monkeypatch.setattr(
+        app_module, "current_user", types.SimpleNamespace(is_authenticated=True)
+    )
+    with app_module.app.test_request_context("/"):
+        app_module.deliver_pending_user_messages()
+        messages = get_flashed_messages()
+
+    assert messages == ["Audio-Datei konnte nicht dekodiert werden: broken.mp3"]
+    assert not app_module._pending_user_messages
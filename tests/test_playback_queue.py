@@ -0,0 +1,36 @@
+import os
+import threading
+import time
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test")
+os.environ.setdefault("TESTING", "1")
+
+import app  # noqa: E402
+
+
+def test_fifo_lock_serves_waiters_in_arrival_order():
+    lock = app._FifoLock()
+    order = []
+    lock.acquire()
+
+    threads = []
+    for index in range(3):
+        def worker(index=index):
+            with lock:
+                order.append(index)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+        # Warten, bis der Thread in der Warteschlange steht
+        deadline = time.monotonic() + 1.0
+        while len(lock._waiters) <= index and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    assert len(lock._waiters) == 3
+    lock.release()
+    for thread in threads:
+        thread.join(timeout=1.0)
+
+    assert order == [0, 1, 2]
+    assert lock.locked() is False
@@ -1,5 +1,6 @@
 import importlib
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -351,3 +352,45 @@ def test_play_item_respects_playlist_positions(client, monkeypatch):
 
     assert play_result is True
     assert processed_files == ["b_title.mp3", "a_title.mp3"]
+
+
+def test_play_item_prefetches_next_playlist_track(client, monkeypatch):
+    test_client, app_module = client
+    playlist_id = _insert_playlist(app_module)
+    filenames = ("first.mp3", "second.mp3", "third.mp3")
+    upload_dir = Path(app_module.app.config["UPLOAD_FOLDER"])
+    for position, filename in enumerate(filenames):
+        file_id = _insert_audio_file(app_module, filename=filename)
+        with app_module.get_db_connection() as (conn, cursor):
+            cursor.execute(
+                "INSERT INTO playlist_files (playlist_id, file_id, position) VALUES (?, ?, ?)",
+                (playlist_id, file_id, position),
+            )
+            conn.commit()
+        (upload_dir / filename).write_bytes(b"test")
+
+    prepared_threads = {}
+    loaded = []
+
+    def fake_normalized_path(file_path):
+        prepared_threads[Path(file_path).name] = threading.current_thread().name
+        return file_path
+
+    monkeypatch.setattr(app_module, "_get_normalized_audio_path", fake_normalized_path)
+    monkeypatch.setattr(
+        app_module.pygame.mixer.music, "load", lambda path: loaded.append(Path(path).name)
+    )
+    monkeypatch.setattr(app_module.pygame.mixer.music, "play", lambda: None)
+    monkeypatch.setattr(app_module.pygame.mixer.music, "get_busy", lambda: False)
+    monkeypatch.setattr(app_module, "set_sink", lambda sink: True)
+    monkeypatch.setattr(app_module, "activate_amplifier", lambda: None)
+    monkeypatch.setattr(app_module, "deactivate_amplifier", lambda: None)
+    monkeypatch.setattr(app_module, "is_bt_connected", lambda: False)
+    monkeypatch.setattr(app_module.time, "sleep", lambda *_, **__: None)
+
+    assert app_module.play_item(playlist_id, "playlist", delay=0) is True
+
+    assert loaded == list(filenames)
+    assert prepared_threads["first.mp3"] == threading.current_thread().name
+    assert prepared_threads["second.mp3"].startswith("playlist-prefetch")
+    assert prepared_threads["third.mp3"].startswith("playlist-prefetch")
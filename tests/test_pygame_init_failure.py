@@ -25,11 +25,15 @@ def _create_dummy_pygame(pytest_module):
         play=_fail,
     )
 
-    def failing_init():
+    init_calls = []
+
+    def failing_init(**kwargs):
+        init_calls.append(kwargs)
         raise DummyPygameError("pygame mixer init failure")
 
     dummy_mixer = types.SimpleNamespace(init=failing_init, music=dummy_music)
     dummy_pygame = types.ModuleType("pygame")
+    dummy_pygame.init_calls = init_calls
     dummy_pygame.mixer = dummy_mixer
     dummy_pygame.error = DummyPygameError
     return dummy_pygame
@@ -90,6 +94,9 @@ def test_pygame_init_failure(monkeypatch, tmp_path):
     app_module = importlib.import_module("app")
 
     assert app_module.pygame_available is False
+    assert dummy_pygame.init_calls == [
+        {"frequency": 44100, "size": -16, "channels": 2, "buffer": 4096}
+    ]
 
     app_module.app.config["LOGIN_DISABLED"] = True
 
@@ -1,5 +1,6 @@
 import importlib
 import sys
+import types
 from pathlib import Path
 
 import pytest
@@ -73,5 +74,63 @@ def test_set_relay_invert_updates_gpio_level(monkeypatch, app_module):
         app_module.set_relay_invert()
 
     assert ("write", app_module.AMP_OFF_LEVEL) in writes
-    assert ("free", None) in writes
+    assert ("free", None) not in writes
     assert app_module.amplifier_claimed is False
+
+
+def test_amplifier_line_claimed_once(monkeypatch, app_module):
+    calls = []
+
+    dummy_gpio = types.SimpleNamespace(
+        gpio_claim_output=lambda handle, pin, lFlags=0, level=0: calls.append(
+            ("claim", pin)
+        ),
+        gpio_write=lambda handle, pin, level: calls.append(("write", level)),
+        gpio_free=lambda handle, pin: calls.append(("free", pin)),
+    )
+    monkeypatch.setattr(app_module, "GPIO", dummy_gpio)
+    monkeypatch.setattr(app_module, "GPIO_AVAILABLE", True)
+
+    for _ in range(3):
+        app_module.activate_amplifier()
+        app_module.deactivate_amplifier()
+
+    assert [entry for entry in calls if entry[0] == "claim"] == [
+        ("claim", app_module.GPIO_PIN_ENDSTUFE)
+    ]
+    assert not [entry for entry in calls if entry[0] == "free"]
+
+    app_module._release_amplifier_line()
+    assert calls[-1] == ("free", app_module.GPIO_PIN_ENDSTUFE)
+    assert app_module.amplifier_line_pin is None
+
+
+def test_amplifier_skips_redundant_level_writes(monkeypatch, app_module):
+    calls = []
+
+    dummy_gpio = types.SimpleNamespace(
+        gpio_claim_output=lambda handle, pin, lFlags=0, level=0: calls.append(
+            ("claim", level)
+        ),
+        gpio_write=lambda handle, pin, level: calls.append(("write", level)),
+        gpio_free=lambda handle, pin: calls.append(("free", pin)),
+    )
+    monkeypatch.setattr(app_module, "GPIO", dummy_gpio)
+    monkeypatch.setattr(app_module, "GPIO_AVAILABLE", True)
+
+    for _ in range(3):
+        app_module.activate_amplifier()
+    app_module.deactivate_amplifier()
+    app_module.deactivate_amplifier()
+
+    writes = [entry for entry in calls if entry[0] == "write"]
+    assert writes == [
+        ("write", app_module.AMP_ON_LEVEL),
+        ("write", app_module.AMP_OFF_LEVEL),
+    ]
+    assert app_module.amplifier_claimed is False
+
+    app_module._release_amplifier_line()
+    calls.clear()
+    app_module.activate_amplifier()
+    assert ("write", app_module.AMP_ON_LEVEL) in calls
@@ -239,3 +239,101 @@ def test_once_schedule_remains_pending_when_playback_busy(monkeypatch):
         "SELECT executed FROM schedules WHERE id=?", (schedule_id,)
     ).fetchone()
     assert row["executed"] == 0
+
+
+def test_run_write_transaction_retries_once_when_locked():
+    file_id = _insert_audio_file("locked.mp3", 30.0)
+    attempts = []
+
+    def _update(_conn, cursor):
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise app.sqlite3.OperationalError("database is locked")
+        cursor.execute(
+            "UPDATE audio_files SET duration_seconds=? WHERE id=?", (45.0, file_id)
+        )
+        return "ok"
+
+    assert app.run_write_transaction(_update) == "ok"
+    assert len(attempts) == 2
+    app.cursor.execute("SELECT duration_seconds FROM audio_files WHERE id=?", (file_id,))
+    assert app.cursor.fetchone()[0] == 45.0
+
+
+def _insert_daily_schedule(file_id, start_date, end_date):
+    app.cursor.execute(
+        """
+        INSERT INTO schedules (item_id, item_type, time, repeat, delay, start_date, end_date)
+        VALUES (?, 'file', '08:00:00', 'daily', 0, ?, ?)
+        """,
+        (file_id, start_date, end_date),
+    )
+    app.conn.commit()
+    return app.cursor.lastrowid
+
+
+def test_has_schedule_conflict_prefilters_disjoint_date_ranges():
+    existing_file = _insert_audio_file("morning.mp3", 600.0)
+    new_file = _insert_audio_file("news.mp3", 300.0)
+    _insert_daily_schedule(existing_file, "2024-01-01", "2024-01-31")
+    new_schedule = {
+        "item_id": str(new_file),
+        "item_type": "file",
+        "time": "08:05:00",
+        "repeat": "daily",
+        "delay": 0,
+        "start_date": "2024-06-01",
+        "end_date": "2024-06-30",
+        "day_of_month": None,
+    }
+    first_date = app.parse_schedule_date("2024-06-01")
+
+    with app.get_db_connection() as (_conn, cursor):
+        window_start, window_end = app._schedule_conflict_window(new_schedule, first_date)
+        cursor.execute(
+            app._SCHEDULE_CONFLICT_CANDIDATES_SQL,
+            {"window_start": window_start, "window_end": window_end},
+        )
+        assert cursor.fetchall() == []
+        assert app._has_schedule_conflict(cursor, new_schedule, 300.0, first_date) is False
+
+    _insert_daily_schedule(existing_file, "2024-05-01", None)
+    with app.get_db_connection() as (_conn, cursor):
+        assert app._has_schedule_conflict(cursor, new_schedule, 300.0, first_date) is True
+
+
+def test_has_schedule_conflict_reads_candidate_durations_in_one_query():
+    files = [_insert_audio_file(f"track{index}.mp3", 600.0) for index in range(3)]
+    playlist_id = _create_playlist("Morgen", files[:2])
+    for file_id in files:
+        _insert_daily_schedule(file_id, "2024-01-01", "2024-01-31")
+    app.cursor.execute(
+        """
+        INSERT INTO schedules (item_id, item_type, time, repeat, delay, start_date, end_date)
+        VALUES (?, 'playlist', '12:00:00', 'daily', 0, '2024-01-01', '2024-01-31')
+        """,
+        (playlist_id,),
+    )
+    app.conn.commit()
+    new_schedule = {
+        "item_id": str(files[0]),
+        "item_type": "file",
+        "time": "12:15:00",
+        "repeat": "daily",
+        "delay": 0,
+        "start_date": "2024-01-10",
+        "end_date": "2024-01-10",
+        "day_of_month": None,
+    }
+    first_date = app.parse_schedule_date("2024-01-10")
+
+    statements = []
+    with app.get_db_connection() as (conn, cursor):
+        conn.set_trace_callback(statements.append)
+        try:
+            conflict = app._has_schedule_conflict(cursor, new_schedule, 60.0, first_date)
+        finally:
+            conn.set_trace_callback(None)
+
+    assert conflict is True
+    assert len(statements) == 1
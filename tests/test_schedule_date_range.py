@@ -244,6 +244,21 @@ def test_monthly_schedule_trigger_respects_day():
     assert next_run.month == 3 and next_run.day == 31
 
 
+def test_load_schedules_skips_expired_recurring_schedules():
+    today = datetime.now().date()
+    expired_id = _insert_recurring_schedule(
+        today - timedelta(days=10), today - timedelta(days=1)
+    )
+    active_id = _insert_recurring_schedule(today - timedelta(days=10), today)
+    open_ended_id = _insert_recurring_schedule(None, None)
+
+    app.load_schedules()
+
+    assert app.scheduler.get_job(str(expired_id)) is None
+    assert app.scheduler.get_job(str(active_id)) is not None
+    assert app.scheduler.get_job(str(open_ended_id)) is not None
+
+
 def test_job_next_run_time_uses_local_timezone():
     future = datetime.now() + timedelta(minutes=5)
     future = future.replace(microsecond=0)
@@ -262,3 +277,30 @@ def test_job_next_run_time_uses_local_timezone():
     finally:
         app.scheduler.shutdown(wait=False)
         app.scheduler = BackgroundScheduler(timezone=app.LOCAL_TZ)
+
+
+def test_load_schedules_only_replaces_changed_jobs():
+    unchanged_id = _insert_recurring_schedule(None, None)
+    changed_id = _insert_recurring_schedule(None, None)
+    removed_id = _insert_recurring_schedule(None, None)
+
+    app.load_schedules()
+    unchanged_job = app.scheduler.get_job(str(unchanged_id))
+    changed_job = app.scheduler.get_job(str(changed_id))
+
+    app.cursor.execute(
+        "UPDATE schedules SET time=? WHERE id=?", ('06:30:00', changed_id)
+    )
+    added_id = _insert_recurring_schedule(None, None)
+    app.cursor.execute('DELETE FROM schedules WHERE id=?', (removed_id,))
+    app.conn.commit()
+
+    app.load_schedules()
+
+    assert app.scheduler.get_job(str(unchanged_id)) is unchanged_job
+    reloaded = app.scheduler.get_job(str(changed_id))
+    assert reloaded is not None and reloaded is not changed_job
+    hour_field = next(field for field in reloaded.trigger.fields if field.name == 'hour')
+    assert str(hour_field) == '6'
+    assert app.scheduler.get_job(str(removed_id)) is None
+    assert app.scheduler.get_job(str(added_id)) is not None
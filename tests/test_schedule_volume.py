@@ -259,6 +259,7 @@ def test_play_item_scales_volume_temporarily(monkeypatch, tmp_path):
             Path(dest).write_bytes(b"data")
 
     monkeypatch.setattr(app.AudioSegment, "from_file", lambda path: DummySegment())
+    monkeypatch.setattr(app, "AUDIO_DECODE_IN_SUBPROCESS", False)
     monkeypatch.setattr(app, "set_sink", lambda sink: True)
     monkeypatch.setattr(app, "activate_amplifier", lambda: None)
     monkeypatch.setattr(app, "deactivate_amplifier", lambda: None)
@@ -109,3 +109,24 @@ def test_recurring_schedule_runs_after_delay(monkeypatch, managed_scheduler):
     )
 
     _wait_for_execution(executed)
+
+
+def test_skip_past_once_schedules_marks_all_overdue_rows(monkeypatch):
+    past = datetime.now() - timedelta(hours=1)
+    future = datetime.now() + timedelta(hours=1)
+    rows = [past - timedelta(minutes=offset) for offset in range(3)] + [future]
+    for run_time in rows:
+        app.cursor.execute(
+            """
+            INSERT INTO schedules (item_id, item_type, time, repeat, delay, start_date, end_date, day_of_month, executed)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+            """,
+            (1, "file", run_time.strftime("%Y-%m-%d %H:%M:%S"), "once", 0, None, None, None),
+        )
+    app.conn.commit()
+
+    app.skip_past_once_schedules()
+
+    app.cursor.execute("SELECT time, executed FROM schedules ORDER BY time")
+    executed_flags = [row["executed"] for row in app.cursor.fetchall()]
+    assert executed_flags == [1, 1, 1, 0]
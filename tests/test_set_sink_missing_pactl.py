@@ -8,6 +8,22 @@ import pytest
 from flask import get_flashed_messages
 
 
+class FakePulseError(Exception):
+    pass
+
+
+class FakePulseDisconnected(Exception):
+    pass
+
+
+def _fake_pulsectl(pulse_class):
+    return types.SimpleNamespace(
+        Pulse=pulse_class,
+        PulseError=FakePulseError,
+        PulseDisconnected=FakePulseDisconnected,
+    )
+
+
 class DummyMusic:
     def set_volume(self, value):
         self.last_set_volume = value
@@ -88,10 +104,15 @@ def test_set_sink_handles_missing_pactl(monkeypatch, tmp_path, app_module):
     @contextmanager
     def dummy_connection():
         class DummyCursor:
-            def execute(self, *_args, **_kwargs):
-                return None
+            query = ""
+
+            def execute(self, query, *_args, **_kwargs):
+                self.query = query
+                return self
 
             def fetchone(self):
+                if "FROM settings" in self.query:
+                    return None
                 return {"filename": audio_file.name, "duration_seconds": 1}
 
         yield (None, DummyCursor())
@@ -104,3 +125,95 @@ def test_set_sink_handles_missing_pactl(monkeypatch, tmp_path, app_module):
 
     assert play_result is True
     assert flashes, "Erwarte eine Nutzerbenachrichtigung bei fehlendem pactl"
+
+
+def test_sink_helpers_prefer_libpulse_over_pactl(monkeypatch, app_module):
+    class FakePulse:
+        instances = []
+
+        def __init__(self, client_name):
+            self.client_name = client_name
+            self.default_sink = "alsa_output.default"
+            self.closed = False
+            FakePulse.instances.append(self)
+
+        def server_info(self):
+            return types.SimpleNamespace(default_sink_name=self.default_sink)
+
+        def sink_list(self):
+            return [
+                types.SimpleNamespace(name="alsa_output.default"),
+                types.SimpleNamespace(name=app_module.DAC_SINK),
+            ]
+
+        def sink_default_set(self, sink_name):
+            self.default_sink = sink_name
+
+        def close(self):
+            self.closed = True
+
+    def fail_subprocess(*args, **kwargs):
+        pytest.fail(f"pactl sollte nicht gestartet werden: {args}")
+
+    monkeypatch.setattr(app_module, "PULSECTL_AVAILABLE", True)
+    monkeypatch.setattr(app_module, "pulsectl", _fake_pulsectl(FakePulse))
+    monkeypatch.setattr(app_module, "_pulse_client", None)
+    monkeypatch.setattr(app_module.subprocess, "run", fail_subprocess)
+    monkeypatch.setattr(app_module.subprocess, "call", fail_subprocess)
+
+    assert app_module.get_current_sink() == "alsa_output.default"
+    assert app_module.set_sink(app_module.DAC_SINK) is True
+    assert app_module.get_current_sink() == app_module.DAC_SINK
+    assert len(FakePulse.instances) == 1
+    assert FakePulse.instances[0].client_name == "audio-pi"
+
+    def broken_server_info():
+        raise FakePulseDisconnected("Verbindung verloren")
+
+    FakePulse.instances[0].server_info = broken_server_info
+    monkeypatch.setattr(app_module, "_run_pactl_command", lambda *_args: "fallback_sink")
+    assert app_module.get_current_sink() == "fallback_sink"
+    assert FakePulse.instances[0].closed is True
+    assert app_module._pulse_client is None
+
+
+def test_set_sink_reports_libpulse_operation_failure(monkeypatch, app_module):
+    class FakePulse:
+        instances = []
+
+        def __init__(self, client_name):
+            self.closed = False
+            FakePulse.instances.append(self)
+
+        def sink_default_set(self, sink_name):
+            raise FakePulseError(f"Unbekannter Sink {sink_name}")
+
+        def close(self):
+            self.closed = True
+
+    def fail_subprocess(*args, **kwargs):
+        pytest.fail(f"pactl sollte nicht wiederholt werden: {args}")
+
+    monkeypatch.setattr(app_module, "PULSECTL_AVAILABLE", True)
+    monkeypatch.setattr(app_module, "pulsectl", _fake_pulsectl(FakePulse))
+    monkeypatch.setattr(app_module, "_pulse_client", None)
+    monkeypatch.setattr(app_module, "_list_pulse_sinks", lambda: [app_module.DAC_SINK])
+    monkeypatch.setattr(app_module.subprocess, "call", fail_subprocess)
+
+    assert app_module.set_sink(app_module.DAC_SINK) is False
+    assert app_module.audio_status["dac_sink_detected"] is False
+    assert FakePulse.instances[0].closed is False
+    assert app_module._pulse_client is FakePulse.instances[0]
+
+
+def test_pulse_call_falls_back_when_connect_fails(monkeypatch, app_module):
+    def refuse_connection(_client_name):
+        raise FakePulseError("Failed to connect to pulseaudio server")
+
+    monkeypatch.setattr(app_module, "PULSECTL_AVAILABLE", True)
+    monkeypatch.setattr(app_module, "pulsectl", _fake_pulsectl(refuse_connection))
+    monkeypatch.setattr(app_module, "_pulse_client", None)
+    monkeypatch.setattr(app_module, "_run_pactl_command", lambda *_args: "fallback_sink")
+
+    assert app_module.get_current_sink() == "fallback_sink"
+    assert app_module._pulse_client is None
@@ -89,10 +89,10 @@ def test_volume_missing_pactl_warns(monkeypatch, client):
     assert response.status_code == 200
     assert [
         ["amixer", "sset", "Master", "50%"],
-        ["systemctl", "start", "audio-pi-alsactl.service"],
+        ["systemctl", "start", "--no-block", "audio-pi-alsactl.service"],
     ] == commands
     assert app_module._PACTL_MISSING_MESSAGE.encode("utf-8") in response.data
-    assert b"Lautst\xc3\xa4rke persistent gesetzt" in response.data
+    assert b"Lautst\xc3\xa4rke gesetzt, Speicherung wird im Hintergrund ausgef\xc3\xbchrt" in response.data
 
 
 def test_volume_missing_pactl_called_process_error(monkeypatch, client_with_sudo):
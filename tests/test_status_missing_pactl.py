@@ -85,3 +85,52 @@ def test_gather_status_fallbacks(monkeypatch, app_module):
     assert status["current_sink"] == "Nicht verfügbar"
     assert "pactl" not in " ".join(str(value).lower() for value in status.values())
     assert flashes == [app_module._PACTL_MISSING_MESSAGE]
+
+
+def test_dashboard_probes_are_cached_until_invalidated(monkeypatch, app_module):
+    sink_calls = []
+    sinks = iter(["alsa_output.dac", "bluez_sink.00_11"])
+
+    def fake_get_current_sink():
+        sink_calls.append(True)
+        return next(sinks)
+
+    monkeypatch.setattr(app_module, "get_current_sink", fake_get_current_sink)
+
+    assert app_module._dashboard_current_sink() == "alsa_output.dac"
+    assert app_module._dashboard_current_sink() == "alsa_output.dac"
+    assert len(sink_calls) == 1
+
+    app_module._invalidate_dashboard_status_cache()
+    assert app_module._dashboard_current_sink() == "bluez_sink.00_11"
+    assert len(sink_calls) == 2
+
+
+def test_gather_status_reads_volume_on_every_render(monkeypatch, app_module):
+    volumes = iter(["Volume: front-left: 30000 /  40% / -23.88 dB", "Volume: 50%"])
+    monkeypatch.setattr(
+        app_module, "_run_pactl_command", lambda *_args: next(volumes, None)
+    )
+    monkeypatch.setattr(app_module, "get_current_sink", lambda: "alsa_output.dac")
+    monkeypatch.setattr(app_module, "is_bt_connected", lambda: False)
+
+    with app_module.app.test_request_context("/status"):
+        assert app_module.gather_status()["current_volume"] == "40%"
+        assert app_module.gather_status()["current_volume"] == "50%"
+
+
+def test_dashboard_probe_errors_are_not_cached(monkeypatch, app_module):
+    outcomes = iter([OSError("PulseAudio weg"), True])
+
+    def flaky_is_bt_connected():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(app_module, "is_bt_connected", flaky_is_bt_connected)
+
+    with pytest.raises(OSError):
+        app_module._dashboard_bt_connected()
+    assert app_module._dashboard_bt_connected() is True
+    assert app_module._dashboard_bt_connected() is True
@@ -272,7 +272,7 @@ def test_system_command_not_found_flash(monkeypatch, tmp_path):
     original_run = app_module.subprocess.run
 
     def fake_run(cmd, *args, **kwargs):
-        if cmd == ["sudo", "systemctl", "reboot"]:
+        if cmd == ["sudo", "-n", "systemctl", "reboot"]:
             return DummyResult()
         return original_run(cmd, *args, **kwargs)
 
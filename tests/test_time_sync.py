@@ -103,7 +103,7 @@ def test_reload_reactivates_subprocess_originals(monkeypatch, tmp_path):
 
     command_with_sudo = app_module.privileged_command("systemctl", "status")
     assert command_with_sudo
-    assert command_with_sudo[0] == "sudo"
+    assert command_with_sudo[:2] == ["sudo", "-n"]
     assert app_module.subprocess.run is app_module._ORIGINAL_SUBPROCESS_FUNCTIONS["run"]
     assert app_module.subprocess.run is original_run
 
@@ -595,3 +595,33 @@ def test_perform_internet_time_sync_cleanup_failure_after_success(monkeypatch, a
         "systemd-timesyncd konnte nicht neu gestartet werden" in message
         for message in messages
     )
+
+
+def test_sync_time_from_internet_runs_in_background_once(monkeypatch, client):
+    client, app_module = client
+    _login(client)
+
+    release = app_module.threading.Event()
+    calls = []
+
+    def slow_sync():
+        calls.append(True)
+        release.wait(5)
+        return True, ["Zeit vom Internet synchronisiert"]
+
+    monkeypatch.setattr(app_module, "perform_internet_time_sync", slow_sync)
+    monkeypatch.setenv("AUDIO_PI_TIMESYNC_REQUEST_WAIT_SECONDS", "0")
+
+    first = csrf_post(client, "/sync_time_from_internet", follow_redirects=True)
+    second = csrf_post(client, "/sync_time_from_internet", follow_redirects=True)
+
+    assert "läuft im Hintergrund" in first.get_data(as_text=True)
+    assert "läuft im Hintergrund" in second.get_data(as_text=True)
+    assert len(calls) == 1
+
+    release.set()
+    assert app_module._TIME_SYNC_TASK.wait(5)
+    assert app_module._TIME_SYNC_TASK.result == (
+        True,
+        ["Zeit vom Internet synchronisiert"],
+    )
@@ -29,6 +29,11 @@ def app_module(tmp_path, monkeypatch):
     upload_dir.mkdir()
     app_module.app.config["UPLOAD_FOLDER"] = str(upload_dir)
 
+    # Keine benannte Zone des Testrechners einlesen; die Tests simulieren sie.
+    monkeypatch.delenv("TZ", raising=False)
+    monkeypatch.setattr(app_module, "_TIMEZONE_MONITOR_PATH", tmp_path / "localtime")
+    monkeypatch.setattr(app_module, "_TIMEZONE_NAME_FILE", tmp_path / "timezone")
+
     yield app_module
 
     if hasattr(app_module, "conn") and app_module.conn is not None:
@@ -233,3 +238,48 @@ def test_refresh_skips_scheduler_configure_when_timezone_unchanged(
     monkeypatch.setattr(app_module, "datetime", DateTimeProxy())
 
     assert app_module.refresh_local_timezone() == current_tz
+
+
+def test_detect_local_timezone_prefers_named_zone(monkeypatch, app_module):
+    berlin = app_module.ZoneInfo("Europe/Berlin")
+    monkeypatch.setattr(app_module, "_system_zoneinfo", lambda: berlin)
+    monkeypatch.setattr(
+        app_module,
+        "_current_local_time",
+        lambda: datetime.now(timezone(datetime.now(berlin).utcoffset())),
+    )
+
+    detected = app_module._detect_local_timezone()
+
+    assert detected is berlin
+    winter = datetime(2024, 1, 15, 12, 0, tzinfo=detected)
+    summer = datetime(2024, 7, 15, 12, 0, tzinfo=detected)
+    assert winter.utcoffset() == timedelta(hours=1)
+    assert summer.utcoffset() == timedelta(hours=2)
+
+
+def test_detect_local_timezone_ignores_mismatching_named_zone(monkeypatch, app_module):
+    fixed = timezone(timedelta(hours=5, minutes=30))
+    monkeypatch.setattr(
+        app_module, "_system_zoneinfo", lambda: app_module.ZoneInfo("Europe/Berlin")
+    )
+    monkeypatch.setattr(
+        app_module, "_current_local_time", lambda: datetime.now(fixed)
+    )
+
+    assert app_module._detect_local_timezone() is fixed
+
+
+def test_system_zoneinfo_reads_localtime_link_and_tz(monkeypatch, tmp_path, app_module):
+    zone_file = tmp_path / "usr" / "share" / "zoneinfo" / "Europe" / "Berlin"
+    zone_file.parent.mkdir(parents=True)
+    zone_file.write_bytes(b"")
+    (tmp_path / "localtime").symlink_to(zone_file)
+
+    assert app_module._system_zoneinfo() == app_module.ZoneInfo("Europe/Berlin")
+
+    monkeypatch.setenv("TZ", ":America/New_York")
+    assert app_module._system_zoneinfo() == app_module.ZoneInfo("America/New_York")
+
+    monkeypatch.setenv("TZ", "Nowhere/Invalid")
+    assert app_module._system_zoneinfo() is None
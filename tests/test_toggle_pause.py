@@ -0,0 +1,58 @@
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch):
+    monkeypatch.setenv("FLASK_SECRET_KEY", "testkey")
+    monkeypatch.setenv("TESTING", "1")
+    monkeypatch.setenv("DB_FILE", str(tmp_path / "test.db"))
+    monkeypatch.setenv("INITIAL_ADMIN_PASSWORD", "password")
+
+    repo_root = Path(__file__).resolve().parents[1]
+    monkeypatch.syspath_prepend(str(repo_root))
+    if "app" in sys.modules:
+        del sys.modules["app"]
+    module = importlib.import_module("app")
+    module.app.config["LOGIN_DISABLED"] = True
+    yield module
+    module.app.config["LOGIN_DISABLED"] = False
+
+
+def _toggle(app_module):
+    with app_module.app.test_request_context("/toggle_pause", method="POST"):
+        app_module.toggle_pause.__wrapped__()
+
+
+def test_toggle_pause_alternates_pause_and_unpause(app_module, monkeypatch):
+    calls = []
+    busy = {"value": True}
+    fake_music = types.SimpleNamespace(
+        get_busy=lambda: busy["value"],
+        pause=lambda: calls.append("pause"),
+        unpause=lambda: calls.append("unpause"),
+        stop=lambda: calls.append("stop"),
+    )
+    monkeypatch.setattr(app_module, "pygame_available", True)
+    monkeypatch.setattr(app_module.pygame.mixer, "music", fake_music)
+
+    _toggle(app_module)
+    assert app_module._playback_paused.is_set()
+
+    # Pausierte Musik meldet in pygame kein get_busy() mehr.
+    busy["value"] = False
+    _toggle(app_module)
+    assert not app_module._playback_paused.is_set()
+
+    _toggle(app_module)
+    assert calls == ["pause", "unpause"]
+
+    app_module._playback_paused.set()
+    monkeypatch.setattr(app_module, "is_bt_connected", lambda: False)
+    monkeypatch.setattr(app_module, "deactivate_amplifier", lambda: None)
+    app_module._perform_stop_playback(flash_user=False)
+    assert not app_module._playback_paused.is_set()
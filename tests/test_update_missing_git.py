@@ -5,7 +5,9 @@ from tests.test_wlan_connect import _login_admin, client as wlan_client_fixture
 
 
 @pytest.fixture
-def client(wlan_client_fixture):
+def client(wlan_client_fixture, monkeypatch):
+    # Die Tests prüfen den git-CLI-Pfad; pygit2 darf nicht das echte Repo holen.
+    monkeypatch.setattr(wlan_client_fixture[1], "PYGIT2_AVAILABLE", False)
     return wlan_client_fixture
 
 
@@ -13,10 +15,10 @@ def test_update_route_handles_missing_git(monkeypatch, client):
     flask_client, app_module = client
     _login_admin(flask_client)
 
-    def fake_check_call(*args, **kwargs):
+    def fake_run(*args, **kwargs):
         raise FileNotFoundError("git not found")
 
-    monkeypatch.setattr(app_module.subprocess, "check_call", fake_check_call)
+    monkeypatch.setattr(app_module.subprocess, "run", fake_run)
 
     response = csrf_post(flask_client, "/update", follow_redirects=False)
 
@@ -27,3 +29,109 @@ def test_update_route_handles_missing_git(monkeypatch, client):
 
     assert flashes
     assert flashes[-1][1] == "git nicht verfügbar"
+
+
+def test_update_route_rejects_concurrent_update(monkeypatch, client):
+    flask_client, app_module = client
+    _login_admin(flask_client)
+
+    original_run = app_module.subprocess.run
+    git_calls = []
+
+    def tracking_run(cmd, *args, **kwargs):
+        if list(cmd[:1]) == ["git"]:
+            git_calls.append(list(cmd))
+            return app_module.subprocess.CompletedProcess(cmd, 0, "", "")
+        return original_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(app_module.subprocess, "run", tracking_run)
+
+    assert app_module._UPDATE_LOCK.acquire(blocking=False)
+    try:
+        response = csrf_post(flask_client, "/update", follow_redirects=False)
+    finally:
+        app_module._UPDATE_LOCK.release()
+
+    assert response.status_code == 302
+    with flask_client.session_transaction() as session:
+        flashes = session.get("_flashes", [])
+    assert flashes[-1][1] == "Update läuft bereits"
+    assert git_calls == []
+
+
+def test_update_route_uses_fast_forward_only(monkeypatch, client):
+    flask_client, app_module = client
+    _login_admin(flask_client)
+    commands = []
+
+    original_run = app_module.subprocess.run
+
+    def fake_run(cmd, *args, **kwargs):
+        if list(cmd[:1]) != ["git"]:
+            return original_run(cmd, *args, **kwargs)
+        commands.append(list(cmd))
+        return app_module.subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(app_module.subprocess, "run", fake_run)
+
+    csrf_post(flask_client, "/update", follow_redirects=False)
+
+    assert ["git", "pull", "--ff-only"] in commands
+
+
+def test_update_route_skips_git_cli_when_pygit2_succeeds(monkeypatch, client):
+    flask_client, app_module = client
+    _login_admin(flask_client)
+    commands = []
+
+    original_run = app_module.subprocess.run
+
+    def fake_run(cmd, *args, **kwargs):
+        if list(cmd[:1]) != ["git"]:
+            return original_run(cmd, *args, **kwargs)
+        commands.append(list(cmd))
+        return app_module.subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(app_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(app_module, "_update_repository_with_pygit2", lambda: True)
+
+    csrf_post(flask_client, "/update", follow_redirects=False)
+
+    with flask_client.session_transaction() as session:
+        flashes = session.get("_flashes", [])
+    assert flashes[-1][1] == "Update erfolgreich"
+    assert commands == []
+
+
+def test_update_route_returns_202_for_json_clients(monkeypatch, client):
+    flask_client, app_module = client
+    _login_admin(flask_client)
+
+    original_run = app_module.subprocess.run
+
+    def fake_run(cmd, *args, **kwargs):
+        if list(cmd[:1]) != ["git"]:
+            return original_run(cmd, *args, **kwargs)
+        return app_module.subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(app_module.subprocess, "run", fake_run)
+
+    response = csrf_post(
+        flask_client,
+        "/update",
+        headers={"Accept": "application/json"},
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 202
+    assert response.headers["Location"].endswith("/job_status/update")
+    assert app_module._UPDATE_TASK.wait(2.0)
+
+    status = flask_client.get("/job_status/update").get_json()
+    assert status == {
+        "job": "update",
+        "running": False,
+        "success": True,
+        "messages": ["Update erfolgreich"],
+    }
+    assert flask_client.get("/job_status/unbekannt").status_code == 404
@@ -18,6 +18,7 @@ def client(tmp_path, monkeypatch):
     monkeypatch.setenv("DB_FILE", str(tmp_path / "test.db"))
     monkeypatch.setenv("INITIAL_ADMIN_PASSWORD", "password")
     monkeypatch.setenv("AUDIO_PI_MAX_UPLOAD_MB", "1")
+    monkeypatch.setenv("AUDIO_PI_DECODE_IN_SUBPROCESS", "0")
 
     repo_root = Path(__file__).resolve().parents[1]
     sys.path.insert(0, str(repo_root))
@@ -57,6 +58,10 @@ def client(tmp_path, monkeypatch):
 
     with app_module.app.test_client() as client:
         yield client, upload_dir, app_module
+    # Vorab-Normalisierung abschließen, bevor die Datenbank geschlossen wird
+    executor = app_module._normalize_prewarm_executor
+    if executor is not None:
+        executor.shutdown(wait=True)
 
     app_module.conn.close()
 
@@ -81,14 +86,14 @@ def test_upload_twice_generates_new_name(client):
 
     res1 = csrf_post(client, "/upload", data=make_data(), follow_redirects=True)
     assert b"hochgeladen" in res1.data
-    files = sorted(upload_dir.iterdir())
+    files = sorted(p for p in upload_dir.iterdir() if p.is_file())
     assert len(files) == 1
     first_name = files[0].name
     assert first_name == "song.mp3"
 
     res2 = csrf_post(client, "/upload", data=make_data(), follow_redirects=True)
     assert b"bereits vorhanden" in res2.data
-    files = sorted(upload_dir.iterdir())
+    files = sorted(p for p in upload_dir.iterdir() if p.is_file())
     assert len(files) == 2
     second_name = files[1].name
     assert second_name != first_name
@@ -148,7 +153,7 @@ def test_upload_same_second_does_not_overwrite(client, monkeypatch):
     assert b"(Versuch 2)" in res3.data
     assert (upload_dir / expected_third).exists()
 
-    files = sorted(p.name for p in upload_dir.iterdir())
+    files = sorted(p.name for p in upload_dir.iterdir() if p.is_file())
     assert {"song.mp3", expected_second, expected_third} == set(files)
 
     conn = sqlite3.connect(app_module.DB_FILE)
@@ -245,3 +250,138 @@ def test_upload_rejects_too_large_file(client):
     count = cursor.fetchone()[0]
     conn.close()
     assert count == 0
+
+
+@pytest.mark.parametrize("spooled_to_disk", [True, False])
+def test_save_uploaded_file_copies_remaining_stream(client, tmp_path, spooled_to_disk):
+    _client, _upload_dir, app_module = client
+    from werkzeug.datastructures import FileStorage
+
+    payload = b"ID3" + os.urandom(64 * 1024)
+    if spooled_to_disk:
+        stream = tempfile.TemporaryFile()
+        stream.write(payload)
+        stream.seek(0)
+    else:
+        stream = io.BytesIO(payload)
+    target = tmp_path / "kopie.mp3"
+
+    with stream:
+        app_module._save_uploaded_file(FileStorage(stream, "song.mp3"), target)
+
+    assert target.read_bytes() == payload
+
+
+@pytest.mark.parametrize("max_size", [1024, 500 * 1024])
+def test_save_uploaded_file_keeps_small_spooled_uploads_in_memory(
+    client, tmp_path, monkeypatch, max_size
+):
+    _client, _upload_dir, app_module = client
+    from werkzeug.datastructures import FileStorage
+
+    payload = b"ID3" + os.urandom(64 * 1024)
+    stream = tempfile.SpooledTemporaryFile(max_size=max_size)
+    stream.write(payload)
+    stream.seek(0)
+    rolled_before = stream._rolled
+    sendfile_calls = []
+    original_sendfile = os.sendfile
+
+    def tracking_sendfile(*args):
+        sendfile_calls.append(args)
+        return original_sendfile(*args)
+
+    monkeypatch.setattr(app_module.os, "sendfile", tracking_sendfile)
+    target = tmp_path / "kopie.mp3"
+
+    with stream:
+        app_module._save_uploaded_file(FileStorage(stream, "song.mp3"), target)
+        rolled_after = stream._rolled
+
+    assert target.read_bytes() == payload
+    assert rolled_after is rolled_before
+    assert bool(sendfile_calls) is rolled_before
+
+
+def test_upload_prewarms_normalized_audio_cache(client, monkeypatch):
+    client, upload_dir, app_module = client
+    csrf_post(
+        client,
+        "/login",
+        data={"username": "admin", "password": "password"},
+        follow_redirects=True,
+    )
+    csrf_post(
+        client,
+        "/change_password",
+        data={"old_password": "password", "new_password": "password1234"},
+        follow_redirects=True,
+        source_url="/change_password",
+    )
+
+    prewarmed = []
+    monkeypatch.setattr(
+        app_module,
+        "_get_normalized_audio_path",
+        lambda path: prewarmed.append(path) or path,
+    )
+    try:
+        response = csrf_post(
+            client,
+            "/upload",
+            data={"file": (io.BytesIO(b"data"), "warm.mp3")},
+            follow_redirects=False,
+        )
+    finally:
+        executor = app_module._normalize_prewarm_executor
+        if executor is not None:
+            executor.shutdown(wait=True)
+        app_module._shutdown_normalize_prewarm()
+
+    assert response.status_code == 302
+    assert prewarmed == [str(upload_dir / "warm.mp3")]
+
+
+def test_upload_reads_duration_from_container_metadata(client, monkeypatch):
+    client, upload_dir, app_module = client
+    csrf_post(
+        client,
+        "/login",
+        data={"username": "admin", "password": "password"},
+        follow_redirects=True,
+    )
+    csrf_post(
+        client,
+        "/change_password",
+        data={"old_password": "password", "new_password": "password1234"},
+        follow_redirects=True,
+        source_url="/change_password",
+    )
+
+    def fake_run(args, **kwargs):
+        return app_module.subprocess.CompletedProcess(args, 0, stdout="42.5\n", stderr="")
+
+    monkeypatch.setattr(app_module, "_resolve_executable", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(app_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(
+        app_module.AudioSegment,
+        "from_file",
+        staticmethod(lambda *_args, **_kwargs: pytest.fail("Upload sollte nicht dekodieren")),
+    )
+
+    response = csrf_post(
+        client,
+        "/upload",
+        data={"file": (io.BytesIO(b"data"), "probe.mp3")},
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 302
+    conn = sqlite3.connect(app_module.DB_FILE)
+    try:
+        row = conn.execute(
+            "SELECT duration_seconds FROM audio_files WHERE filename=?", ("probe.mp3",)
+        ).fetchone()
+    finally:
+        conn.close()
+    assert row == (42.5,)
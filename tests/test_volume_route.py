@@ -134,12 +134,12 @@ def test_volume_command_failure(monkeypatch, client):
 
     assert response.status_code == 200
     assert b"Kommando &#39;pactl&#39; fehlgeschlagen (Code 1)." in response.data
-    assert b"Lautst\xc3\xa4rke persistent gesetzt" in response.data
+    assert b"Lautst\xc3\xa4rke gesetzt, Speicherung wird im Hintergrund ausgef\xc3\xbchrt" in response.data
     command_tuples = [tuple(cmd) if isinstance(cmd, list) else tuple(cmd) for cmd in commands]
     assert (
         ("pactl", "set-sink-volume", "test-sink", "50%") in command_tuples
         and ("amixer", "sset", "Master", "50%") in command_tuples
-        and ("systemctl", "start", "audio-pi-alsactl.service") in command_tuples
+        and ("systemctl", "start", "--no-block", "audio-pi-alsactl.service") in command_tuples
     )
 
 
@@ -178,13 +178,13 @@ def test_volume_failure_when_audio_commands_fail(monkeypatch, client):
     assert response.status_code == 200
     assert b"Kommando &#39;pactl&#39; fehlgeschlagen (Code 1)." in response.data
     assert b"Kommando &#39;amixer&#39; fehlgeschlagen (Code 1)." in response.data
-    assert b"Lautst\xc3\xa4rke persistent gesetzt" not in response.data
+    assert b"Lautst\xc3\xa4rke gesetzt, Speicherung wird im Hintergrund ausgef\xc3\xbchrt" not in response.data
     assert b"Lautst\xc3\xa4rke konnte nicht gesetzt werden" in response.data
     command_tuples = [tuple(cmd) if isinstance(cmd, list) else tuple(cmd) for cmd in commands]
     assert (
         ("pactl", "set-sink-volume", "test-sink", "60%") in command_tuples
         and ("amixer", "sset", "Master", "60%") in command_tuples
-        and ("systemctl", "start", "audio-pi-alsactl.service") in command_tuples
+        and ("systemctl", "start", "--no-block", "audio-pi-alsactl.service") in command_tuples
     )
 
 
@@ -224,12 +224,12 @@ def test_volume_persistence_failure(monkeypatch, client):
         b"Lautst\xc3\xa4rke gesetzt, konnte aber nicht persistent gespeichert werden"
         in response.data
     )
-    assert b"Lautst\xc3\xa4rke persistent gesetzt" not in response.data
+    assert b"Lautst\xc3\xa4rke gesetzt, Speicherung wird im Hintergrund ausgef\xc3\xbchrt" not in response.data
     command_tuples = [tuple(cmd) if isinstance(cmd, list) else tuple(cmd) for cmd in commands]
     assert (
         ("pactl", "set-sink-volume", "test-sink", "55%") in command_tuples
         and ("amixer", "sset", "Master", "55%") in command_tuples
-        and ("systemctl", "start", "audio-pi-alsactl.service") in command_tuples
+        and ("systemctl", "start", "--no-block", "audio-pi-alsactl.service") in command_tuples
     )
 
 
@@ -265,7 +265,7 @@ def test_volume_uses_default_sink(monkeypatch, client):
     if pactl_set_volume:
         assert all(cmd[2] == "@DEFAULT_SINK@" for cmd in pactl_set_volume)
     assert ("amixer", "sset", "Master", "30%") in command_tuples
-    assert ("systemctl", "start", "audio-pi-alsactl.service") in command_tuples
+    assert ("systemctl", "start", "--no-block", "audio-pi-alsactl.service") in command_tuples
 
 
 def test_volume_runs_without_pygame(monkeypatch, client):
@@ -302,11 +302,11 @@ def test_volume_runs_without_pygame(monkeypatch, client):
         b"pygame nicht verf\xc3\xbcgbar, setze ausschlie\xc3\x9flich die Systemlautst\xc3\xa4rke."
         in response.data
     )
-    assert b"Lautst\xc3\xa4rke persistent gesetzt" in response.data
+    assert b"Lautst\xc3\xa4rke gesetzt, Speicherung wird im Hintergrund ausgef\xc3\xbchrt" in response.data
     command_tuples = [tuple(cmd) for cmd in commands]
     assert ("pactl", "set-sink-volume", "test-sink", "70%") in command_tuples
     assert ("amixer", "sset", "Master", "70%") in command_tuples
-    assert ("systemctl", "start", "audio-pi-alsactl.service") in command_tuples
+    assert ("systemctl", "start", "--no-block", "audio-pi-alsactl.service") in command_tuples
 
 
 def test_volume_persistent_command_uses_alsactl_when_sudo_enabled(monkeypatch, client_sudo_enabled):
@@ -337,5 +337,6 @@ def test_volume_persistent_command_uses_alsactl_when_sudo_enabled(monkeypatch, c
     command_tuples = [tuple(cmd) for cmd in commands]
     assert ("pactl", "set-sink-volume", "test-sink", "40%") in command_tuples
     assert ("amixer", "sset", "Master", "40%") in command_tuples
-    assert ("sudo", "alsactl", "store") in command_tuples
-    assert ("systemctl", "start", "audio-pi-alsactl.service") not in command_tuples
+    assert ("sudo", "-n", "alsactl", "store") in command_tuples
+    assert ("systemctl", "start", "--no-block", "audio-pi-alsactl.service") not in command_tuples
+    assert b"Lautst\xc3\xa4rke persistent gesetzt" in response.data
@@ -75,6 +75,7 @@ def app_module(monkeypatch, tmp_path):
 
 
 def _prepare_status_dependencies(monkeypatch, app_module):
+    monkeypatch.setattr(app_module, "_read_wlan_ssid_ioctl", lambda _interface: None)
     monkeypatch.setattr(app_module, "_run_pactl_command", lambda *args: None)
     monkeypatch.setattr(app_module, "get_current_sink", lambda: "Nicht verfügbar")
     monkeypatch.setattr(app_module.pygame.mixer.music, "get_busy", lambda: False)
@@ -142,6 +143,43 @@ def test_gather_status_iwgetid_failure_exit_code(monkeypatch, app_module, caplog
     assert any("iwgetid" in record.message and "Exit-Code" in record.message for record in caplog.records)
 
 
+def test_gather_status_caches_wlan_ssid(monkeypatch, app_module):
+    _prepare_status_dependencies(monkeypatch, app_module)
+    iwgetid_calls = []
+
+    def fake_run(args, **kwargs):
+        if args and args[0] == "iwgetid":
+            iwgetid_calls.append(args)
+            return app_module.subprocess.CompletedProcess(
+                args, 0, stdout="HeimNetz\n", stderr=""
+            )
+        return app_module.subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(app_module.subprocess, "run", fake_run)
+
+    assert app_module.gather_status()["wlan_status"] == "HeimNetz"
+    assert app_module.gather_status()["wlan_status"] == "HeimNetz"
+    assert len(iwgetid_calls) == 1
+
+    app_module._invalidate_wlan_status_cache()
+    app_module.gather_status()
+    assert len(iwgetid_calls) == 2
+
+
+def test_gather_status_prefers_ioctl_ssid(monkeypatch, app_module):
+    _prepare_status_dependencies(monkeypatch, app_module)
+    monkeypatch.setattr(app_module, "_read_wlan_ssid_ioctl", lambda _interface: "Funk")
+
+    def fail_run(args, **kwargs):
+        if args and args[0] == "iwgetid":
+            pytest.fail("iwgetid sollte nicht gestartet werden")
+        return app_module.subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(app_module.subprocess, "run", fail_run)
+
+    assert app_module.gather_status()["wlan_status"] == "Funk"
+
+
 def test_wlan_scan_missing_wpa_cli(monkeypatch, app_module, caplog):
     def fake_run(args, **kwargs):
         if args and "wpa_cli" in args:
@@ -473,3 +473,235 @@ def test_wlan_connect_removes_network_on_failure(client, monkeypatch):
     )
     remove_call_index = calls.index(remove_calls[0])
     assert remove_call_index > psk_call_index
+
+
+def test_wlan_connect_uses_control_socket_session(client, monkeypatch, tmp_path):
+    import socket
+    import threading
+
+    flask_client, app_module = client
+    ctrl_dir = tmp_path / "wpa_ctrl"
+    ctrl_dir.mkdir()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    server.bind(str(ctrl_dir / "wlan0"))
+    server.settimeout(5)
+    received = []
+    reply_addresses = []
+
+    def serve():
+        while True:
+            try:
+                data, addr = server.recvfrom(4096)
+            except OSError:
+                return
+            command = data.decode()
+            received.append(command)
+            reply_addresses.append(addr)
+            reply = "2\n" if command == "ADD_NETWORK" else "OK\n"
+            server.sendto(reply.encode(), addr)
+            if command == "RECONFIGURE":
+                return
+
+    worker = threading.Thread(target=serve, daemon=True)
+    worker.start()
+
+    wpa_cli_calls = []
+    original_run = app_module.subprocess.run
+
+    def tracking_run(args, **kwargs):
+        if "wpa_cli" in args:
+            wpa_cli_calls.append(args)
+            return CompletedProcess(args, 0, stdout="OK\n", stderr="")
+        return original_run(args, **kwargs)
+
+    reply_dir = tmp_path / "run"
+    reply_dir.mkdir()
+
+    _login_admin(flask_client)
+    monkeypatch.setattr(app_module, "WPA_CTRL_DIR", str(ctrl_dir))
+    monkeypatch.setattr(app_module, "WPA_CTRL_REPLY_DIR", str(reply_dir))
+    monkeypatch.setattr(app_module.subprocess, "run", tracking_run)
+    try:
+        response = csrf_post(
+            flask_client,
+            "/wlan_connect",
+            data={"ssid": "My Wifi", "password": "secretpass"},
+            follow_redirects=False,
+            source_url="/change_password",
+        )
+    finally:
+        worker.join(timeout=5)
+        server.close()
+
+    assert response.status_code == 302
+    assert wpa_cli_calls == []
+    assert received == [
+        "ADD_NETWORK",
+        'SET_NETWORK 2 ssid "My Wifi"',
+        'SET_NETWORK 2 psk "secretpass"',
+        "ENABLE_NETWORK 2",
+        "SAVE_CONFIG",
+        "RECONFIGURE",
+    ]
+    assert all(addr.startswith(str(reply_dir)) for addr in reply_addresses)
+    assert list(reply_dir.iterdir()) == []
+
+
+def test_wlan_connect_falls_back_when_add_network_reply_is_lost(
+    client, monkeypatch, tmp_path
+):
+    import socket
+    import threading
+
+    flask_client, app_module = client
+    ctrl_dir = tmp_path / "wpa_ctrl"
+    ctrl_dir.mkdir()
+    reply_dir = tmp_path / "run"
+    reply_dir.mkdir()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    server.bind(str(ctrl_dir / "wlan0"))
+    server.settimeout(5)
+    received = []
+
+    def serve():
+        while True:
+            try:
+                data, addr = server.recvfrom(4096)
+            except OSError:
+                return
+            command = data.decode()
+            received.append(command)
+            if command == "ADD_NETWORK":
+                # Netz wird angelegt, die Antwort geht aber verloren.
+                continue
+            if command == "LIST_NETWORKS":
+                reply = (
+                    "network id / ssid / bssid / flags\n"
+                    "0\tHeimnetz\tany\t[CURRENT]\n"
+                    "4\t\tany\t[DISABLED]\n"
+                )
+            else:
+                reply = "OK\n"
+            server.sendto(reply.encode(), addr)
+            if command.startswith("REMOVE_NETWORK"):
+                return
+
+    worker = threading.Thread(target=serve, daemon=True)
+    worker.start()
+
+    wpa_cli_calls = []
+    original_run = app_module.subprocess.run
+
+    def tracking_run(args, **kwargs):
+        if "wpa_cli" in args:
+            wpa_cli_calls.append(args)
+            stdout = "7\n" if "add_network" in args else "OK\n"
+            return CompletedProcess(args, 0, stdout=stdout, stderr="")
+        return original_run(args, **kwargs)
+
+    _login_admin(flask_client)
+    monkeypatch.setattr(app_module, "WPA_CTRL_DIR", str(ctrl_dir))
+    monkeypatch.setattr(app_module, "WPA_CTRL_REPLY_DIR", str(reply_dir))
+    monkeypatch.setattr(app_module, "_WPA_CTRL_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(app_module.subprocess, "run", tracking_run)
+    try:
+        response = csrf_post(
+            flask_client,
+            "/wlan_connect",
+            data={"ssid": "My Wifi", "password": "secretpass"},
+            follow_redirects=False,
+            source_url="/change_password",
+        )
+    finally:
+        worker.join(timeout=5)
+        server.close()
+
+    assert response.status_code == 302
+    assert received == ["ADD_NETWORK", "LIST_NETWORKS", "REMOVE_NETWORK 4"]
+    assert any("add_network" in args for args in wpa_cli_calls)
+
+
+def test_wlan_connect_skips_late_add_network_reply(client, monkeypatch, tmp_path):
+    import socket
+    import threading
+    import time
+
+    flask_client, app_module = client
+    ctrl_dir = tmp_path / "wpa_ctrl"
+    ctrl_dir.mkdir()
+    reply_dir = tmp_path / "run"
+    reply_dir.mkdir()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    server.bind(str(ctrl_dir / "wlan0"))
+    server.settimeout(5)
+    received = []
+
+    def serve():
+        while True:
+            try:
+                data, addr = server.recvfrom(4096)
+            except OSError:
+                return
+            command = data.decode()
+            received.append(command)
+            if command == "ADD_NETWORK":
+                # Antwort trifft erst nach dem Timeout des Clients ein.
+                time.sleep(0.4)
+                reply = "4\n"
+            elif command == "LIST_NETWORKS":
+                reply = (
+                    "network id / ssid / bssid / flags\n"
+                    "0\tHeimnetz\tany\t[CURRENT]\n"
+                    "4\t\tany\t[DISABLED]\n"
+                )
+            else:
+                reply = "OK\n"
+            server.sendto(reply.encode(), addr)
+            if command.startswith("REMOVE_NETWORK"):
+                return
+
+    worker = threading.Thread(target=serve, daemon=True)
+    worker.start()
+
+    def fake_run(args, **kwargs):
+        stdout = "7\n" if "add_network" in args else "OK\n"
+        return CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+    _login_admin(flask_client)
+    monkeypatch.setattr(app_module, "WPA_CTRL_DIR", str(ctrl_dir))
+    monkeypatch.setattr(app_module, "WPA_CTRL_REPLY_DIR", str(reply_dir))
+    monkeypatch.setattr(app_module, "_WPA_CTRL_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(app_module.subprocess, "run", fake_run)
+    try:
+        response = csrf_post(
+            flask_client,
+            "/wlan_connect",
+            data={"ssid": "My Wifi", "password": "secretpass"},
+            follow_redirects=False,
+            source_url="/change_password",
+        )
+    finally:
+        worker.join(timeout=5)
+        server.close()
+
+    assert response.status_code == 302
+    assert received == ["ADD_NETWORK", "LIST_NETWORKS", "REMOVE_NETWORK 4"]
+
+
+def test_wpa_control_session_drain_discards_pending_replies(client):
+    import socket
+
+    _flask_client, app_module = client
+    session = app_module._WpaControlSession("wlan0")
+    local, remote = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    session._sock = local
+    try:
+        remote.send(b"4\n")
+        remote.send(b"FAIL\n")
+        session.drain()
+        remote.send(b"OK\n")
+        assert session.receive() == "OK"
+        assert local.gettimeout() == app_module._WPA_CTRL_TIMEOUT_SECONDS
+    finally:
+        local.close()
+        remote.close()